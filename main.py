@@ -6,8 +6,8 @@ adding or updating drivers on policies, and extracting policy information using
 Also supports vehicle add/replace operations.
 """
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import FileResponse
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, Response
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from selenium import webdriver
@@ -16,9 +16,10 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, JavascriptException
 from selenium.webdriver.common.keys import Keys
 import os
+import sys
 import time
 import re
 import asyncio
@@ -26,18 +27,26 @@ from pathlib import Path
 import json
 import threading
 import queue
+import logging
+import logging.handlers
 import shutil
-from typing import Dict, Optional
+from typing import Dict, Final, Mapping, Optional
+from functools import wraps
+from types import MappingProxyType
+from contextlib import contextmanager
+from collections import deque
 
-# Thread-safe OTP queue system for multi-threaded browser instances
+# OTP queue system for multi-threaded browser instances
 # OTPs are distributed in FIFO order: first OTP goes to first browser, second OTP to second browser, etc.
-otp_queue = queue.Queue()
-otp_queue_lock = threading.Lock()
+otp_deque = deque()
 
 # Thread registration system to ensure proper FIFO ordering
 # Threads register when they start waiting, and OTPs are distributed based on registration order
 otp_waiting_threads = []  # List of thread IDs waiting for OTP in order
-otp_waiting_lock = threading.Lock()
+
+# Guards otp_deque and otp_waiting_threads; notified whenever an OTP arrives or a waiter leaves,
+# so waiting threads wake up immediately instead of polling
+otp_condition = threading.Condition()
 
 # Thread counter for assigning unique thread IDs to each browser instance
 thread_counter = 0
@@ -56,14 +65,86 @@ browser_threads_lock = threading.Lock()
 debug_port_counter = 9222
 debug_port_lock = threading.Lock()
 
+# Idle Chrome drivers kept alive between requests, keyed by thread ID
+# Each thread ID owns its own Chrome profile, so an idle driver is only reused by the same thread ID
+idle_drivers: Dict[int, webdriver.Chrome] = {}
+idle_drivers_lock = threading.Lock()
+
+# Number of requests a pooled driver serves before it is closed and replaced (limits Chrome memory growth)
+DRIVER_MAX_USES = int(os.environ.get("DRIVER_MAX_USES", "10"))
+
+# Number of drivers to start ahead of time at application startup (0 = start on first request)
+DRIVER_POOL_SIZE = int(os.environ.get("DRIVER_POOL_SIZE", "0"))
+
+# Debug instrumentation (extra WebDriver round-trips purely for logging) - enable with DEBUG=1
+DEBUG = os.environ.get("DEBUG", "").lower() in ("1", "true", "yes")
+
+# Log page title and URL after each navigation step (one extra WebDriver round-trip each) - enable with DEBUG_NAV=1
+DEBUG_LOG_NAV = os.environ.get("DEBUG_NAV", "").lower() in ("1", "true", "yes")
+
+# Implicit wait applied to every driver (seconds). 0 makes every find_element miss fail fast;
+# lookups that need the page to render first wait with explicit WebDriverWaits, and the remaining
+# bare lookups are optional-element probes or children of an element that was already waited for
+IMPLICIT_WAIT_SECONDS = int(os.environ.get("IMPLICIT_WAIT_SECONDS", "0"))
+
+# Poll interval for post-navigation readiness checks (WebDriverWait default is 0.5s)
+READY_POLL_SECONDS = 0.1
+
+# Upper bound for waiting on a form selection to be committed (the fixed pause these waits replaced)
+SELECTION_SETTLE_SECONDS = 2
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that silently drops a record when the log queue is full
+    (the stock handler reports a logging error to stderr for every dropped record).
+    """
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+# Logger for automation progress and the OTP endpoints: records are queued by the calling thread and
+# written to stdout by a single listener thread, so neither browser threads nor the event loop block on
+# console writes. The queue is bounded; when it is full, records are dropped rather than blocking the caller
+log_queue = queue.Queue(maxsize=10000)
+log_stream_handler = logging.StreamHandler(sys.stdout)
+log_stream_handler.setFormatter(logging.Formatter("%(message)s"))
+log_listener = logging.handlers.QueueListener(log_queue, log_stream_handler)
+log_listener.start()
+
+logger = logging.getLogger("add_driver_rpa")
+logger.addHandler(DroppingQueueHandler(log_queue))
+logger.setLevel(logging.DEBUG if DEBUG else logging.INFO)
+logger.propagate = False
+
 # Legacy global OTP storage for backward compatibility (kept for safety)
-otp_storage = {"otp": None, "timestamp": None}
+otp_storage = {"otp": None, "timestamp": None, "expires_at": None}
+
+# How long a stored OTP stays valid
+OTP_TTL_SECONDS = 300
+
+# Last formatted response timestamp, reused until the second changes (see current_timestamp)
+timestamp_cache = {"sec": 0, "str": ""}
+
+# Separator line for the startup banner
+BANNER_SEPARATOR = "=" * 60
+
+# 6-digit verification code in an incoming SMS body
+OTP_RE = re.compile(r'(\d{6})')
+
+# Pre-encoded body of the generic 500 response - exception text stays in the logs
+INTERNAL_ERROR_BODY = json.dumps({"detail": "Internal server error"}).encode()
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Progressive Driver Add/Update Bot",
     description="Automates driver add/update and vehicle operations on Progressive ForAgentsOnly portal",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson serializes the small OTP/status dicts in C
 )
 
 # Add CORS middleware
@@ -91,14 +172,14 @@ async def log_requests(request: Request, call_next):
     
     # Log detailed request information (only for non-health-check requests)
     if should_log:
-        print("=" * 60)
-        print(f"🔵 Incoming request: {request.method} {request.url.path}")
-        print(f"   Client: {request.client.host if request.client else 'Unknown'}")
-        print(f"   Full URL: {request.url}")
+        logger.debug("=" * 60)
+        logger.info(f"🔵 Incoming request: {request.method} {request.url.path}")
+        logger.info(f"   Client: {request.client.host if request.client else 'Unknown'}")
+        logger.info(f"   Full URL: {request.url}")
         
         # Log query parameters if any
         if request.url.query:
-            print(f"   Query: {request.url.query}")
+            logger.info(f"   Query: {request.url.query}")
     
     response = await call_next(request)
     
@@ -116,12 +197,31 @@ async def log_requests(request: Request, call_next):
         else:
             status_emoji = "❌"
         
-        print(f"{status_emoji} Request completed: {request.method} {request.url.path} - Status: {response.status_code} - {process_time:.3f}s")
-        print("=" * 60)
+        logger.info(f"{status_emoji} Request completed: {request.method} {request.url.path} - Status: {response.status_code} - {process_time:.3f}s")
+        logger.debug("=" * 60)
     
     return response
 
 
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """
+    Turn any uncaught endpoint error into a 500 JSON response.
+    HTTPExceptions raised by endpoints are still handled by FastAPI's own handler.
+    Logs a one-line summary only: Starlette's ServerErrorMiddleware re-raises after this response is sent,
+    so uvicorn already logs the traceback once. The client only gets a fixed detail message.
+    
+    Args:
+        request: The request that failed
+        exc: The uncaught exception
+        
+    Returns:
+        Response: 500 response with a fixed, pre-encoded error detail
+    """
+    logger.error("❌ Unhandled error on %s %s: %s: %s", request.method, request.url.path, type(exc).__name__, exc)
+    return Response(content=INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
+
+
 @app.on_event("startup")
 async def startup_event():
     """
@@ -130,16 +230,30 @@ async def startup_event():
     port = os.environ.get('PORT', 'Not set (using default)')
     environment = os.environ.get('RAILWAY_ENVIRONMENT', 'local')
     
-    print("=" * 60)
-    print("🚀 FastAPI Application Ready")
-    print("=" * 60)
-    print(f"🔌 Port: {port}")
-    print(f"🌍 Environment: {environment}")
-    print(f"📡 API Endpoints:")
-    print(f"   • POST /start - Start driver add/update or vehicle automation")
-    print(f"   • POST /otp - Submit OTP code")
-    print(f"   • GET /otp/status - Check if OTP is needed")
-    print("=" * 60)
+    logger.debug("=" * 60)
+    logger.info("🚀 FastAPI Application Ready")
+    logger.debug("=" * 60)
+    logger.info(f"🔌 Port: {port}")
+    logger.info(f"🌍 Environment: {environment}")
+    logger.info(f"📡 API Endpoints:")
+    logger.info(f"   • POST /start - Start driver add/update or vehicle automation")
+    logger.info(f"   • POST /otp - Submit OTP code")
+    logger.info(f"   • GET /otp/status - Check if OTP is needed")
+    logger.debug("=" * 60)
+    
+    # Start pooled browsers in the background so startup is not blocked by Chrome launches
+    if DRIVER_POOL_SIZE > 0:
+        logger.info(f"♻️ Pre-warming {DRIVER_POOL_SIZE} browser(s) in the background...")
+        asyncio.get_event_loop().run_in_executor(None, prewarm_driver_pool, DRIVER_POOL_SIZE)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Shutdown event handler - closes pooled browsers so no Chrome processes are left behind.
+    """
+    await asyncio.to_thread(close_idle_drivers)
+    log_listener.stop()
 
 
 class PolicyRequest(BaseModel):
@@ -211,6 +325,328 @@ class PolicyRequest(BaseModel):
     bodily_injury_property_damage: str = Field(default="", description="Bodily injury and property damage liability: Split limits like '$100,000 each person/$300,000 each accident/$100,000 each accident' or combined single limits like '$300,000 combined single limit' (required for vehicle actions)")
 
 
+class OtpResponse(BaseModel):
+    """
+    Response model for the /otp endpoint.
+    
+    Attributes:
+        success: Always True when the OTP was parsed
+        message: Human-readable outcome
+        otp: The OTP code that was received
+        timestamp: Time the OTP was received (format: %Y-%m-%d %H:%M:%S)
+        ignored: True when no session was active to receive the OTP (omitted otherwise)
+        reason: Why the OTP was ignored (omitted otherwise)
+    """
+    model_config = {"extra": "forbid"}
+    
+    success: bool = Field(default=True, description="Always True when the OTP was parsed")
+    message: str = Field(..., description="Human-readable outcome")
+    otp: str = Field(..., description="The OTP code that was received")
+    timestamp: str = Field(..., description="Time the OTP was received (format: %Y-%m-%d %H:%M:%S)")
+    ignored: Optional[bool] = Field(default=None, description="True when no session was active to receive the OTP")
+    reason: Optional[str] = Field(default=None, description="Why the OTP was ignored")
+
+
+# Map yes/no answers (yes/Yes/Y or no/No/N) to radio button values and display text
+YES_NO_MAP = {
+    "YES": ("Y", "Yes"),
+    "Y": ("Y", "Yes"),
+    "NO": ("N", "No"),
+    "N": ("N", "No")
+}
+
+# Map vehicle use text to dropdown values
+VEHICLE_USE_MAP = {
+    "COMMUTE": "4",
+    "PLEASURE/PERSONAL": "1",
+    "PLEASURE": "1",
+    "PERSONAL": "1",
+    "BUSINESS": "2",
+    "FARM": "3"
+}
+
+# Map vehicle ownership text to dropdown values
+OWNERSHIP_MAP = {
+    "LEASE": "1",
+    "OWN AND MAKE PAYMENTS": "2",
+    "OWN": "2",  # Shorthand for "Own and make payments"
+    "OWN AND DO NOT MAKE PAYMENTS": "3",
+    "OWN NO PAYMENTS": "3"  # Shorthand
+}
+
+WHITESPACE_RE = re.compile(r"\s+")
+SLASH_SPACING_RE = re.compile(r" ?/ ?")
+
+
+def normalize_option_key(value: str) -> str:
+    """
+    Normalize a coverage option for map lookups: uppercase, drop commas and collapse whitespace.
+    
+    Args:
+        value: Coverage option text (e.g., '$1,000 deductible')
+    
+    Returns:
+        str: Normalized key (e.g., '$1000 DEDUCTIBLE')
+    """
+    value = WHITESPACE_RE.sub(" ", value.upper().replace(",", "")).strip()
+    return SLASH_SPACING_RE.sub("/", value)
+
+
+def option_map(entries: Dict[str, str]) -> Mapping[str, str]:
+    """
+    Build a read-only coverage map with normalized keys.
+    
+    Args:
+        entries: Coverage option text mapped to dropdown values
+    
+    Returns:
+        Mapping[str, str]: Read-only map keyed by normalize_option_key()
+    """
+    return MappingProxyType({normalize_option_key(key): value for key, value in entries.items()})
+
+
+# Coverage maps are read-only and keyed by normalize_option_key(), so '$1,000' and '$1000' both match one entry
+
+# Map comprehensive deductible text to dropdown values
+COMP_DEDUCTIBLE_MAP: Final[Mapping[str, str]] = option_map({
+    "NO COVERAGE": "210100",
+    "$100 DEDUCTIBLE": "210104",
+    "$250 DEDUCTIBLE": "210106",
+    "$500 DEDUCTIBLE": "210108",
+    "$750 DEDUCTIBLE": "210109",
+    "$1000 DEDUCTIBLE": "210110",
+    "$1500 DEDUCTIBLE": "210130",
+    "$2000 DEDUCTIBLE": "210144",
+    "$100 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210121",
+    "$250 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210123",
+    "$500 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210124",
+    "$750 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210127",
+    "$1000 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210125",
+    "$1500 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210188",
+    "$2000 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210178"
+})
+
+# Map medical payment coverage text to dropdown values
+MEDPAY_MAP: Final[Mapping[str, str]] = option_map({
+    "NO COVERAGE": "280100",
+    "$500 EACH PERSON": "280191",
+    "$1000 EACH PERSON": "280192",
+    "$2000 EACH PERSON": "280193",
+    "$5000 EACH PERSON": "280194",
+    "$10000 EACH PERSON": "280195"
+})
+
+# Map collision deductible text to dropdown values
+COLLISION_MAP: Final[Mapping[str, str]] = option_map({
+    "NO COVERAGE": "210300",
+    "$100 DEDUCTIBLE": "210303",
+    "$250 DEDUCTIBLE": "210304",
+    "$500 DEDUCTIBLE": "210307",
+    "$750 DEDUCTIBLE": "210310",
+    "$1000 DEDUCTIBLE": "210308",
+    "$1500 DEDUCTIBLE": "210323",
+    "$2000 DEDUCTIBLE": "210324"
+})
+
+# Map bodily injury and property damage text to dropdown values
+BIPD_MAP: Final[Mapping[str, str]] = option_map({
+    "$15000 EACH PERSON/$30000 EACH ACCIDENT/$25000 EACH ACCIDENT": "191003-200103",
+    "$15000 EACH PERSON/$30000 EACH ACCIDENT/$50000 EACH ACCIDENT": "191003-200105",
+    "$25000 EACH PERSON/$50000 EACH ACCIDENT/$25000 EACH ACCIDENT": "191005-200103",
+    "$25000 EACH PERSON/$50000 EACH ACCIDENT/$50000 EACH ACCIDENT": "191005-200105",
+    "$50000 EACH PERSON/$100000 EACH ACCIDENT/$25000 EACH ACCIDENT": "191006-200103",
+    "$50000 EACH PERSON/$100000 EACH ACCIDENT/$50000 EACH ACCIDENT": "191006-200105",
+    "$100000 EACH PERSON/$300000 EACH ACCIDENT/$50000 EACH ACCIDENT": "191008-200105",
+    "$100000 EACH PERSON/$300000 EACH ACCIDENT/$100000 EACH ACCIDENT": "191008-200106",
+    "$250000 EACH PERSON/$500000 EACH ACCIDENT/$100000 EACH ACCIDENT": "191015-200106",
+    "$100000 COMBINED SINGLE LIMIT": "191052-200152",
+    "$300000 COMBINED SINGLE LIMIT": "191053-200153",
+    "$500000 COMBINED SINGLE LIMIT": "191054-200154"
+})
+
+
+# Locators reused across steps and retries
+CONTINUE_BUTTON_LOCATOR = (By.CSS_SELECTOR, "button[data-pgr-id='btnContinue']")
+OTP_INPUT_LOCATOR = (By.ID, "reauth-sms-otp-input")
+VEHICLE_YEAR_DROPDOWN_LOCATOR = (By.CSS_SELECTOR, "select[data-pgr-id='ddlVehicleModelYearTemp']")
+VEHICLE_USE_DROPDOWN_LOCATOR = (By.CSS_SELECTOR, "select[data-pgr-id='ddlVehicleUse']")
+OWNERSHIP_DROPDOWN_LOCATOR = (By.CSS_SELECTOR, "select[data-pgr-id='ddlVehicleFinancialOwnership']")
+REVIEW_MESSAGE_LOCATOR = (By.CSS_SELECTOR, "#transaction-messaging ps-markdown")
+NEW_PREMIUM_LOCATOR = (By.CSS_SELECTOR, "li[data-pgr-id='txtNewPremium'] span.review-item-embed")
+START_DATE_LOCATOR = (By.CSS_SELECTOR, "li[data-pgr-id='txtStartsOn'] span")
+PREMIUM_DESCRIPTION_LOCATOR = (By.CSS_SELECTOR, "pui-p[data-pgr-id='msgInternalMessage0'] p")
+PAYMENT_SCHEDULE_TABLE_SELECTOR = "table[data-pgr-id='tblPaymentSchedule']"
+PAYMENT_SCHEDULE_TABLE_LOCATOR = (By.CSS_SELECTOR, PAYMENT_SCHEDULE_TABLE_SELECTOR)
+MODAL_BODY_SELECTOR = "pui-modal-body"
+MODAL_BODY_LOCATOR = (By.CSS_SELECTOR, MODAL_BODY_SELECTOR)
+CLOSE_MODAL_BUTTON_SELECTOR = "button[aria-label='Close Modal']"
+INSTALLMENT_FEE_NOTE_LOCATOR = (By.CSS_SELECTOR, "pui-p[data-pgr-id='ttlServiceChargeDescription'] p")
+SAVE_FOR_LATER_OPTION_LOCATOR = (By.CSS_SELECTOR, "ps-markdown[data-pgr-id='lblSavethisupdateforlater']")
+
+# Reads every field of the STEP 39 review page in one call (null for any field that is missing)
+REVIEW_FIELDS_SCRIPT = """
+function text(selector) {
+    var el = document.querySelector(selector);
+    return el ? el.innerText.trim() : null;
+}
+var r = {
+    replace_vehicle: text('#transaction-messaging ps-markdown'),
+    new_premium: text("li[data-pgr-id='txtNewPremium'] span.review-item-embed"),
+    start_date: text("li[data-pgr-id='txtStartsOn'] span"),
+    description: text("pui-p[data-pgr-id='msgInternalMessage0'] p"),
+    premium_increase: null
+};
+var h4s = document.querySelectorAll('h4.f5-e.fwi.ma0');
+for (var i = 0; i < h4s.length; i++) {
+    if (h4s[i].innerText.indexOf('Total premium increase:') !== -1) {
+        r.premium_increase = h4s[i].innerText.replace('Total premium increase:', '').trim();
+        break;
+    }
+}
+return r;
+"""
+
+# Reads the effect-on-rate vehicle summary rows and the Total Policy Rate row in one call.
+# Each label's rates come from the first row of the closest ng-star-inserted div that holds a table.
+RATE_SUMMARY_SCRIPT = """
+function firstRow(label) {
+    for (var d = label.parentElement; d; d = d.parentElement) {
+        if (d.tagName === 'DIV' && d.classList.contains('ng-star-inserted')) {
+            var row = d.querySelector('table tbody tr');
+            if (row) {
+                var tds = row.querySelectorAll('td');
+                return tds.length >= 2 ? {current: tds[0].innerText.trim(), new: tds[1].innerText.trim()} : null;
+            }
+        }
+    }
+    return null;
+}
+var vehicles = [];
+document.querySelectorAll('pui-h3').forEach(function(h) {
+    if (h.innerText.trim().indexOf('Vehicle') !== 0) return;
+    for (var d = h.nextElementSibling; d; d = d.nextElementSibling) {
+        if (d.tagName !== 'DIV') continue;
+        d.querySelectorAll("pui-p[fw='7']").forEach(function(p) {
+            var rates = firstRow(p);
+            if (rates) vehicles.push({name: p.innerText.trim(), current: rates.current, new: rates.new});
+        });
+    }
+});
+var total = null;
+var labels = document.querySelectorAll('pui-p');
+for (var i = 0; i < labels.length; i++) {
+    if (labels[i].innerText.indexOf('Total Policy Rate') !== -1) {
+        total = firstRow(labels[i]);
+        break;
+    }
+}
+return {vehicles: vehicles, total: total};
+"""
+
+# Groups each effect-on-rate vehicle header with the coverage divs that follow it, up to the next header
+VEHICLE_BREAKDOWN_SCRIPT = """
+var vehicles = [];
+document.querySelectorAll('pui-hr ~ pui-h4.pgr-dark-blue.ng-star-inserted').forEach(function(header) {
+    var coverages = [];
+    for (var el = header.nextElementSibling; el && el.tagName !== 'PUI-H4'; el = el.nextElementSibling) {
+        if (el.tagName !== 'DIV') continue;
+        var name = el.querySelector("pui-p[fw='7'] p span");
+        var table = el.querySelector('table');
+        if (!name || !table) continue;
+        coverages.push({
+            coverage_name: name.innerText.trim(),
+            rows: Array.from(table.querySelectorAll('tbody tr')).map(function(tr) {
+                return Array.from(tr.querySelectorAll('td')).map(function(td) { return td.innerText.trim(); });
+            })
+        });
+    }
+    vehicles.push({vehicle_name: header.innerText.trim(), coverages: coverages});
+});
+return vehicles;
+"""
+
+# Both effect-on-rate scrapes above in a single round-trip
+EFFECT_ON_RATE_SCRIPT = (
+    "return {summary: (function() {" + RATE_SUMMARY_SCRIPT + "})(), "
+    "vehicles: (function() {" + VEHICLE_BREAKDOWN_SCRIPT + "})()};"
+)
+
+# Text of the review page links that open the payment schedule and effect on rate modals (neither has a data-pgr-id)
+VIEW_PAYMENTS_LINK_TEXT = "View upcoming payments"
+EFFECT_ON_RATE_LINK_TEXT = "effect on rate for the entire policy period"
+
+# Label of the STEP 31 driver acknowledgment radio (the radio has no data-pgr-id)
+DRIVER_ACK_LABEL_TEXT = "I've included everybody that must be listed on this policy."
+
+# data-pgr-ids of the coverage dropdowns set in STEPs 33-37 (all rendered on the same page), with display names
+COVERAGE_DROPDOWN_PGR_IDS = {
+    "ddlCOMPLineCoverageLimit": "Comprehensive deductible",
+    "ddlMEDPAYLineCoverageLimit": "Medical payment coverage",
+    "ddlCOLLLineCoverageLimit": "Collision deductible",
+    "ddlBIPDLineCoverageLimit": "Bodily injury and property damage liability",
+    "ddlUMUIMLineCoverageLimit": "Uninsured/underinsured motorist coverage"
+}
+
+# Combined selector matching all coverage dropdowns at once (used to wait for the coverage page in one poll)
+COVERAGE_DROPDOWNS_SELECTOR = ", ".join(f"select[data-pgr-id='{pgr_id}']" for pgr_id in COVERAGE_DROPDOWN_PGR_IDS)
+
+
+def validate_request(request: PolicyRequest):
+    """
+    Validate the request payload before any browser work starts.
+    Runs every lookup the automation performs mid-flow so guaranteed-400 requests fail fast.
+    
+    Args:
+        request: PolicyRequest containing all the request data
+    
+    Raises:
+        HTTPException: 400 if action_type is invalid, or listing every invalid vehicle field
+    """
+    action_type_lower = request.action_type.lower()
+    if not ("add" in action_type_lower or "replace" in action_type_lower or
+            ("update" in action_type_lower and "driver" in action_type_lower)):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid action_type: '{request.action_type}'. Must be 'add driver', 'add vehical', or 'replace vehical'"
+        )
+    
+    # Driver actions do not use the vehicle fields
+    if "driver" in action_type_lower:
+        return
+    
+    # Collect every invalid field so the client can fix them all in one round
+    errors = []
+    
+    for field_name in ["vehical_is_suv_van_pickup", "vehical_is_kitcar_buggy_classic", "vehicle_use_ridesharing"]:
+        value = getattr(request, field_name)
+        if value.upper().strip() not in YES_NO_MAP:
+            errors.append(f"Invalid value for {field_name}: {value}. Must be 'yes' or 'no'")
+    
+    if request.vehicle_use.upper().strip() not in VEHICLE_USE_MAP:
+        errors.append(f"Invalid vehicle_use: {request.vehicle_use}. Must be one of: Commute, Pleasure/Personal, Business, Farm")
+    
+    if request.vehicle_ownership.upper().strip() not in OWNERSHIP_MAP:
+        errors.append(f"Invalid vehicle_ownership: {request.vehicle_ownership}. Must be one of: Lease, Own and make payments, Own and do not make payments")
+    
+    if normalize_option_key(request.comprehensive_deductible) not in COMP_DEDUCTIBLE_MAP:
+        errors.append(f"Invalid comprehensive_deductible: {request.comprehensive_deductible}. Must be one of the valid deductible options")
+    
+    if normalize_option_key(request.medical_payment_coverage) not in MEDPAY_MAP:
+        errors.append(f"Invalid medical_payment_coverage: {request.medical_payment_coverage}. Must be one of: No Coverage, $500 each person, $1,000 each person, $2,000 each person, $5,000 each person, $10,000 each person")
+    
+    if normalize_option_key(request.collision_deductible) not in COLLISION_MAP:
+        errors.append(f"Invalid collision_deductible: {request.collision_deductible}. Must be one of: No Coverage, $100 deductible, $250 deductible, $500 deductible, $750 deductible, $1,000 deductible, $1,500 deductible, $2,000 deductible")
+    
+    if normalize_option_key(request.bodily_injury_property_damage) not in BIPD_MAP:
+        errors.append(f"Invalid bodily_injury_property_damage: {request.bodily_injury_property_damage}. Must be a valid coverage option (e.g., '$100,000 each person/$300,000 each accident/$100,000 each accident' or '$300,000 combined single limit')")
+    
+    if errors:
+        raise HTTPException(
+            status_code=400,
+            detail="; ".join(errors)
+        )
+
+
 def get_next_debug_port() -> int:
     """
     Get the next available remote debugging port for a browser instance.
@@ -287,8 +723,13 @@ def setup_chrome_driver(debug_port: Optional[int] = None, thread_id: Optional[in
     chrome_options.add_argument("--disable-backgrounding-occluded-windows")
     chrome_options.add_argument("--disable-renderer-backgrounding")
     
+    # Lighter page loads between steps: skip image downloads and background network requests
+    # (stylesheets stay enabled - visibility/clickability waits depend on layout)
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-background-networking")
+    
     # Add logging for debugging
-    print(f"🔧 Initializing Chrome WebDriver in headless mode (debug port: {debug_port})...")
+    logger.info(f"🔧 Initializing Chrome WebDriver in headless mode (debug port: {debug_port})...")
     
     # Set up persistent Chrome profile based on thread_id
     # Each thread maintains its own session independently
@@ -308,16 +749,16 @@ def setup_chrome_driver(debug_port: Optional[int] = None, thread_id: Optional[in
     # Check if this thread already has a saved session
     default_profile = os.path.join(profile_dir, "Default")
     if os.path.exists(default_profile) and os.listdir(default_profile):
-        print(f"📂 Loading existing session for Thread-{thread_id}")
+        logger.info(f"📂 Loading existing session for Thread-{thread_id}")
     else:
-        print(f"🆕 Creating new session for Thread-{thread_id}")
+        logger.info(f"🆕 Creating new session for Thread-{thread_id}")
     
     # Configure Chrome to use the persistent profile
     chrome_options.add_argument(f"--user-data-dir={profile_dir}")
     # Use a specific profile name to avoid conflicts
     chrome_options.add_argument("--profile-directory=Default")
     
-    print(f"📁 Using persistent Chrome profile: {profile_dir}")
+    logger.info(f"📁 Using persistent Chrome profile: {profile_dir}")
     
     # Set download directory
     download_dir = os.path.join(os.getcwd(), "downloads")
@@ -328,16 +769,16 @@ def setup_chrome_driver(debug_port: Optional[int] = None, thread_id: Optional[in
         "download.default_directory": download_dir,
         "download.prompt_for_download": False,
         "download.directory_upgrade": True,
-        "plugins.always_open_pdf_externally": True
+        "plugins.always_open_pdf_externally": True,
+        "profile.managed_default_content_settings.images": 2  # Block images
     }
     chrome_options.add_experimental_option("prefs", prefs)
     
     # Initialize driver (this is the blocking operation - runs in thread pool)
-    # Using a shorter implicit wait to speed up initialization
     driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(5)  # Reduced from 10 to 5 for faster startup
+    driver.implicitly_wait(IMPLICIT_WAIT_SECONDS)
     
-    print(f"✅ Chrome WebDriver initialized successfully (debug port: {debug_port})")
+    logger.info(f"✅ Chrome WebDriver initialized successfully (debug port: {debug_port})")
     
     # Store profile info in driver for later session saving
     driver._profile_info = {
@@ -348,290 +789,790 @@ def setup_chrome_driver(debug_port: Optional[int] = None, thread_id: Optional[in
     return driver
 
 
-
-
-
-def wait_for_session_save(driver):
+@contextmanager
+def no_implicit_wait(driver):
     """
-    Wait for Chrome to finish saving session data to the profile directory.
-    Chrome automatically saves session data when the browser closes.
-    Each thread maintains its own session in its own profile directory.
+    Temporarily disable the driver's implicit wait around explicit WebDriverWait calls.
+    
+    With an implicit wait set, every missed poll inside WebDriverWait blocks for the full
+    implicit timeout, so short probes take far longer than their own timeout.
     
     Args:
-        driver: Chrome WebDriver instance with _profile_info attribute
+        driver: Chrome WebDriver instance
+    
+    Note:
+        - A no-op (no extra WebDriver commands) when IMPLICIT_WAIT_SECONDS is 0
     """
+    if not IMPLICIT_WAIT_SECONDS:
+        yield
+        return
+    
+    driver.implicitly_wait(0)
     try:
-        if not hasattr(driver, '_profile_info'):
-            return
-        
-        profile_info = driver._profile_info
-        thread_id = profile_info.get("thread_id")
-        
-        if thread_id is not None:
-            print(f"💾 Waiting for Chrome to save session data for Thread-{thread_id}...")
-        
-        # Wait for Chrome to finish writing session data to profile directory
-        # Chrome automatically saves cookies, localStorage, etc. when browser closes
-        time.sleep(2)
-        
-        if thread_id is not None:
-            print(f"✅ Session data saved for Thread-{thread_id}")
-        
-    except Exception as e:
-        print(f"⚠️ Error waiting for session save: {str(e)}")
+        yield
+    finally:
+        driver.implicitly_wait(IMPLICIT_WAIT_SECONDS)
 
 
-def get_next_thread_id() -> int:
+def retry_stale(max_attempts: int = 3, base_delay: float = 0.1):
     """
-    Get the next unique thread ID for a browser instance.
-    Reuses any available thread ID when threads finish (supports N concurrent threads).
-    This ensures OTP matching works correctly by reusing thread IDs efficiently.
+    Decorator that retries a step when the page re-renders an element mid-interaction.
+    Sleeps base_delay * 2**attempt between attempts and re-raises after max_attempts.
+    
+    Args:
+        max_attempts: Total number of attempts before giving up
+        base_delay: Delay in seconds before the first retry (doubled on each further retry)
     
     Returns:
-        int: Unique thread ID for the browser instance (reused if available, otherwise new)
+        Callable: Decorator wrapping the step function
     """
-    global thread_counter
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except StaleElementReferenceException:
+                    if attempt + 1 >= max_attempts:
+                        logger.info(f"Max retries reached for {func.__name__}")
+                        raise
+                    logger.info(f"Stale element reference (attempt {attempt + 1}/{max_attempts}). Retrying...")
+                    time.sleep(base_delay * 2 ** attempt)
+        return wrapper
+    return decorator
+
+
+def wait_until_ready(driver, next_locator, timeout: int = 15, raise_on_timeout: bool = False):
+    """
+    Wait for the page to finish loading and for the next step's element to appear.
+    Replaces fixed sleeps after navigation clicks, which are too long on fast loads and too short on slow ones.
     
-    # First, try to reuse an available thread ID (any ID that was previously used)
-    with available_thread_ids_lock:
-        if available_thread_ids:
-            # Reuse the lowest available thread ID
-            thread_id = min(available_thread_ids)
-            available_thread_ids.remove(thread_id)
-        else:
-            # No available IDs, create a new one by incrementing counter
-            with thread_counter_lock:
-                thread_counter += 1
-                thread_id = thread_counter
+    Args:
+        driver: Chrome WebDriver instance
+        next_locator: (By, selector) tuple of an element the next step needs, or a
+            callable(driver) returning that element (or a falsy value while it is missing)
+        timeout: Maximum seconds to wait
+        raise_on_timeout: Re-raise the TimeoutException instead of only logging it
     
-    # Register this thread in the browser_threads mapping
-    with browser_threads_lock:
-        browser_threads[thread_id] = {
-            "created_at": time.time(),
-            "status": "initializing"
-        }
+    Raises:
+        TimeoutException: If raise_on_timeout is set and the page is not ready in time
     
-    return thread_id
+    Note:
+        - The portal is a single-page app, so readyState alone can be 'complete' before the next view renders;
+          the element wait covers that case
+        - By default a timeout is only logged and the next step's own wait reports the missing element;
+          navigations whose failure would otherwise surface as silent "Not found" scrapes pass raise_on_timeout
+        - Stale element references while polling are ignored (the callable is retried on the next poll)
+        - Polls every READY_POLL_SECONDS so the flow resumes within ~100ms of the page being ready
+    """
+    if callable(next_locator):
+        next_element_ready = next_locator
+    else:
+        next_element_ready = lambda d: d.find_elements(*next_locator)
+    
+    try:
+        # Single poll: page loaded and next element present
+        with no_implicit_wait(driver):
+            WebDriverWait(
+                driver, timeout, poll_frequency=READY_POLL_SECONDS,
+                ignored_exceptions=[StaleElementReferenceException]
+            ).until(
+                lambda d: d.execute_script("return document.readyState") == "complete" and next_element_ready(d)
+            )
+    except TimeoutException:
+        waiting_for = getattr(next_locator, "__name__", None) if callable(next_locator) else next_locator[1]
+        logger.warning(f"⚠️ Next page not ready after {timeout}s (waiting for {waiting_for})")
+        if raise_on_timeout:
+            raise TimeoutException(f"Next page not ready after {timeout}s (waiting for {waiting_for})")
 
 
-def release_thread_id(thread_id: int):
+def find_radio_by_label_text(driver, label_text: str):
     """
-    Release a thread ID back to the available pool when a thread finishes.
-    This allows any thread ID to be reused for new requests (supports N concurrent threads).
+    Find the radio input whose ps-markdown label contains the given text, in a single script call.
+    Used for radios that have no data-pgr-id of their own; much cheaper than an XPath text() search.
     
     Args:
-        thread_id: The thread ID to release
+        driver: Chrome WebDriver instance
+        label_text: Text contained in the radio's ps-markdown label
+    
+    Returns:
+        WebElement or None: The radio input, or None if it is not on the page yet
     """
-    # Release any thread ID back to the available pool for reuse
-    with available_thread_ids_lock:
-        available_thread_ids.add(thread_id)
+    return driver.execute_script("""
+        var labelText = arguments[0];
+        var markdown = Array.from(document.querySelectorAll('ps-markdown')).find(function(e) {
+            return e.textContent.includes(labelText);
+        });
+        var parent = markdown && markdown.closest('label');
+        return parent ? parent.querySelector(":scope > input[type='radio']") : null;
+    """, label_text)
+
+
+def find_element_by_text(driver, selector: str, text: str):
+    """
+    Find the first visible element matching a CSS selector whose text contains the given text, in a single script call.
+    Only the selector's candidates are read, unlike an XPath contains(text(), ...) scan over the whole page.
     
-    # Remove from browser_threads mapping
-    with browser_threads_lock:
-        if thread_id in browser_threads:
-            del browser_threads[thread_id]
+    Args:
+        driver: Chrome WebDriver instance
+        selector: CSS selector of the candidate elements (e.g. "span")
+        text: Text the element must contain
     
-    # Remove from OTP waiting threads if still there
-    with otp_waiting_lock:
-        if thread_id in otp_waiting_threads:
-            otp_waiting_threads.remove(thread_id)
+    Returns:
+        WebElement or None: The element, or None if it is not on the page (or not visible) yet
+    """
+    return driver.execute_script("""
+        var text = arguments[1];
+        return Array.from(document.querySelectorAll(arguments[0])).find(function(e) {
+            return e.offsetParent !== null && e.innerText.includes(text);
+        }) || null;
+    """, selector, text)
 
 
-def log_thread(thread_id: int, message: str):
+def set_select_value(driver, select_element, value) -> str:
     """
-    Log a message with thread ID prefix for easy tracking.
+    Set a <select> value with JavaScript and trigger change/input/blur events.
     
     Args:
-        thread_id: The thread ID of the browser instance
-        message: The log message to print
+        driver: Chrome WebDriver instance
+        select_element: WebElement of the <select> dropdown
+        value: Option value to select
+    
+    Returns:
+        str: The dropdown's value after setting it (read back in the same script call)
     """
-    print(f"[Thread-{thread_id}] {message}")
+    return driver.execute_script("""
+        var select = arguments[0];
+        select.value = arguments[1];
+        select.dispatchEvent(new Event('change', { bubbles: true }));
+        select.dispatchEvent(new Event('input', { bubbles: true }));
+        select.dispatchEvent(new Event('blur', { bubbles: true }));
+        return select.value;
+    """, select_element, value)
 
 
-async def wait_for_otp_from_api(timeout=120, thread_id: Optional[int] = None):
+def set_dropdown_by_pgr_id(driver, pgr_id: str, value) -> Optional[str]:
     """
-    Wait for OTP to be sent via API endpoint (async version).
-    Uses queue-based system for multi-browser support with proper FIFO ordering.
+    Locate a <select> by its data-pgr-id, scroll it into view, focus it, set its value and
+    trigger change/input/blur events - all in a single script call.
     
     Args:
-        timeout: Maximum time to wait for OTP in seconds (default: 120)
-        thread_id: Thread ID of the browser instance waiting for OTP.
-                   If provided, uses queue-based FIFO distribution.
-                   If None, falls back to legacy global storage.
+        driver: Chrome WebDriver instance
+        pgr_id: data-pgr-id attribute of the <select> dropdown
+        value: Option value to select
     
     Returns:
-        str or None: The OTP code if received, None if timeout
-        
-    Note:
-        - In multi-browser mode (thread_id provided), waits for OTP from queue (FIFO)
-        - Uses blocking queue.get() with timeout to ensure proper FIFO ordering
-        - In single-request mode (thread_id is None), uses legacy global otp_storage
-        - This is async to avoid blocking the server while waiting for OTP
+        Optional[str]: The dropdown's value after setting it, or None if the dropdown is not on the page
     """
-    if thread_id is not None:
-        # Multi-browser mode: use queue-based FIFO distribution
-        # Register this thread as waiting for OTP (ensures FIFO order)
-        with otp_waiting_lock:
-            if thread_id not in otp_waiting_threads:
-                otp_waiting_threads.append(thread_id)
-                wait_position = len(otp_waiting_threads)
-            else:
-                wait_position = otp_waiting_threads.index(thread_id) + 1
-        
-        # Update thread status to indicate waiting for OTP
-        with browser_threads_lock:
-            if thread_id in browser_threads:
-                browser_threads[thread_id]["status"] = "waiting_for_otp"
-        
-        log_thread(thread_id, f"⏳ Waiting for OTP from queue (timeout: {timeout}s, position: {wait_position})...")
-        
-        # Calculate remaining time for each blocking call
-        start_time = time.time()
-        remaining_timeout = timeout
-        
-        # Helper function for blocking queue.get() to ensure proper FIFO ordering
-        def get_otp_blocking(timeout_sec: float):
-            """Blocking queue.get() - ensures threads wait in FIFO order"""
-            return otp_queue.get(timeout=timeout_sec)
-        
-        while remaining_timeout > 0:
-            try:
-                # Check if there's an OTP available AND this thread is next in line (FIFO order)
-                with otp_waiting_lock:
-                    has_otp = otp_queue.qsize() > 0
-                    is_my_turn = len(otp_waiting_threads) > 0 and otp_waiting_threads[0] == thread_id
-                
-                if has_otp and is_my_turn:
-                    # This thread is next AND there's an OTP available
-                    # Use blocking queue.get() with timeout
-                    block_timeout = min(0.3, remaining_timeout)
-                    otp_code = await asyncio.to_thread(get_otp_blocking, block_timeout)
-                    
-                    # IMMEDIATELY remove this thread from waiting list
-                    with otp_waiting_lock:
-                        if thread_id in otp_waiting_threads:
-                            otp_waiting_threads.remove(thread_id)
-                    
-                    log_thread(thread_id, f"✅ OTP received from queue: {otp_code}")
-                    return otp_code
-                else:
-                    # Either no OTP available OR not this thread's turn yet
-                    # Wait a bit and check again
-                    await asyncio.sleep(0.1)
-                    remaining_timeout = timeout - (time.time() - start_time)
-                    if remaining_timeout <= 0:
-                        break
-                    continue
-                    
-            except queue.Empty:
-                # Timeout on this iteration, check if we should continue
-                remaining_timeout = timeout - (time.time() - start_time)
-                if remaining_timeout <= 0:
-                    break
-                # Continue waiting immediately - queue.get() already waited
-                continue
-            except Exception as e:
-                log_thread(thread_id, f"⚠️ Error waiting for OTP: {str(e)}")
-                # On error, check remaining time and continue
-                remaining_timeout = timeout - (time.time() - start_time)
-                if remaining_timeout <= 0:
-                    break
-                await asyncio.sleep(0.05)  # Very small delay before retry
-                continue
-        
-        # Remove thread from waiting list on timeout
-        with otp_waiting_lock:
-            if thread_id in otp_waiting_threads:
-                otp_waiting_threads.remove(thread_id)
-        
-        log_thread(thread_id, "❌ OTP timeout - no OTP received from queue within timeout period")
-        return None
-    else:
-        # Legacy single-request mode: use global storage
-        print(f"⏳ Waiting for OTP via API endpoint (timeout: {timeout}s)...")
-        
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if otp_storage["otp"] is not None:
-                # Check if OTP is not too old (within 5 minutes)
-                if time.time() - otp_storage["timestamp"] < 300:  # 5 minutes
-                    otp_code = otp_storage["otp"]
-                    otp_storage["otp"] = None  # Clear after use
-                    print(f"✅ OTP received: {otp_code}")
-                    return otp_code
-                else:
-                    print("⚠️ OTP expired, clearing...")
-                    otp_storage["otp"] = None
-            
-            # Use asyncio.sleep instead of time.sleep to not block the event loop
-            await asyncio.sleep(1)
-        
-        print("❌ OTP timeout - no OTP received within timeout period")
-        return None
+    return driver.execute_script("""
+        var select = document.querySelector("select[data-pgr-id='" + arguments[0] + "']");
+        if (!select) {
+            return null;
+        }
+        select.scrollIntoView({block: 'center'});
+        select.focus();
+        select.value = arguments[1];
+        ['change', 'input', 'blur'].forEach(function(eventType) {
+            select.dispatchEvent(new Event(eventType, { bubbles: true }));
+        });
+        return select.value;
+    """, pgr_id, value)
 
 
-def wait_for_otp_sync(timeout: int, thread_id: int):
+def selects_committed(driver, selections) -> bool:
     """
-    Synchronous version of OTP waiting for use in thread pool.
-    This function runs in a dedicated thread so blocking operations are OK.
+    Check that Angular has taken each dropdown change: the <select> holds the expected value and is marked ng-dirty.
+    Used as the post-condition after setting dropdowns, before clicking Continue.
     
     Args:
-        timeout: Maximum time to wait for OTP in seconds
-        thread_id: Thread ID of the browser instance waiting for OTP
+        driver: Chrome WebDriver instance
+        selections: List of [data-pgr-id, expected value] pairs (None accepts any value)
     
     Returns:
-        str or None: The OTP code if received, None if timeout
+        bool: True once every listed dropdown is committed
     """
-    # Register this thread as waiting for OTP (ensures FIFO order)
-    with otp_waiting_lock:
-        if thread_id not in otp_waiting_threads:
-            otp_waiting_threads.append(thread_id)
-            wait_position = len(otp_waiting_threads)
-        else:
-            wait_position = otp_waiting_threads.index(thread_id) + 1
+    return driver.execute_script("""
+        return arguments[0].every(function(selection) {
+            var select = document.querySelector("select[data-pgr-id='" + selection[0] + "']");
+            return !!select
+                && (selection[1] === null || select.value === selection[1])
+                && select.classList.contains('ng-dirty');
+        });
+    """, selections)
+
+
+def scroll_and_click(driver, element):
+    """
+    Scroll an element to the center of the viewport, focus it and click it with JavaScript in a single call.
     
-    # Update thread status to indicate waiting for OTP
-    with browser_threads_lock:
-        if thread_id in browser_threads:
-            browser_threads[thread_id]["status"] = "waiting_for_otp"
+    Args:
+        driver: Chrome WebDriver instance
+        element: WebElement to click
+    """
+    driver.execute_script("""
+        var element = arguments[0];
+        element.scrollIntoView({block: 'center'});
+        element.focus();
+        element.click();
+    """, element)
+
+
+def scroll_into_view_if_needed(driver, element):
+    """
+    Scroll an element to the center of the viewport only if it is not already fully visible.
+    Skips the layout pass (and the settle delay after it) when the previous action left the element in view.
     
-    log_thread(thread_id, f"⏳ Waiting for OTP from queue (timeout: {timeout}s, position: {wait_position})...")
+    Args:
+        driver: Chrome WebDriver instance
+        element: WebElement to bring into view
+    """
+    driver.execute_script("""
+        var rect = arguments[0].getBoundingClientRect();
+        if (rect.top < 0 || rect.bottom > window.innerHeight) {
+            arguments[0].scrollIntoView({block: 'center'});
+        }
+    """, element)
+
+
+def cdp_eval(driver, script: str, *args, await_promise: bool = False):
+    """
+    Run a script through the DevTools Runtime.evaluate command and return its JSON result.
+    Used for the scrape helpers: the result comes back by value in one DevTools call, without the
+    WebDriver script wrapping and element serialization that execute_script performs.
     
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        # Check if there's an OTP available AND this thread is next in line
-        with otp_waiting_lock:
-            has_otp = otp_queue.qsize() > 0
-            is_my_turn = len(otp_waiting_threads) > 0 and otp_waiting_threads[0] == thread_id
+    Args:
+        driver: Chrome WebDriver instance
+        script: Function body, as for execute_script (may use `return` and `arguments[i]`)
+        *args: JSON-serializable arguments passed to the script (WebElements are not supported)
+        await_promise: Run the script as an async function (may use `await`) and return once it settles
+    
+    Returns:
+        The script's return value (None for null/undefined)
+    
+    Raises:
+        JavascriptException: If the script throws
+    """
+    function_kind = "async function" if await_promise else "function"
+    expression = f"({function_kind}() {{{script}\n}}).apply(null, {json.dumps(args)})"
+    response = driver.execute_cdp_cmd(
+        "Runtime.evaluate",
+        {"expression": expression, "returnByValue": True, "awaitPromise": await_promise}
+    )
+    
+    if "exceptionDetails" in response:
+        details = response["exceptionDetails"]
+        raise JavascriptException(details.get("exception", {}).get("description") or details.get("text"))
+    
+    return response["result"].get("value")
+
+
+def close_modal(driver, gone_selector: str, timeout: float = 5) -> bool:
+    """
+    Click the modal's close button and wait until the modal content is gone, in a single DevTools call.
+    The browser re-checks after every two animation frames, so the call returns as soon as the close
+    animation has finished instead of after a fixed pause.
+    
+    Args:
+        driver: Chrome WebDriver instance with a modal open
+        gone_selector: CSS selector of an element inside the modal that disappears when it closes
+        timeout: Maximum seconds to wait for the modal to close
+    
+    Returns:
+        bool: True once the modal is gone, False if it is still visible after the timeout
+    
+    Raises:
+        JavascriptException: If the close button is not on the page
+    """
+    return cdp_eval(driver, """
+        var button = document.querySelector(arguments[0]);
+        if (!button) throw new Error('Close button not found');
+        button.scrollIntoView({block: 'center'});
+        button.click();
+        
+        // setTimeout fallback: requestAnimationFrame does not fire while the page is hidden
+        function nextFrame() {
+            return new Promise(function(resolve) { requestAnimationFrame(resolve); setTimeout(resolve, 50); });
+        }
+        var deadline = Date.now() + arguments[2] * 1000;
+        while (true) {
+            await nextFrame();
+            await nextFrame();
+            var el = document.querySelector(arguments[1]);
+            if (!el || el.offsetParent === null) return true;
+            if (Date.now() > deadline) return false;
+        }
+    """, CLOSE_MODAL_BUTTON_SELECTOR, gone_selector, timeout, await_promise=True)
+
+
+def scrape_table(driver, selector: str) -> list:
+    """
+    Read the text of every body row of a table in a single script execution.
+    Walking the rows in the browser replaces one WebDriver round-trip per cell with one per table.
+    
+    Args:
+        driver: Chrome WebDriver instance
+        selector: CSS selector of the table(s)
+        
+    Returns:
+        list: One list of trimmed cell strings per row, in document order
+    """
+    return cdp_eval(driver, """
+        return Array.from(document.querySelectorAll(arguments[0] + ' tbody tr')).map(function(r) {
+            return Array.from(r.querySelectorAll('td')).map(function(c) { return c.innerText.trim(); });
+        });
+    """, selector) or []
+
+
+def scrape_payment_schedule_rows(driver) -> list:
+    """
+    Scrape the rows of the payment schedule table in one script execution.
+    
+    Args:
+        driver: Chrome WebDriver instance with the payment schedule popup open
+        
+    Returns:
+        list: One dict per row with date, current_amount, new_amount and difference
+    """
+    rows = scrape_table(driver, PAYMENT_SCHEDULE_TABLE_SELECTOR)
+    
+    logger.info(f"Found {len(rows)} payment schedule rows")
+    
+    payment_schedule = [
+        {"date": r[0], "current_amount": r[1], "new_amount": r[2], "difference": r[3]}
+        for r in rows if len(r) >= 4
+    ]
+    
+    for index, row in enumerate(payment_schedule):
+        logger.info(f"Row {index + 1}: {row['date']} | Current: {row['current_amount']} | New: {row['new_amount']} | Diff: {row['difference']}")
+    
+    return payment_schedule
+
+
+def scrape_rate_summary(driver, summary: Optional[dict] = None) -> dict:
+    """
+    Scrape the vehicle summary and Total Policy Rate sections of the effect on rate modal in one script execution.
+    
+    Args:
+        driver: Chrome WebDriver instance with the effect on rate modal open
+        summary: RATE_SUMMARY_SCRIPT result if it was already fetched (see scrape_effect_on_rate)
         
-        if has_otp and is_my_turn:
+    Returns:
+        dict: vehicle_summary (list of vehicle_name/current_rate/new_rate) and
+            total_policy_rate (current_rate/new_rate, empty if not shown)
+    """
+    if summary is None:
+        summary = cdp_eval(driver, RATE_SUMMARY_SCRIPT) or {}
+    
+    vehicle_summary = []
+    for vehicle in summary.get("vehicles") or []:
+        vehicle_summary.append({
+            "vehicle_name": vehicle["name"],
+            "current_rate": vehicle["current"],
+            "new_rate": vehicle["new"]
+        })
+        logger.info(f"Vehicle: {vehicle['name']} | Current: {vehicle['current']} | New: {vehicle['new']}")
+    
+    total_policy_rate = {}
+    total = summary.get("total")
+    if total:
+        total_policy_rate = {
+            "current_rate": total["current"],
+            "new_rate": total["new"]
+        }
+        logger.info(f"Total Policy Rate | Current: {total['current']} | New: {total['new']}")
+    
+    return {
+        "vehicle_summary": vehicle_summary,
+        "total_policy_rate": total_policy_rate
+    }
+
+
+def scrape_vehicle_breakdowns(driver, vehicles: Optional[list] = None) -> list:
+    """
+    Scrape the per-vehicle coverage breakdowns of the effect on rate modal in one script execution.
+    The browser groups each vehicle header with the coverage divs that follow it (up to the next header),
+    replacing a sibling-by-sibling XPath walk that cost several round-trips per coverage.
+    
+    Args:
+        driver: Chrome WebDriver instance with the effect on rate modal open
+        vehicles: VEHICLE_BREAKDOWN_SCRIPT result if it was already fetched (see scrape_effect_on_rate)
+        
+    Returns:
+        list: One dict per vehicle with vehicle_name and its list of coverages
+    """
+    if vehicles is None:
+        vehicles = cdp_eval(driver, VEHICLE_BREAKDOWN_SCRIPT) or []
+    
+    vehicle_details = []
+    
+    for vehicle in vehicles:
+        logger.info(f"Processing detailed breakdown for: {vehicle['vehicle_name']}")
+        
+        vehicle_data = {
+            "vehicle_name": vehicle["vehicle_name"],
+            "coverages": []
+        }
+        
+        for coverage in vehicle["coverages"]:
+            # First row holds the coverage details, second row the values (by position, each checked on its own)
+            rows = coverage["rows"]
+            details_row = rows[0] if len(rows) > 0 else []
+            values_row = rows[1] if len(rows) > 1 else []
+            current_coverage, new_coverage = details_row[:2] if len(details_row) >= 2 else ("", "")
+            current_value, new_value = values_row[:2] if len(values_row) >= 2 else ("", "")
+            
+            vehicle_data["coverages"].append({
+                "coverage_name": coverage["coverage_name"],
+                "current_coverage": current_coverage,
+                "current_value": current_value,
+                "new_coverage": new_coverage,
+                "new_value": new_value
+            })
+            
+            logger.info(f"  - {coverage['coverage_name']}: Current ${current_value} -> New ${new_value}")
+        
+        vehicle_details.append(vehicle_data)
+    
+    return vehicle_details
+
+
+def scrape_effect_on_rate(driver) -> dict:
+    """
+    Scrape the whole effect on rate modal (summary, total and per-vehicle breakdowns) in one script execution.
+    
+    Args:
+        driver: Chrome WebDriver instance with the effect on rate modal open
+        
+    Returns:
+        dict: vehicle_summary, total_policy_rate and vehicle_details
+    """
+    result = cdp_eval(driver, EFFECT_ON_RATE_SCRIPT) or {}
+    
+    effect_on_rate_data = scrape_rate_summary(driver, result.get("summary") or {})
+    effect_on_rate_data["vehicle_details"] = scrape_vehicle_breakdowns(driver, result.get("vehicles") or [])
+    
+    return effect_on_rate_data
+
+
+def wait_for_session_save(driver):
+    """
+    Wait for Chrome to finish saving session data to the profile directory.
+    Chrome automatically saves session data when the browser closes.
+    Each thread maintains its own session in its own profile directory.
+    
+    Args:
+        driver: Chrome WebDriver instance with _profile_info attribute
+    """
+    try:
+        if not hasattr(driver, '_profile_info'):
+            return
+        
+        profile_info = driver._profile_info
+        thread_id = profile_info.get("thread_id")
+        
+        if thread_id is not None:
+            logger.info(f"💾 Waiting for Chrome to save session data for Thread-{thread_id}...")
+        
+        # Wait for Chrome to finish writing session data to profile directory
+        # Chrome automatically saves cookies, localStorage, etc. when browser closes
+        time.sleep(2)
+        
+        if thread_id is not None:
+            logger.info(f"✅ Session data saved for Thread-{thread_id}")
+        
+    except Exception as e:
+        logger.warning(f"⚠️ Error waiting for session save: {str(e)}")
+
+
+def acquire_driver(thread_id: int):
+    """
+    Get a Chrome WebDriver for a thread, reusing its idle pooled driver when one is available.
+    Reusing a driver skips Chrome startup, which dominates short automations.
+    
+    Args:
+        thread_id: Thread ID of the browser instance
+    
+    Returns:
+        webdriver.Chrome: Ready-to-use Chrome WebDriver instance
+    
+    Note:
+        - Pooled drivers are keyed by thread_id because each thread owns its own Chrome profile
+        - Cookies are kept on reuse so the saved login session still avoids repeated OTPs
+        - A pooled driver that no longer responds is quit and replaced with a new one
+    """
+    with idle_drivers_lock:
+        driver = idle_drivers.pop(thread_id, None)
+    
+    if driver is not None:
+        try:
+            # Cheap liveness check - raises if Chrome crashed or the session is gone
+            driver.current_url
+            log_thread(thread_id, f"♻️ Reusing pooled Chrome WebDriver (use {driver._use_count + 1}/{DRIVER_MAX_USES})")
+        except Exception as e:
+            log_thread(thread_id, f"⚠️ Pooled Chrome WebDriver not responding, starting a new one: {str(e)}")
             try:
-                # Get OTP from queue with short timeout
-                otp_code = otp_queue.get(timeout=0.3)
-                
-                # IMMEDIATELY remove this thread from waiting list
-                with otp_waiting_lock:
-                    if thread_id in otp_waiting_threads:
-                        otp_waiting_threads.remove(thread_id)
-                
-                log_thread(thread_id, f"✅ OTP received from queue: {otp_code}")
-                return otp_code
-            except queue.Empty:
-                # No OTP available yet, continue waiting
+                driver.quit()
+            except:
                 pass
-        
-        # Wait a bit before checking again (OK to block - we're in a thread)
-        time.sleep(0.1)
+            driver = None
+    
+    if driver is None:
+        driver = setup_chrome_driver(thread_id=thread_id)
+        driver._use_count = 0
+    
+    driver._use_count += 1
+    return driver
+
+
+def release_driver(driver, thread_id: int):
+    """
+    Return a driver to the idle pool after a successful run.
+    Drivers that have served DRIVER_MAX_USES requests are closed instead so Chrome memory does not grow unbounded.
+    
+    Args:
+        driver: Chrome WebDriver instance obtained from acquire_driver
+        thread_id: Thread ID of the browser instance
+    """
+    if driver._use_count >= DRIVER_MAX_USES:
+        log_thread(thread_id, f"🔁 Chrome WebDriver reached {DRIVER_MAX_USES} uses - closing it")
+        wait_for_session_save(driver)
+        driver.quit()
+        log_thread(thread_id, "✅ Browser closed successfully")
+        return
+    
+    try:
+        # Leave the portal page so the idle browser stops running its scripts
+        driver.get("about:blank")
+    except Exception as e:
+        log_thread(thread_id, f"⚠️ Could not reset browser, closing it instead: {str(e)}")
+        driver.quit()
+        return
+    
+    with idle_drivers_lock:
+        idle_drivers[thread_id] = driver
+    log_thread(thread_id, "♻️ Browser returned to pool")
+
+
+def prewarm_driver_pool(size: int):
+    """
+    Start drivers ahead of time so the first requests skip Chrome startup.
+    Each driver is started for the thread ID it will serve (so it uses that thread's profile) and parked in the idle pool.
+    
+    Args:
+        size: Number of drivers to start
+    """
+    # Reserve the thread IDs the first requests will get, so no request can use them while Chrome starts
+    thread_ids = [get_next_thread_id() for _ in range(size)]
+    
+    for thread_id in thread_ids:
+        try:
+            driver = setup_chrome_driver(thread_id=thread_id)
+            driver._use_count = 0
+            with idle_drivers_lock:
+                idle_drivers[thread_id] = driver
+            log_thread(thread_id, "♻️ Pre-warmed browser added to pool")
+        except Exception as e:
+            log_thread(thread_id, f"⚠️ Could not pre-warm browser: {str(e)}")
+        finally:
+            release_thread_id(thread_id)
+
+
+def close_idle_drivers():
+    """
+    Quit every idle pooled driver (used on application shutdown).
+    """
+    with idle_drivers_lock:
+        drivers = list(idle_drivers.values())
+        idle_drivers.clear()
+    
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"⚠️ Error closing pooled browser: {str(e)}")
+
+
+def get_next_thread_id() -> int:
+    """
+    Get the next unique thread ID for a browser instance.
+    Reuses any available thread ID when threads finish (supports N concurrent threads).
+    This ensures OTP matching works correctly by reusing thread IDs efficiently.
+    
+    Returns:
+        int: Unique thread ID for the browser instance (reused if available, otherwise new)
+    """
+    global thread_counter
+    
+    # First, try to reuse an available thread ID (any ID that was previously used)
+    with available_thread_ids_lock:
+        if available_thread_ids:
+            # Reuse the lowest available thread ID
+            thread_id = min(available_thread_ids)
+            available_thread_ids.remove(thread_id)
+        else:
+            # No available IDs, create a new one by incrementing counter
+            with thread_counter_lock:
+                thread_counter += 1
+                thread_id = thread_counter
+    
+    # Register this thread in the browser_threads mapping
+    with browser_threads_lock:
+        browser_threads[thread_id] = {
+            "created_at": time.time(),
+            "status": "initializing"
+        }
+    
+    return thread_id
+
+
+def release_thread_id(thread_id: int):
+    """
+    Release a thread ID back to the available pool when a thread finishes.
+    This allows any thread ID to be reused for new requests (supports N concurrent threads).
     
-    # Remove thread from waiting list on timeout
-    with otp_waiting_lock:
+    Args:
+        thread_id: The thread ID to release
+    """
+    # Release any thread ID back to the available pool for reuse
+    with available_thread_ids_lock:
+        available_thread_ids.add(thread_id)
+    
+    # Remove from browser_threads mapping
+    with browser_threads_lock:
+        if thread_id in browser_threads:
+            del browser_threads[thread_id]
+    
+    # Remove from OTP waiting threads if still there
+    with otp_condition:
         if thread_id in otp_waiting_threads:
             otp_waiting_threads.remove(thread_id)
+            otp_condition.notify_all()
+
+
+def log_thread(thread_id: int, message: str):
+    """
+    Log a message with thread ID prefix for easy tracking.
     
-    log_thread(thread_id, "❌ OTP timeout - no OTP received from queue within timeout period")
-    return None
+    Args:
+        thread_id: The thread ID of the browser instance
+        message: The log message to print
+    """
+    logger.info("[Thread-%s] %s", thread_id, message, extra={"thread_id": thread_id})
+
+
+def current_timestamp() -> str:
+    """
+    Return the current time as "%Y-%m-%d %H:%M:%S", formatting at most once per second.
+    
+    Returns:
+        str: Formatted local timestamp
+    """
+    now = int(time.time())
+    if now != timestamp_cache["sec"]:
+        timestamp_cache["str"] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        timestamp_cache["sec"] = now
+    return timestamp_cache["str"]
+
+
+def register_otp_waiter(thread_id: int) -> int:
+    """
+    Register a thread as waiting for an OTP (ensures FIFO order) and mark it as waiting.
+    
+    Args:
+        thread_id: Thread ID of the browser instance waiting for OTP
+    
+    Returns:
+        int: The thread's 1-based position in the waiting list
+    """
+    with otp_condition:
+        if thread_id not in otp_waiting_threads:
+            otp_waiting_threads.append(thread_id)
+        wait_position = otp_waiting_threads.index(thread_id) + 1
+    
+    # Update thread status to indicate waiting for OTP
+    with browser_threads_lock:
+        if thread_id in browser_threads:
+            browser_threads[thread_id]["status"] = "waiting_for_otp"
+    
+    return wait_position
+
+
+def take_otp(thread_id: int, timeout: float) -> Optional[str]:
+    """
+    Block until an OTP is queued and this thread is first in the waiting list, then take it.
+    
+    Args:
+        thread_id: Thread ID of a registered OTP waiter
+        timeout: Maximum time to wait in seconds
+    
+    Returns:
+        str or None: The OTP code, or None on timeout
+    
+    Note:
+        - The thread is removed from the waiting list either way
+        - Other waiters are notified afterwards, since the next thread in line may now be able to take an OTP
+    """
+    deadline = time.monotonic() + timeout
+    
+    with otp_condition:
+        while True:
+            if otp_deque and otp_waiting_threads and otp_waiting_threads[0] == thread_id:
+                otp_code = otp_deque.popleft()
+                otp_waiting_threads.remove(thread_id)
+                otp_condition.notify_all()
+                return otp_code
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if thread_id in otp_waiting_threads:
+                    otp_waiting_threads.remove(thread_id)
+                    otp_condition.notify_all()
+                return None
+            
+            otp_condition.wait(remaining)
+
+
+def log_nav(driver, label: str):
+    """
+    Log the current page title and URL after a navigation step, when DEBUG_LOG_NAV is enabled.
+    
+    Args:
+        driver: Chrome WebDriver instance
+        label: Step description used as the log prefix (e.g., 'After search')
+    """
+    if not DEBUG_LOG_NAV:
+        return
+    
+    # Both values in one round-trip instead of separate title and current_url commands
+    title, url = driver.execute_script("return [document.title, location.href];")
+    logger.info(f"{label} - Title: {title}")
+    logger.info(f"{label} - URL: {url}")
 
 
+def wait_for_otp_sync(timeout: int, thread_id: int):
+    """
+    Synchronous version of OTP waiting for use in thread pool.
+    This function runs in a dedicated thread so blocking operations are OK.
+    
+    Args:
+        timeout: Maximum time to wait for OTP in seconds
+        thread_id: Thread ID of the browser instance waiting for OTP
+    
+    Returns:
+        str or None: The OTP code if received, None if timeout
+    """
+    wait_position = register_otp_waiter(thread_id)
+    
+    log_thread(thread_id, f"⏳ Waiting for OTP from queue (timeout: {timeout}s, position: {wait_position})...")
+    
+    otp_code = take_otp(thread_id, timeout)
+    
+    if otp_code is not None:
+        log_thread(thread_id, f"✅ OTP received from queue: {otp_code}")
+        return otp_code
+    
+    log_thread(thread_id, "❌ OTP timeout - no OTP received from queue within timeout period")
+    return None
 
 
 @app.get("/")
@@ -666,7 +1607,7 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "vehical_replace",
-        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+        "timestamp": current_timestamp()
     }
 
 
@@ -690,6 +1631,60 @@ async def otp_info():
     }
 
 
+# Thread status, HTTP status code and error detail prefix per failure type (first matching type wins)
+AUTOMATION_ERRORS = {
+    TimeoutException: ("timeout_error", 408, "Timeout waiting for page elements"),
+    NoSuchElementException: ("element_not_found_error", 404, "Required element not found"),
+    Exception: ("error", 500, "An error occurred"),
+}
+
+
+@contextmanager
+def automation_context(thread_id: int):
+    """
+    Run an automation with a single failure path: status update, browser cleanup and thread ID release.
+    
+    Args:
+        thread_id: Thread ID of the browser instance
+    
+    Yields:
+        dict: Context whose "driver" key the automation sets once the browser is started
+    
+    Raises:
+        HTTPException: For any failure, with the status code mapped in AUTOMATION_ERRORS
+    
+    Note:
+        - A failed run's browser is quit rather than returned to the pool, since its page state is unknown
+        - The success path releases its own driver and thread ID before returning
+    """
+    ctx = {"driver": None}
+    try:
+        yield ctx
+    except Exception as e:
+        status, status_code, detail = next(
+            value for exc_type, value in AUTOMATION_ERRORS.items() if isinstance(e, exc_type)
+        )
+        log_thread(thread_id, f"❌ {type(e).__name__}: {str(e)}")
+        
+        # Update thread status
+        with browser_threads_lock:
+            if thread_id in browser_threads:
+                browser_threads[thread_id].update(status=status, error=str(e))
+        
+        if ctx["driver"]:
+            try:
+                ctx["driver"].quit()
+            except Exception:
+                pass
+        
+        # Release thread ID for reuse
+        release_thread_id(thread_id)
+        raise HTTPException(
+            status_code=status_code,
+            detail=f"{detail}: {str(e)}"
+        )
+
+
 def run_automation_sync(request: PolicyRequest, thread_id: int):
     """
     Synchronous automation function that runs in a thread pool.
@@ -702,15 +1697,27 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
     Returns:
         dict: Success response with automation results
     """
-    driver = None
+    # Normalize request values once up front instead of inside each step
+    vehicle_name_upper = request.vehicle_name_to_replace.upper()
+    answer_upper = request.vehical_is_suv_van_pickup.upper().strip()  # accept yes/Yes/Y or no/No/N
+    answer_upper2 = request.vehical_is_kitcar_buggy_classic.upper().strip()  # accept yes/Yes/Y or no/No/N
+    make_value = request.make.upper()  # Convert to uppercase to match options
+    model_value = request.model.upper()  # Convert to uppercase to match options
+    vehicle_use_upper = request.vehicle_use.upper().strip()
+    ridesharing_upper = request.vehicle_use_ridesharing.upper().strip()  # accept yes/Yes/Y or no/No/N
+    ownership_upper = request.vehicle_ownership.upper().strip()
+    comp_deductible_upper = normalize_option_key(request.comprehensive_deductible)
+    medpay_upper = normalize_option_key(request.medical_payment_coverage)
+    collision_upper = normalize_option_key(request.collision_deductible)
+    bipd_upper = normalize_option_key(request.bodily_injury_property_damage)
     
-    try:
+    with automation_context(thread_id) as ctx:
         # -------------------------------------------------------------------------
         # STEP 1: Initialize WebDriver
         # -------------------------------------------------------------------------
         log_thread(thread_id, "🔧 Initializing Chrome WebDriver...")
-        # Pass thread_id to setup_chrome_driver - each thread maintains its own session
-        driver = setup_chrome_driver(thread_id=thread_id)
+        # Reuse this thread's pooled driver when available - each thread maintains its own session
+        driver = ctx["driver"] = acquire_driver(thread_id)
         
         # Update thread status
         with browser_threads_lock:
@@ -772,20 +1779,20 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         
         # Check if we're on the expected page or if MFA is required
         page_source_snippet = driver.page_source[:500]
-        print(f"Page source preview: {page_source_snippet}")
+        logger.info(f"Page source preview: {page_source_snippet}")
         
         # -------------------------------------------------------------------------
         # STEP 3.1: Handle OTP (MFA) if present
         # -------------------------------------------------------------------------
         try:
             # Check for OTP field after login (with timeout)
-            print("Checking for OTP field...")
+            logger.info("Checking for OTP field...")
             otp_field_found = False
             
             try:
                 # Wait for OTP field with shorter timeout
                 otp_field = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.ID, "reauth-sms-otp-input"))
+                    EC.presence_of_element_located(OTP_INPUT_LOCATOR)
                 )
                 log_thread(thread_id, "✅ OTP field found - waiting for OTP...")
                 otp_field_found = True
@@ -799,7 +1806,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                     
                     # Wait for OTP field to be clickable and clear it
                     WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable((By.ID, "reauth-sms-otp-input"))
+                        EC.element_to_be_clickable(OTP_INPUT_LOCATOR)
                     )
                     otp_field.clear()
                     time.sleep(0.5)
@@ -816,44 +1823,44 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                     
                     # Verify we're on the correct URL before clicking Continue button
                     current_url = driver.current_url
-                    print(f"📍 Current URL before clicking Continue: {current_url}")
+                    logger.info(f"📍 Current URL before clicking Continue: {current_url}")
                     
                     # Check if we're on the correct Progressive login page
                     if "foragentsonlylogin.progressive.com" not in current_url:
-                        print("❌ Not on correct Progressive login page!")
-                        print(f"Expected: foragentsonlylogin.progressive.com")
-                        print(f"Actual: {current_url}")
+                        logger.error("❌ Not on correct Progressive login page!")
+                        logger.info(f"Expected: foragentsonlylogin.progressive.com")
+                        logger.info(f"Actual: {current_url}")
                         raise Exception("Bot is not on the correct Progressive login page")
                     
-                    print("✅ Confirmed on correct Progressive login page")
+                    logger.info("✅ Confirmed on correct Progressive login page")
                     
                     # Find and click Continue button - SIMPLE METHOD like login button
-                    print("🔍 Looking for Continue button...")
+                    logger.info("🔍 Looking for Continue button...")
                     
                     # Take screenshot before clicking
                     driver.save_screenshot("before_continue_click.png")
-                    print("📸 Screenshot saved: before_continue_click.png")
+                    logger.info("📸 Screenshot saved: before_continue_click.png")
                     
                     try:
-                        print("🔍 Looking for Continue button...")
+                        logger.info("🔍 Looking for Continue button...")
                         
                         # First, let's check what elements are actually present
-                        print("🔍 Checking what elements are available...")
+                        logger.info("🔍 Checking what elements are available...")
                         try:
                             all_buttons = driver.find_elements(By.TAG_NAME, "button")
-                            print(f"📊 Found {len(all_buttons)} buttons on page")
+                            logger.info(f"📊 Found {len(all_buttons)} buttons on page")
                             for i, btn in enumerate(all_buttons[:5]):  # Show first 5 buttons
                                 try:
                                     btn_class = btn.get_attribute("class")
                                     btn_text = btn.text
-                                    print(f"   Button {i+1}: class='{btn_class}', text='{btn_text}'")
+                                    logger.info(f"   Button {i+1}: class='{btn_class}', text='{btn_text}'")
                                 except:
-                                    print(f"   Button {i+1}: Could not get details")
+                                    logger.warning(f"   Button {i+1}: Could not get details")
                         except Exception as e:
-                            print(f"⚠️ Could not list buttons: {e}")
+                            logger.warning(f"⚠️ Could not list buttons: {e}")
                         
                         # Wait for the Continue button to become visible and interactable
-                        print("⏳ Waiting for Continue button to become visible...")
+                        logger.info("⏳ Waiting for Continue button to become visible...")
                         continue_button = None
                         
                         try:
@@ -861,110 +1868,110 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                             continue_button = WebDriverWait(driver, 10).until(
                                 EC.element_to_be_clickable((By.XPATH, "//button[@class='base-btn js-mfa-reauth-submit-button' and text()='Continue']"))
                             )
-                            print("✅ Found VISIBLE Continue button after waiting!")
+                            logger.info("✅ Found VISIBLE Continue button after waiting!")
                         except Exception as e:
-                            print(f"⚠️ Wait for visible button failed: {e}")
+                            logger.warning(f"⚠️ Wait for visible button failed: {e}")
                             
                             # Fallback: Try to find the SPECIFIC visible Continue button
-                            print("🔄 Trying fallback method - finding SPECIFIC visible Continue button...")
+                            logger.info("🔄 Trying fallback method - finding SPECIFIC visible Continue button...")
                             try:
                                 # Get all Continue buttons and find the visible one
                                 all_continue_buttons = driver.find_elements(By.XPATH, "//button[text()='Continue']")
-                                print(f"📊 Found {len(all_continue_buttons)} Continue buttons")
+                                logger.info(f"📊 Found {len(all_continue_buttons)} Continue buttons")
                                 
                                 for i, btn in enumerate(all_continue_buttons):
                                     try:
                                         btn_text = btn.text
                                         btn_displayed = btn.is_displayed()
                                         btn_enabled = btn.is_enabled()
-                                        print(f"   Continue Button {i+1}: text='{btn_text}', displayed={btn_displayed}, enabled={btn_enabled}")
+                                        logger.info(f"   Continue Button {i+1}: text='{btn_text}', displayed={btn_displayed}, enabled={btn_enabled}")
                                         
                                         if btn_displayed and btn_enabled and btn_text.strip() == 'Continue':
                                             continue_button = btn
-                                            print(f"✅ Found VISIBLE Continue button (Button {i+1})")
+                                            logger.info(f"✅ Found VISIBLE Continue button (Button {i+1})")
                                             break
                                     except Exception as btn_e:
-                                        print(f"   Continue Button {i+1}: Error getting details - {btn_e}")
+                                        logger.info(f"   Continue Button {i+1}: Error getting details - {btn_e}")
                                 
                                 if not continue_button:
                                     raise Exception("No visible Continue button found")
                                     
                             except Exception as e2:
-                                print(f"❌ Fallback also failed: {e2}")
+                                logger.error(f"❌ Fallback also failed: {e2}")
                                 raise Exception("Could not find Continue button with any method")
                         
                         if not continue_button:
                             raise Exception("Could not find Continue button with any selector")
                         
-                        print("✅ Continue button found!")
+                        logger.info("✅ Continue button found!")
                         
                         # Get button properties for debugging
                         button_text = continue_button.text
                         button_enabled = continue_button.is_enabled()
                         button_displayed = continue_button.is_displayed()
                         button_class = continue_button.get_attribute("class")
-                        print(f"🔍 Button info - Text: '{button_text}', Enabled: {button_enabled}, Displayed: {button_displayed}, Class: '{button_class}'")
+                        logger.info(f"🔍 Button info - Text: '{button_text}', Enabled: {button_enabled}, Displayed: {button_displayed}, Class: '{button_class}'")
                         
                         # Try multiple clicking methods to ensure it works
                         success = False
                         
                         # Method 1: JavaScript click (most reliable)
                         try:
-                            print("🔄 Trying JavaScript click (most reliable)...")
+                            logger.info("🔄 Trying JavaScript click (most reliable)...")
                             driver.execute_script("arguments[0].click();", continue_button)
-                            print("✅ JavaScript click successful!")
+                            logger.info("✅ JavaScript click successful!")
                             
                             # Verify if click worked
                             time.sleep(2)
                             try:
-                                driver.find_element(By.ID, "reauth-sms-otp-input")
-                                print("❌ JavaScript click didn't work - OTP field still present")
+                                driver.find_element(*OTP_INPUT_LOCATOR)
+                                logger.error("❌ JavaScript click didn't work - OTP field still present")
                             except:
-                                print("✅ JavaScript click worked - OTP field gone!")
+                                logger.info("✅ JavaScript click worked - OTP field gone!")
                                 success = True
                         except Exception as e1:
-                            print(f"⚠️ JavaScript click failed: {e1}")
+                            logger.warning(f"⚠️ JavaScript click failed: {e1}")
                         
                         # Method 2: Simple click like login button
                         if not success:
                             try:
-                                print("🔄 Trying simple click (like login button)...")
+                                logger.info("🔄 Trying simple click (like login button)...")
                                 continue_button.click()
-                                print("✅ Simple click successful!")
+                                logger.info("✅ Simple click successful!")
                                 
                                 # Verify if click worked
                                 time.sleep(2)
                                 try:
-                                    driver.find_element(By.ID, "reauth-sms-otp-input")
-                                    print("❌ Simple click didn't work - OTP field still present")
+                                    driver.find_element(*OTP_INPUT_LOCATOR)
+                                    logger.error("❌ Simple click didn't work - OTP field still present")
                                 except:
-                                    print("✅ Simple click worked - OTP field gone!")
+                                    logger.info("✅ Simple click worked - OTP field gone!")
                                     success = True
                             except Exception as e2:
-                                print(f"⚠️ Simple click failed: {e2}")
+                                logger.warning(f"⚠️ Simple click failed: {e2}")
                         
                         # Method 3: Form submission
                         if not success:
                             try:
-                                print("🔄 Trying form submission...")
+                                logger.info("🔄 Trying form submission...")
                                 form = driver.find_element(By.CSS_SELECTOR, "form.js-mfa-reauth-sms-otp")
                                 driver.execute_script("arguments[0].submit();", form)
                                 
                                 # Verify if submission worked
                                 time.sleep(2)
                                 try:
-                                    driver.find_element(By.ID, "reauth-sms-otp-input")
-                                    print("❌ Form submission didn't work - OTP field still present")
+                                    driver.find_element(*OTP_INPUT_LOCATOR)
+                                    logger.error("❌ Form submission didn't work - OTP field still present")
                                 except:
-                                    print("✅ Form submission worked - OTP field gone!")
+                                    logger.info("✅ Form submission worked - OTP field gone!")
                                     success = True
                             except Exception as e3:
-                                print(f"⚠️ Form submission failed: {e3}")
+                                logger.warning(f"⚠️ Form submission failed: {e3}")
                         
                         # Method 4: Force click with JavaScript
                         if not success:
                             try:
-                                print("🔄 Trying force click...")
+                                logger.info("🔄 Trying force click...")
                                 force_button = driver.find_element(By.CSS_SELECTOR, "button.base-btn.js-mfa-reauth-submit-button")
                                 driver.execute_script("""
                                     var button = arguments[0];
@@ -977,18 +1984,18 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                                 # Verify if click worked
                                 time.sleep(2)
                                 try:
-                                    driver.find_element(By.ID, "reauth-sms-otp-input")
-                                    print("❌ Force click didn't work - OTP field still present")
+                                    driver.find_element(*OTP_INPUT_LOCATOR)
+                                    logger.error("❌ Force click didn't work - OTP field still present")
                                 except:
-                                    print("✅ Force click worked - OTP field gone!")
+                                    logger.info("✅ Force click worked - OTP field gone!")
                                     success = True
                             except Exception as e4:
-                                print(f"⚠️ Force click failed: {e4}")
+                                logger.warning(f"⚠️ Force click failed: {e4}")
                         
                         # Method 5: Direct form submission
                         if not success:
                             try:
-                                print("🔄 Trying direct form submission...")
+                                logger.info("🔄 Trying direct form submission...")
                                 driver.execute_script("""
                                     // Find the form and submit it directly
                                     var forms = document.getElementsByTagName('form');
@@ -999,7 +2006,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                                         }
                                     }
                                 """)
-                                print("✅ Submitted form directly!")
+                                logger.info("✅ Submitted form directly!")
                                 
                                 # Wait a moment for the form to process
                                 time.sleep(2)
@@ -1007,35 +2014,35 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                                 # Check if OTP field disappeared (indicating success)
                                 try:
                                     WebDriverWait(driver, 3).until(
-                                        EC.invisibility_of_element_located((By.ID, "reauth-sms-otp-input"))
+                                        EC.invisibility_of_element_located(OTP_INPUT_LOCATOR)
                                     )
-                                    print("✅ OTP field disappeared - form submission successful!")
+                                    logger.info("✅ OTP field disappeared - form submission successful!")
                                     success = True
                                 except:
-                                    print("⚠️ OTP field still present after form submission")
+                                    logger.warning("⚠️ OTP field still present after form submission")
                             except Exception as e3:
-                                print(f"⚠️ Direct form submission failed: {e3}")
+                                logger.warning(f"⚠️ Direct form submission failed: {e3}")
                         
                         # Method 6: Last resort - Press Enter key
                         if not success:
                             try:
-                                print("🔄 Trying Enter key press...")
-                                otp_field = driver.find_element(By.ID, "reauth-sms-otp-input")
+                                logger.info("🔄 Trying Enter key press...")
+                                otp_field = driver.find_element(*OTP_INPUT_LOCATOR)
                                 otp_field.send_keys(Keys.RETURN)
                                 
                                 # Verify if Enter key worked
                                 time.sleep(2)
                                 try:
-                                    driver.find_element(By.ID, "reauth-sms-otp-input")
-                                    print("❌ Enter key didn't work - OTP field still present")
+                                    driver.find_element(*OTP_INPUT_LOCATOR)
+                                    logger.error("❌ Enter key didn't work - OTP field still present")
                                 except:
-                                    print("✅ Enter key worked - OTP field gone!")
+                                    logger.info("✅ Enter key worked - OTP field gone!")
                                     success = True
                             except Exception as e6:
-                                print(f"⚠️ Enter key failed: {e6}")
+                                logger.warning(f"⚠️ Enter key failed: {e6}")
                         
                         if not success:
-                            print("❌ ALL METHODS FAILED - Trying manual form submission...")
+                            logger.error("❌ ALL METHODS FAILED - Trying manual form submission...")
                             # Last resort: Manual form submission
                             try:
                                 driver.execute_script("""
@@ -1057,34 +2064,34 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                                         }
                                     }
                                 """)
-                                print("✅ Manual form submission attempted")
+                                logger.info("✅ Manual form submission attempted")
                                 success = True  # Assume it worked
                             except Exception as e7:
-                                print(f"❌ Manual form submission failed: {e7}")
+                                logger.error(f"❌ Manual form submission failed: {e7}")
                         
                         # Verify the click actually worked by checking if page changed
-                        print("🔍 Verifying if Continue button click worked...")
+                        logger.info("🔍 Verifying if Continue button click worked...")
                         time.sleep(3)
                         
                         # Check if we're still on the same page (OTP page)
                         current_url_after = driver.current_url
-                        print(f"📍 Current URL after click: {current_url_after}")
+                        logger.info(f"📍 Current URL after click: {current_url_after}")
                         
                         # Check if URL changed (indicates successful navigation)
                         if current_url_after != current_url:
-                            print("✅ URL changed - Continue button click worked!")
+                            logger.info("✅ URL changed - Continue button click worked!")
                             success = True
                         else:
-                            print("❌ URL didn't change - click didn't work!")
+                            logger.error("❌ URL didn't change - click didn't work!")
                         
                         # Also check if OTP field still exists
                         try:
-                            otp_field_check = driver.find_element(By.ID, "reauth-sms-otp-input")
-                            print("❌ OTP field still present - click didn't work!")
+                            otp_field_check = driver.find_element(*OTP_INPUT_LOCATOR)
+                            logger.error("❌ OTP field still present - click didn't work!")
                             
                             if not success:
                                 # Try the most aggressive method - direct form submission
-                                print("🔄 Trying direct form submission...")
+                                logger.info("🔄 Trying direct form submission...")
                                 driver.execute_script("""
                                     // Find the form and submit it directly
                                     var forms = document.getElementsByTagName('form');
@@ -1095,47 +2102,47 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                                         }
                                     }
                                 """)
-                                print("✅ Submitted form directly!")
+                                logger.info("✅ Submitted form directly!")
                                 time.sleep(3)
                                 
                                 # Check URL again after form submission
                                 final_url = driver.current_url
-                                print(f"📍 Final URL after form submission: {final_url}")
+                                logger.info(f"📍 Final URL after form submission: {final_url}")
                                 
                         except:
-                            print("✅ OTP field no longer present - click worked!")
+                            logger.info("✅ OTP field no longer present - click worked!")
                             success = True
                         
                         # Wait for page to process the OTP
                         time.sleep(5)
-                        print("✅ OTP verification completed - waiting for page to load...")
+                        logger.info("✅ OTP verification completed - waiting for page to load...")
                         
                         # Take screenshot after clicking
                         driver.save_screenshot("after_continue_click.png")
-                        print("📸 Screenshot saved: after_continue_click.png")
+                        logger.info("📸 Screenshot saved: after_continue_click.png")
                         
                     except Exception as e2:
-                        print(f"❌ Error clicking Continue button: {e2}")
-                        print("❌ All clicking methods failed - OTP verification incomplete")
+                        logger.error(f"❌ Error clicking Continue button: {e2}")
+                        logger.error("❌ All clicking methods failed - OTP verification incomplete")
                         raise Exception("Could not click Continue button with any method")
                 else:
-                    print("❌ No OTP received from API")
+                    logger.error("❌ No OTP received from API")
                     raise Exception("OTP not received from API")
                     
             except Exception as e:
-                print(f"⚠️ OTP field not found (timeout after 5 seconds): {e}")
-                print("✅ No OTP required - continuing with normal flow...")
+                logger.warning(f"⚠️ OTP field not found (timeout after 5 seconds): {e}")
+                logger.info("✅ No OTP required - continuing with normal flow...")
                 otp_field_found = False
             
             # If OTP field was not found, continue with normal flow
             if not otp_field_found:
-                print("🔄 Proceeding with normal login flow (no OTP required)")
+                logger.info("🔄 Proceeding with normal login flow (no OTP required)")
                 time.sleep(2)  # Brief wait for page to settle
             
-            print("Login completed!")
+            logger.info("Login completed!")
         except Exception as e:
-            print(f"❌ Error in OTP handling: {e}")
-            print("🔄 Continuing with normal flow...")
+            logger.error(f"❌ Error in OTP handling: {e}")
+            logger.info("🔄 Continuing with normal flow...")
         
         # -------------------------------------------------------------------------
         # STEP 4: Select Policy search option and enter policy number
@@ -1145,18 +2152,18 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         extended_wait = WebDriverWait(driver, 30)
         
         # Wait for the policy search radio button to be available and click it
-        print("Waiting for policy search radio button...")
+        logger.info("Waiting for policy search radio button...")
         
         try:
             # First, wait for the radio button to be present in the DOM
             policy_radio_button = extended_wait.until(
                 EC.presence_of_element_located((By.ID, "SBP_PolSearch"))
             )
-            print(f"Policy radio button found: {policy_radio_button}")
+            logger.info(f"Policy radio button found: {policy_radio_button}")
             
             # Check if it's already selected
             is_selected = policy_radio_button.is_selected()
-            print(f"Radio button already selected: {is_selected}")
+            logger.info(f"Radio button already selected: {is_selected}")
             
             if not is_selected:
                 # Scroll to element to ensure it's visible
@@ -1165,37 +2172,37 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Try clicking using JavaScript (most reliable for radio buttons)
                 driver.execute_script("arguments[0].click();", policy_radio_button)
-                print("Policy search radio button clicked using JavaScript")
+                logger.info("Policy search radio button clicked using JavaScript")
                 
                 # Verify it was selected
                 time.sleep(0.5)
                 is_selected = policy_radio_button.is_selected()
-                print(f"Radio button now selected: {is_selected}")
+                logger.info(f"Radio button now selected: {is_selected}")
             else:
-                print("Radio button already selected, skipping click")
+                logger.info("Radio button already selected, skipping click")
                 
         except Exception as e:
-            print(f"Error clicking policy radio button: {str(e)}")
+            logger.error(f"Error clicking policy radio button: {str(e)}")
             # Try alternative approach - click the label
             try:
                 label = driver.find_element(By.CSS_SELECTOR, "label[for='SBP_PolSearch']")
                 driver.execute_script("arguments[0].click();", label)
-                print("Clicked policy radio button via label")
+                logger.info("Clicked policy radio button via label")
             except Exception as label_error:
-                print(f"Label click also failed: {str(label_error)}")
+                logger.warning(f"Label click also failed: {str(label_error)}")
                 raise
         
         # Wait a moment for the input field to become active
         time.sleep(2)
         
         # Wait for the policy number input field and enter the policy number
-        print("Waiting for policy number input field...")
+        logger.info("Waiting for policy number input field...")
         policy_input_field = extended_wait.until(
             EC.presence_of_element_located((By.ID, "SBP_UserSelectedPol"))
         )
         policy_input_field.clear()
         policy_input_field.send_keys(request.policy_no)
-        print(f"Policy number entered: {request.policy_no}")
+        logger.info(f"Policy number entered: {request.policy_no}")
         
         # Wait a moment before clicking search
         time.sleep(1)
@@ -1204,7 +2211,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 5: Click the Search button
         # -------------------------------------------------------------------------
         
-        print("Waiting for search button...")
+        logger.info("Waiting for search button...")
         search_button = extended_wait.until(
             EC.element_to_be_clickable((By.ID, "sbp-search"))
         )
@@ -1215,26 +2222,25 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         
         # Click the search button
         search_button.click()
-        print("Search button clicked")
+        logger.info("Search button clicked")
    
         # Wait for search results page to load completely
         time.sleep(8)
         
-        print(f"After search - Title: {driver.title}")
-        print(f"After search - URL: {driver.current_url}")
+        log_nav(driver, "After search")
         
         # -------------------------------------------------------------------------
         # STEP 6: Find and click the policy button matching the policy number
         # -------------------------------------------------------------------------
         
-        print(f"Looking for policy button with policy number: {request.policy_no}")
+        logger.info(f"Looking for policy button with policy number: {request.policy_no}")
         
         # Wait for policy buttons to be present
         time.sleep(3)
         
         # Build the text to search for (format: "Auto {policy_no}")
         policy_text = f"Auto {request.policy_no}"
-        print(f"Searching for button containing text: {policy_text}")
+        logger.info(f"Searching for button containing text: {policy_text}")
         
         # Find the button that contains the specific policy number
         # Using XPath to find span with the policy text, then get its parent button
@@ -1244,7 +2250,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                     (By.XPATH, f"//span[contains(text(), 'Auto {request.policy_no}')]/ancestor::button")
                 )
             )
-            print(f"Found policy button: {policy_button.get_attribute('title')}")
+            logger.info(f"Found policy button: {policy_button.get_attribute('title')}")
             
             # Scroll to the button
             driver.execute_script("arguments[0].scrollIntoView(true);", policy_button)
@@ -1252,16 +2258,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             
             # Click the policy button
             driver.execute_script("arguments[0].click();", policy_button)
-            print(f"Clicked policy button for: {policy_text}")
+            logger.info(f"Clicked policy button for: {policy_text}")
             
             # Wait for policy details slider to load
             time.sleep(5)
             
-            print(f"After clicking policy - Title: {driver.title}")
-            print(f"After clicking policy - URL: {driver.current_url}")
+            log_nav(driver, "After clicking policy")
             
         except TimeoutException:
-            print(f"Could not find policy button for policy number: {request.policy_no}")
+            logger.warning(f"Could not find policy button for policy number: {request.policy_no}")
             raise HTTPException(
                 status_code=404,
                 detail=f"Policy number {request.policy_no} not found in search results"
@@ -1271,7 +2276,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 7: Click on "Drivers" button from the dropdown menu
         # -------------------------------------------------------------------------
         
-        print("Looking for 'Drivers' button in dropdown menu...")
+        logger.info("Looking for 'Drivers' button in dropdown menu...")
         
         try:
             # Find the Drivers button by looking for the paragraph tag with "Drivers" text
@@ -1279,7 +2284,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             drivers_button = extended_wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//p[contains(text(), 'Drivers')]/ancestor::div[@class='flex pv1 items-center w-100 ng-star-inserted']"))
             )
-            print("Found 'Drivers' button in dropdown")
+            logger.info("Found 'Drivers' button in dropdown")
             
             # Scroll to the button
             driver.execute_script("arguments[0].scrollIntoView(true);", drivers_button)
@@ -1287,16 +2292,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             
             # Click the Drivers button
             driver.execute_script("arguments[0].click();", drivers_button)
-            print("Clicked 'Drivers' button")
+            logger.info("Clicked 'Drivers' button")
             
             # Wait for the drivers section/sub-panel to load
             time.sleep(5)
             
-            print(f"After Drivers click - Title: {driver.title}")
-            print(f"After Drivers click - URL: {driver.current_url}")
+            log_nav(driver, "After Drivers click")
             
         except TimeoutException:
-            print("Could not find 'Drivers' button in dropdown")
+            logger.warning("Could not find 'Drivers' button in dropdown")
             raise HTTPException(
                 status_code=404,
                 detail="Drivers button not found in dropdown menu"
@@ -1310,14 +2314,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         
         if "add" in action_type_lower and "driver" in action_type_lower:
             # Handle "Add Driver" action
-            print("Looking for 'Add Driver' option in second dropdown...")
+            logger.info("Looking for 'Add Driver' option in second dropdown...")
             
             try:
                 # Find the "Add Driver" link by its data-pgr-id attribute
                 add_driver_button = extended_wait.until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "a[data-pgr-id='btnAddDriver']"))
                 )
-                print("Found 'Add Driver' option")
+                logger.info("Found 'Add Driver' option")
                 
                 # Scroll to the button
                 driver.execute_script("arguments[0].scrollIntoView(true);", add_driver_button)
@@ -1325,30 +2329,29 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the Add Driver button
                 driver.execute_script("arguments[0].click();", add_driver_button)
-                print("Clicked 'Add Driver' option")
+                logger.info("Clicked 'Add Driver' option")
                 
                 # Wait for the add driver page to load
                 time.sleep(5)
                 
-                print(f"After Add Driver click - Title: {driver.title}")
-                print(f"After Add Driver click - URL: {driver.current_url}")
+                log_nav(driver, "After Add Driver click")
                 
             except TimeoutException:
-                print("Could not find 'Add Driver' option")
+                logger.warning("Could not find 'Add Driver' option")
                 raise HTTPException(
                     status_code=404,
                     detail="Add Driver option not found in second dropdown"
                 )
         elif "update" in action_type_lower and "driver" in action_type_lower:
             # Handle "Update Driver" action
-            print("Looking for 'Update Driver' option in second dropdown...")
+            logger.info("Looking for 'Update Driver' option in second dropdown...")
             
             try:
                 # Find the "Update Driver" link by its data-pgr-id attribute
                 update_driver_button = extended_wait.until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "a[data-pgr-id='btnUpdateDriver']"))
                 )
-                print("Found 'Update Driver' option")
+                logger.info("Found 'Update Driver' option")
                 
                 # Scroll to the button
                 driver.execute_script("arguments[0].scrollIntoView(true);", update_driver_button)
@@ -1356,30 +2359,29 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the Update Driver button
                 driver.execute_script("arguments[0].click();", update_driver_button)
-                print("Clicked 'Update Driver' option")
+                logger.info("Clicked 'Update Driver' option")
                 
                 # Wait for the update driver page to load
                 time.sleep(5)
                 
-                print(f"After Update Driver click - Title: {driver.title}")
-                print(f"After Update Driver click - URL: {driver.current_url}")
+                log_nav(driver, "After Update Driver click")
                 
             except TimeoutException:
-                print("Could not find 'Update Driver' option")
+                logger.warning("Could not find 'Update Driver' option")
                 raise HTTPException(
                     status_code=404,
                     detail="Update Driver option not found in second dropdown"
                 )
         elif "replace" in action_type_lower:
             # Handle "Replace Vehicle" action
-            print("Looking for 'Replace Vehicle' option in second dropdown...")
+            logger.info("Looking for 'Replace Vehicle' option in second dropdown...")
             
             try:
                 # Find the "Replace Vehicle" link by its data-pgr-id attribute
                 replace_vehicle_button = extended_wait.until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "a[data-pgr-id='btnReplaceVehicle']"))
                 )
-                print("Found 'Replace Vehicle' option")
+                logger.info("Found 'Replace Vehicle' option")
                 
                 # Scroll to the button
                 driver.execute_script("arguments[0].scrollIntoView(true);", replace_vehicle_button)
@@ -1387,16 +2389,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the Replace Vehicle button
                 driver.execute_script("arguments[0].click();", replace_vehicle_button)
-                print("Clicked 'Replace Vehicle' option")
+                logger.info("Clicked 'Replace Vehicle' option")
                 
                 # Wait for the replace vehicle page to load
                 time.sleep(5)
                 
-                print(f"After Replace Vehicle click - Title: {driver.title}")
-                print(f"After Replace Vehicle click - URL: {driver.current_url}")
+                log_nav(driver, "After Replace Vehicle click")
                 
             except TimeoutException:
-                print("Could not find 'Replace Vehicle' option")
+                logger.warning("Could not find 'Replace Vehicle' option")
                 raise HTTPException(
                     status_code=404,
                     detail="Replace Vehicle option not found in second dropdown"
@@ -1404,14 +2405,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
         elif "add" in action_type_lower:
             # Handle "Add a Vehicle" action
-            print("Looking for 'Add a Vehicle' option in second dropdown...")
+            logger.info("Looking for 'Add a Vehicle' option in second dropdown...")
             
             try:
                 # Find the "Add a Vehicle" link by its data-pgr-id attribute
                 add_vehicle_button = extended_wait.until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "a[data-pgr-id='btnAddaVehicle']"))
                 )
-                print("Found 'Add a Vehicle' option")
+                logger.info("Found 'Add a Vehicle' option")
                 
                 # Scroll to the button
                 driver.execute_script("arguments[0].scrollIntoView(true);", add_vehicle_button)
@@ -1419,23 +2420,22 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the Add a Vehicle button
                 driver.execute_script("arguments[0].click();", add_vehicle_button)
-                print("Clicked 'Add a Vehicle' option")
+                logger.info("Clicked 'Add a Vehicle' option")
                 
                 # Wait for the add vehicle page to load
                 time.sleep(5)
                 
-                print(f"After Add a Vehicle click - Title: {driver.title}")
-                print(f"After Add a Vehicle click - URL: {driver.current_url}")
+                log_nav(driver, "After Add a Vehicle click")
                 
             except TimeoutException:
-                print("Could not find 'Add a Vehicle' option")
+                logger.warning("Could not find 'Add a Vehicle' option")
                 raise HTTPException(
                     status_code=404,
                     detail="Add a Vehicle option not found in second dropdown"
                 )
         else:
             # Invalid action_type
-            print(f"Invalid action_type: {request.action_type}")
+            logger.info(f"Invalid action_type: {request.action_type}")
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid action_type: '{request.action_type}'. Must be 'add driver', 'add vehical', or 'replace vehical'"
@@ -1445,7 +2445,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 9: Enter the date from payload (date_to_add_driver for driver actions, date_to_rep_vehical for vehicle actions)
         # -------------------------------------------------------------------------
         
-        print("Looking for date input field...")
+        logger.info("Looking for date input field...")
         
         # Track whether date was successfully entered
         date_entered = False
@@ -1454,17 +2454,17 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         if "driver" in action_type_lower:
             # Use date_to_add_driver for both "add driver" and "update driver" actions
             date_to_enter = request.date_to_add_driver
-            print(f"Date to enter (driver action): {date_to_enter}")
+            logger.info(f"Date to enter (driver action): {date_to_enter}")
         else:
             date_to_enter = request.date_to_rep_vehical
-            print(f"Date to enter (vehicle): {date_to_enter}")
+            logger.info(f"Date to enter (vehicle): {date_to_enter}")
         
         try:
             # Find the date input field by its data-pgr-id attribute
             date_input_field = extended_wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "input[data-pgr-id='txtChangeEffectiveDate']"))
             )
-            print("Found effective date input field")
+            logger.info("Found effective date input field")
             
             # Scroll to the input field
             driver.execute_script("arguments[0].scrollIntoView(true);", date_input_field)
@@ -1477,9 +2477,9 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # Enter the date from payload
             date_input_field.send_keys(date_to_enter)
             if "driver" in action_type_lower:
-                print(f"Entered date for driver action: {date_to_enter}")
+                logger.info(f"Entered date for driver action: {date_to_enter}")
             else:
-                print(f"Entered date for vehicle action: {date_to_enter}")
+                logger.info(f"Entered date for vehicle action: {date_to_enter}")
             
             # Trigger change events to ensure the field registers the input
             driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", date_input_field)
@@ -1492,15 +2492,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             entered_date = date_input_field.get_attribute('value')
             if entered_date:
                 date_entered = True
-                print(f"✅ Date successfully entered: {entered_date}")
+                logger.info(f"✅ Date successfully entered: {entered_date}")
             else:
-                print("⚠️ Date field is empty after entry attempt")
+                logger.warning("⚠️ Date field is empty after entry attempt")
             
-            print(f"After date entry - Title: {driver.title}")
-            print(f"After date entry - URL: {driver.current_url}")
+            log_nav(driver, "After date entry")
             
         except TimeoutException:
-            print("⚠️ Could not find effective date input field - continuing to next step")
+            logger.warning("⚠️ Could not find effective date input field - continuing to next step")
             # Don't stop the bot - just skip this step and continue
             # The date field might not be required in all scenarios
             date_entered = False
@@ -1511,51 +2510,51 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         
         # If date was skipped, wait a bit longer for page to be ready
         if not date_entered:
-            print("⚠️ Date was skipped - waiting extra time for page to be ready...")
+            logger.warning("⚠️ Date was skipped - waiting extra time for page to be ready...")
             time.sleep(5)  # Increased wait time when date is skipped
         
-        print("Looking for requester type dropdown...")
+        logger.info("Looking for requester type dropdown...")
         
         try:
             # Find the dropdown by its data-pgr-id attribute
             requester_dropdown = extended_wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlTranRequesterTypeCode']"))
             )
-            print("Found requester type dropdown")
+            logger.info("Found requester type dropdown")
             
             # Check if dropdown is enabled before trying to select
             is_enabled = requester_dropdown.is_enabled()
             if not is_enabled:
-                print("⚠️ Requester dropdown is disabled - waiting for it to become enabled...")
+                logger.warning("⚠️ Requester dropdown is disabled - waiting for it to become enabled...")
                 # Wait for dropdown to become enabled
                 WebDriverWait(driver, 10).until(
                     lambda d: requester_dropdown.is_enabled()
                 )
-                print("✅ Requester dropdown is now enabled")
+                logger.info("✅ Requester dropdown is now enabled")
             
             # Scroll to the dropdown with extra offset to avoid sticky headers
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", requester_dropdown)
             time.sleep(1)
             
             # IMPORTANT: Click the dropdown first to trigger option loading (especially when date is skipped)
-            print("Clicking dropdown to load options...")
+            logger.info("Clicking dropdown to load options...")
             try:
                 # Try clicking with Selenium first
                 requester_dropdown.click()
                 time.sleep(1)
             except Exception as e:
-                print(f"⚠️ Regular click failed: {str(e)} - trying JavaScript click...")
+                logger.warning(f"⚠️ Regular click failed: {str(e)} - trying JavaScript click...")
                 # Fallback to JavaScript click
                 driver.execute_script("arguments[0].focus(); arguments[0].click();", requester_dropdown)
                 time.sleep(1)
             
             # Wait for options to be loaded after clicking
-            print("Waiting for dropdown options to load after click...")
+            logger.info("Waiting for dropdown options to load after click...")
             time.sleep(2)
             
             # Wait for options to appear and select the second option (index 1)
             # NOTE: First option (index 0) is always empty, so we select the second option (index 1)
-            print("Waiting for options to appear...")
+            logger.info("Waiting for options to appear...")
             max_retries = 5
             retry_count = 0
             selected_option_value = None
@@ -1565,7 +2564,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             while retry_count < max_retries and not second_option:
                 # Get all options
                 all_options = requester_dropdown.find_elements(By.TAG_NAME, "option")
-                print(f"Found {len(all_options)} total options in dropdown")
+                logger.info(f"Found {len(all_options)} total options in dropdown")
                 
                 # Check if we have at least 2 options
                 if len(all_options) >= 2:
@@ -1578,13 +2577,13 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                     for i, option in enumerate(all_options):
                         opt_value = option.get_attribute('value')
                         opt_text = option.text.strip()
-                        print(f"Option {i}: value='{opt_value}', text='{opt_text}'")
+                        logger.info(f"Option {i}: value='{opt_value}', text='{opt_text}'")
                     
-                    print(f"✅ Selected second option (index 1): text='{selected_option_text}', value='{selected_option_value}'")
+                    logger.info(f"✅ Selected second option (index 1): text='{selected_option_text}', value='{selected_option_value}'")
                     break
                 else:
                     retry_count += 1
-                    print(f"⚠️ Not enough options found (need at least 2, found {len(all_options)}) - attempt {retry_count}/{max_retries}")
+                    logger.warning(f"⚠️ Not enough options found (need at least 2, found {len(all_options)}) - attempt {retry_count}/{max_retries}")
                     # Click again to ensure dropdown is open
                     driver.execute_script("arguments[0].click();", requester_dropdown)
                     time.sleep(1)
@@ -1594,7 +2593,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             
             # If value is empty, try selecting by index instead
             if not selected_option_value or not selected_option_value.strip():
-                print("⚠️ Second option has no value - will select by index instead")
+                logger.warning("⚠️ Second option has no value - will select by index instead")
                 selected_option_value = None  # Will use index-based selection
             
             # Use Selenium Select class for more reliable dropdown selection
@@ -1605,13 +2604,13 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 if selected_option_value and selected_option_value.strip():
                     # Try selecting by value first
                     select.select_by_value(selected_option_value)
-                    print(f"✅ Selected option using Select.select_by_value: {selected_option_text} (value: {selected_option_value})")
+                    logger.info(f"✅ Selected option using Select.select_by_value: {selected_option_text} (value: {selected_option_value})")
                 else:
                     # Select by index (second option = index 1)
                     select.select_by_index(1)
-                    print(f"✅ Selected second option using Select.select_by_index(1): {selected_option_text}")
+                    logger.info(f"✅ Selected second option using Select.select_by_index(1): {selected_option_text}")
             except Exception as e:
-                print(f"⚠️ Select method failed: {str(e)} - trying JavaScript method...")
+                logger.warning(f"⚠️ Select method failed: {str(e)} - trying JavaScript method...")
                 # Fallback to JavaScript - select by index
                 driver.execute_script("""
                     var select = arguments[0];
@@ -1646,20 +2645,20 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 selected_value = verification_result.get('selectedValue', '')
                 selected_text = verification_result.get('selectedText', '')
                 
-                print(f"Verified selected index: {selected_index}")
-                print(f"Verified selected value: {selected_value}")
+                logger.info(f"Verified selected index: {selected_index}")
+                logger.info(f"Verified selected value: {selected_value}")
                 if selected_text:
-                    print(f"Verified selected text: {selected_text}")
+                    logger.info(f"Verified selected text: {selected_text}")
                 
                 # Verify that index 1 is selected (second option)
                 if selected_index is not None and int(selected_index) == 1:
-                    print(f"✅ Selection verified successfully: Index 1 selected (value: {selected_value}, text: {selected_text})")
+                    logger.info(f"✅ Selection verified successfully: Index 1 selected (value: {selected_value}, text: {selected_text})")
                 elif selected_option_value and selected_value == selected_option_value:
-                    print(f"✅ Selection verified successfully: {selected_option_text} (value: {selected_value})")
+                    logger.info(f"✅ Selection verified successfully: {selected_option_text} (value: {selected_value})")
                 else:
-                    print(f"⚠️ Selection verification - index: {selected_index}, value: {selected_value}, expected value: {selected_option_value}")
+                    logger.warning(f"⚠️ Selection verification - index: {selected_index}, value: {selected_value}, expected value: {selected_option_value}")
                     # Try one more time with JavaScript - select by index
-                    print("Retrying selection with enhanced JavaScript (by index)...")
+                    logger.info("Retrying selection with enhanced JavaScript (by index)...")
                     driver.execute_script("""
                         var select = document.querySelector("select[data-pgr-id='ddlTranRequesterTypeCode']");
                         if (select) {
@@ -1689,16 +2688,16 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                     
                     selected_index = verification_result.get('selectedIndex')
                     selected_value = verification_result.get('selectedValue', '')
-                    print(f"After retry - verified selected index: {selected_index}, value: {selected_value}")
+                    logger.info(f"After retry - verified selected index: {selected_index}, value: {selected_value}")
                     
                     if selected_index is not None and int(selected_index) != 1:
-                        print(f"⚠️ Selection verification - expected index 1, got index {selected_index}")
-                        print("⚠️ Continuing despite selection verification issue...")
+                        logger.warning(f"⚠️ Selection verification - expected index 1, got index {selected_index}")
+                        logger.warning("⚠️ Continuing despite selection verification issue...")
                     else:
-                        print(f"✅ Selection verified after retry: Index {selected_index} selected")
+                        logger.info(f"✅ Selection verified after retry: Index {selected_index} selected")
                         
             except StaleElementReferenceException:
-                print("⚠️ Stale element reference during verification - using JavaScript instead...")
+                logger.warning("⚠️ Stale element reference during verification - using JavaScript instead...")
                 # Re-find dropdown and verify using JavaScript
                 verification_result = driver.execute_script("""
                     var select = document.querySelector("select[data-pgr-id='ddlTranRequesterTypeCode']");
@@ -1711,19 +2710,18 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 """)
                 selected_index = verification_result.get('selectedIndex')
                 selected_value = verification_result.get('selectedValue', '')
-                print(f"✅ Verified via JavaScript - Index: {selected_index}, Value: {selected_value}")
+                logger.info(f"✅ Verified via JavaScript - Index: {selected_index}, Value: {selected_value}")
             except Exception as e:
-                print(f"⚠️ Error during verification: {str(e)} - continuing anyway...")
+                logger.warning(f"⚠️ Error during verification: {str(e)} - continuing anyway...")
                 # Don't fail the entire process if verification has issues
             
             # Wait a moment for the selection to register with the page
             time.sleep(2)
             
-            print(f"After dropdown selection - Title: {driver.title}")
-            print(f"After dropdown selection - URL: {driver.current_url}")
+            log_nav(driver, "After dropdown selection")
             
         except TimeoutException:
-            print("Could not find requester type dropdown")
+            logger.warning("Could not find requester type dropdown")
             raise HTTPException(
                 status_code=404,
                 detail="Requester type dropdown not found"
@@ -1733,15 +2731,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 11: Enter the agent contact nam
         # -------------------------------------------------------------------------
         
-        print("Looking for agent contact name input field...")
-        print(f"Agent name to enter: {request.agent_name}")
+        logger.info("Looking for agent contact name input field...")
+        logger.info(f"Agent name to enter: {request.agent_name}")
         
         try:
             # Find the agent contact name input field by its data-pgr-id attribute
             agent_name_field = extended_wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "input[data-pgr-id='txtAgencyContactName']"))
             )
-            print("Found agent contact name input field")
+            logger.info("Found agent contact name input field")
             
             # Scroll to the input field
             driver.execute_script("arguments[0].scrollIntoView(true);", agent_name_field)
@@ -1757,23 +2755,21 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                     input.dispatchEvent(new Event('blur', { bubbles: true }));
                 }
             """, request.agent_name)
-            print(f"Entered agent name: {request.agent_name}")
+            logger.info(f"Entered agent name: {request.agent_name}")
             
             # Wait a moment for the field to register
             time.sleep(2)
             
-            print(f"After agent name entry - Title: {driver.title}")
-
-            print(f"After agent name entry - URL: {driver.current_url}")
+            log_nav(driver, "After agent name entry")
             
         except TimeoutException:
-            print("Could not find agent contact name input field")
+            logger.warning("Could not find agent contact name input field")
             raise HTTPException(
                 status_code=404,
                 detail="Agent contact name input field not found"
             )
         except Exception as e:
-            print(f"Error entering agent name: {str(e)}")
+            logger.error(f"Error entering agent name: {str(e)}")
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to enter agent name: {str(e)}"
@@ -1783,14 +2779,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 12: Select the first option from agent email address dropdown
         # -------------------------------------------------------------------------
         
-        print("Looking for agent email address dropdown...")
+        logger.info("Looking for agent email address dropdown...")
         
         try:
             # Find the dropdown by its data-pgr-id attribute
             agent_email_dropdown = extended_wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlSelectERDAgentEmailAddress']"))
             )
-            print("Found agent email address dropdown")
+            logger.info("Found agent email address dropdown")
             
             # Scroll to the dropdown with extra offset to avoid sticky headers
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", agent_email_dropdown)
@@ -1805,20 +2801,22 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             select = Select(agent_email_dropdown)
             select.select_by_index(1)
             
-            # Get the selected option text for logging
-            selected_option = select.first_selected_option
-            selected_text = selected_option.text.strip()
-            selected_value = selected_option.get_attribute('value')
-            print(f"Selected first option: {selected_text} (value: {selected_value})")
+            # Get the selected option text for logging (debug only - log-only round-trips)
+            if DEBUG:
+                selected_option = select.first_selected_option
+                selected_text = selected_option.text.strip()
+                selected_value = selected_option.get_attribute('value')
+                logger.info(f"Selected first option: {selected_text} (value: {selected_value})")
+            else:
+                logger.info("Selected first option")
             
             # Wait a moment for the selection to register
             time.sleep(2)
             
-            print(f"After email dropdown selection - Title: {driver.title}")
-            print(f"After email dropdown selection - URL: {driver.current_url}")
+            log_nav(driver, "After email dropdown selection")
             
         except TimeoutException:
-            print("Could not find agent email address dropdown")
+            logger.warning("Could not find agent email address dropdown")
             raise HTTPException(
                 status_code=404,
                 detail="Agent email address dropdown not found"
@@ -1828,14 +2826,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 13: Click the "Continue" button
         # -------------------------------------------------------------------------
         
-        print("Looking for 'Continue' button...")
+        logger.info("Looking for 'Continue' button...")
         
         try:
             # Find the Continue button by its data-pgr-id attribute
             continue_button = extended_wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-pgr-id='btnContinue']"))
+                EC.element_to_be_clickable(CONTINUE_BUTTON_LOCATOR)
             )
-            print("Found 'Continue' button")
+            logger.info("Found 'Continue' button")
             
             # Scroll to the button
             driver.execute_script("arguments[0].scrollIntoView(true);", continue_button)
@@ -1843,16 +2841,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             
             # Click the Continue button
             driver.execute_script("arguments[0].click();", continue_button)
-            print("Clicked 'Continue' button")
+            logger.info("Clicked 'Continue' button")
             
             # Wait for the new page to load
             time.sleep(5)
             
-            print(f"After Continue click - Title: {driver.title}")
-            print(f"After Continue click - URL: {driver.current_url}")
+            log_nav(driver, "After Continue click")
             
         except TimeoutException:
-            print("Could not find 'Continue' button")
+            logger.warning("Could not find 'Continue' button")
             raise HTTPException(
                 status_code=404,
                 detail="Continue button not found"
@@ -1864,15 +2861,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         
         if "driver" in action_type_lower:
             # Handle driver actions - enter driver first name
-            print("Looking for driver first name input field...")
-            print(f"Driver first name to enter: {request.driver_first_name}")
+            logger.info("Looking for driver first name input field...")
+            logger.info(f"Driver first name to enter: {request.driver_first_name}")
             
             try:
                 # Find the driver first name input field by its data-pgr-id attribute
                 driver_first_name_field = extended_wait.until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "input[data-pgr-id='txtDriverFirstName']"))
                 )
-                print("Found driver first name input field")
+                logger.info("Found driver first name input field")
                 
                 # Scroll to the input field
                 driver.execute_script("arguments[0].scrollIntoView(true);", driver_first_name_field)
@@ -1884,7 +2881,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Enter the driver first name from payload
                 driver_first_name_field.send_keys(request.driver_first_name)
-                print(f"Entered driver first name: {request.driver_first_name}")
+                logger.info(f"Entered driver first name: {request.driver_first_name}")
                 
                 # Trigger change events to ensure the field registers the input
                 driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", driver_first_name_field)
@@ -1893,11 +2890,10 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 # Wait a moment for the field to register
                 time.sleep(2)
                 
-                print(f"After driver first name entry - Title: {driver.title}")
-                print(f"After driver first name entry - URL: {driver.current_url}")
+                log_nav(driver, "After driver first name entry")
                 
             except TimeoutException:
-                print("Could not find driver first name input field")
+                logger.warning("Could not find driver first name input field")
                 raise HTTPException(
                     status_code=404,
                     detail="Driver first name input field not found"
@@ -1907,15 +2903,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # STEP 15: Enter driver last name (for driver actions)
             # -------------------------------------------------------------------------
             
-            print("Looking for driver last name input field...")
-            print(f"Driver last name to enter: {request.driver_last_name}")
+            logger.info("Looking for driver last name input field...")
+            logger.info(f"Driver last name to enter: {request.driver_last_name}")
             
             try:
                 # Find the driver last name input field by its data-pgr-id attribute
                 driver_last_name_field = extended_wait.until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "input[data-pgr-id='txtDriverLastName']"))
                 )
-                print("Found driver last name input field")
+                logger.info("Found driver last name input field")
                 
                 # Scroll to the input field
                 driver.execute_script("arguments[0].scrollIntoView(true);", driver_last_name_field)
@@ -1927,7 +2923,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Enter the driver last name from payload
                 driver_last_name_field.send_keys(request.driver_last_name)
-                print(f"Entered driver last name: {request.driver_last_name}")
+                logger.info(f"Entered driver last name: {request.driver_last_name}")
                 
                 # Trigger change events to ensure the field registers the input
                 driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", driver_last_name_field)
@@ -1936,11 +2932,10 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 # Wait a moment for the field to register
                 time.sleep(2)
                 
-                print(f"After driver last name entry - Title: {driver.title}")
-                print(f"After driver last name entry - URL: {driver.current_url}")
+                log_nav(driver, "After driver last name entry")
                 
             except TimeoutException:
-                print("Could not find driver last name input field")
+                logger.warning("Could not find driver last name input field")
                 raise HTTPException(
                     status_code=404,
                     detail="Driver last name input field not found"
@@ -1950,15 +2945,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # STEP 16: Enter driver date of birth (for driver actions)
             # -------------------------------------------------------------------------
             
-            print("Looking for driver date of birth input field...")
-            print(f"Driver DOB to enter: {request.driver_dob}")
+            logger.info("Looking for driver date of birth input field...")
+            logger.info(f"Driver DOB to enter: {request.driver_dob}")
             
             try:
                 # Find the driver DOB input field by its data-pgr-id attribute
                 driver_dob_field = extended_wait.until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "input[data-pgr-id='txtDriverDOB']"))
                 )
-                print("Found driver date of birth input field")
+                logger.info("Found driver date of birth input field")
                 
                 # Scroll to the input field
                 driver.execute_script("arguments[0].scrollIntoView(true);", driver_dob_field)
@@ -1970,7 +2965,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Enter the driver DOB from payload (format: mm/dd/yyyy)
                 driver_dob_field.send_keys(request.driver_dob)
-                print(f"Entered driver date of birth: {request.driver_dob}")
+                logger.info(f"Entered driver date of birth: {request.driver_dob}")
                 
                 # Trigger change events to ensure the field registers the input
                 driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", driver_dob_field)
@@ -1979,11 +2974,10 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 # Wait a moment for the field to register
                 time.sleep(2)
                 
-                print(f"After driver DOB entry - Title: {driver.title}")
-                print(f"After driver DOB entry - URL: {driver.current_url}")
+                log_nav(driver, "After driver DOB entry")
                 
             except TimeoutException:
-                print("Could not find driver date of birth input field")
+                logger.warning("Could not find driver date of birth input field")
                 raise HTTPException(
                     status_code=404,
                     detail="Driver date of birth input field not found"
@@ -1993,18 +2987,18 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # STEP 17: Select driver gender (Male or Female) based on payload
             # -------------------------------------------------------------------------
             
-            print("Looking for driver gender radio buttons...")
+            logger.info("Looking for driver gender radio buttons...")
             driver_gender_lower = request.driver_gender.lower()
-            print(f"Driver gender to select: {request.driver_gender}")
+            logger.info(f"Driver gender to select: {request.driver_gender}")
             
             try:
                 if "male" in driver_gender_lower or driver_gender_lower == "m":
                     # Select Male radio button
-                    print("Selecting Male gender...")
+                    logger.info("Selecting Male gender...")
                     male_radio = extended_wait.until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, "input[data-pgr-id='radDriverSex60'][value='M']"))
                     )
-                    print("Found Male radio button")
+                    logger.info("Found Male radio button")
                     
                     # Scroll to the radio button
                     driver.execute_script("arguments[0].scrollIntoView(true);", male_radio)
@@ -2012,18 +3006,18 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                     
                     # Click the Male radio button
                     driver.execute_script("arguments[0].click();", male_radio)
-                    print("Selected Male gender")
+                    logger.info("Selected Male gender")
                     
                     # Wait a moment for the selection to register
                     time.sleep(2)
                     
                 else:
                     # Select Female radio button (default if not male)
-                    print("Selecting Female gender...")
+                    logger.info("Selecting Female gender...")
                     female_radio = extended_wait.until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, "input[data-pgr-id='radDriverSex60'][value='F']"))
                     )
-                    print("Found Female radio button")
+                    logger.info("Found Female radio button")
                     
                     # Scroll to the radio button
                     driver.execute_script("arguments[0].scrollIntoView(true);", female_radio)
@@ -2031,16 +3025,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                     
                     # Click the Female radio button
                     driver.execute_script("arguments[0].click();", female_radio)
-                    print("Selected Female gender")
+                    logger.info("Selected Female gender")
                     
                     # Wait a moment for the selection to register
                     time.sleep(2)
                 
-                print(f"After gender selection - Title: {driver.title}")
-                print(f"After gender selection - URL: {driver.current_url}")
+                log_nav(driver, "After gender selection")
                 
             except TimeoutException:
-                print("Could not find driver gender radio buttons")
+                logger.warning("Could not find driver gender radio buttons")
                 raise HTTPException(
                     status_code=404,
                     detail="Driver gender radio buttons not found"
@@ -2050,18 +3043,18 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # STEP 18: Select driver marital status (Married or Single) based on payload
             # -------------------------------------------------------------------------
             
-            print("Looking for driver marital status radio buttons...")
+            logger.info("Looking for driver marital status radio buttons...")
             driver_marital_status_lower = request.driver_marital_status.lower()
-            print(f"Driver marital status to select: {request.driver_marital_status}")
+            logger.info(f"Driver marital status to select: {request.driver_marital_status}")
             
             try:
                 if "married" in driver_marital_status_lower or driver_marital_status_lower == "m":
                     # Select Married radio button
-                    print("Selecting Married marital status...")
+                    logger.info("Selecting Married marital status...")
                     married_radio = extended_wait.until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, "input[data-pgr-id='radDriverMaritalStatus70'][value='M']"))
                     )
-                    print("Found Married radio button")
+                    logger.info("Found Married radio button")
                     
                     # Scroll to the radio button
                     driver.execute_script("arguments[0].scrollIntoView(true);", married_radio)
@@ -2069,18 +3062,18 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                     
                     # Click the Married radio button
                     driver.execute_script("arguments[0].click();", married_radio)
-                    print("Selected Married marital status")
+                    logger.info("Selected Married marital status")
                     
                     # Wait a moment for the selection to register
                     time.sleep(2)
                     
                 else:
                     # Select Single radio button (default if not married)
-                    print("Selecting Single marital status...")
+                    logger.info("Selecting Single marital status...")
                     single_radio = extended_wait.until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, "input[data-pgr-id='radDriverMaritalStatus70'][value='S']"))
                     )
-                    print("Found Single radio button")
+                    logger.info("Found Single radio button")
                     
                     # Scroll to the radio button
                     driver.execute_script("arguments[0].scrollIntoView(true);", single_radio)
@@ -2088,16 +3081,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                     
                     # Click the Single radio button
                     driver.execute_script("arguments[0].click();", single_radio)
-                    print("Selected Single marital status")
+                    logger.info("Selected Single marital status")
                     
                     # Wait a moment for the selection to register
                     time.sleep(2)
                 
-                print(f"After marital status selection - Title: {driver.title}")
-                print(f"After marital status selection - URL: {driver.current_url}")
+                log_nav(driver, "After marital status selection")
                 
             except TimeoutException:
-                print("Could not find driver marital status radio buttons")
+                logger.warning("Could not find driver marital status radio buttons")
                 raise HTTPException(
                     status_code=404,
                     detail="Driver marital status radio buttons not found"
@@ -2107,14 +3099,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # STEP 19: Select "Other relation" from driver relationship dropdown
             # -------------------------------------------------------------------------
             
-            print("Looking for driver relationship dropdown...")
+            logger.info("Looking for driver relationship dropdown...")
             
             try:
                 # Wait for the dropdown to be present
                 extended_wait.until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlDriverRelationship']"))
                 )
-                print("Found driver relationship dropdown")
+                logger.info("Found driver relationship dropdown")
                 
                 # Use JavaScript to find, scroll, focus, click, and select - all in one to avoid stale element references
                 other_relation_value = "O"
@@ -2144,29 +3136,30 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 # Wait a moment for the selection to register
                 time.sleep(2)
                 
-                # Verify selection using JavaScript to avoid stale element references
-                try:
-                    selected_value = driver.execute_script("""
-                        var select = document.querySelector("select[data-pgr-id='ddlDriverRelationship']");
-                        return select ? select.value : null;
-                    """)
-                    print(f"Selected 'Other relation' option (value: {other_relation_value})")
-                    print(f"Verified selected value: {selected_value}")
-                except Exception as e:
-                    print(f"Could not verify selection (element may have been updated): {e}")
-                    # Selection likely succeeded, continue anyway
+                logger.info(f"Selected 'Other relation' option (value: {other_relation_value})")
+                
+                # Verify selection using JavaScript to avoid stale element references (debug only - log-only round-trip)
+                if DEBUG:
+                    try:
+                        selected_value = driver.execute_script("""
+                            var select = document.querySelector("select[data-pgr-id='ddlDriverRelationship']");
+                            return select ? select.value : null;
+                        """)
+                        logger.info(f"Verified selected value: {selected_value}")
+                    except Exception as e:
+                        logger.warning(f"Could not verify selection (element may have been updated): {e}")
+                        # Selection likely succeeded, continue anyway
                 
-                print(f"After relationship selection - Title: {driver.title}")
-                print(f"After relationship selection - URL: {driver.current_url}")
+                log_nav(driver, "After relationship selection")
                 
             except TimeoutException:
-                print("Could not find driver relationship dropdown")
+                logger.warning("Could not find driver relationship dropdown")
                 raise HTTPException(
                     status_code=404,
                     detail="Driver relationship dropdown not found"
                 )
             except Exception as e:
-                print(f"Error selecting driver relationship: {str(e)}")
+                logger.error(f"Error selecting driver relationship: {str(e)}")
                 raise HTTPException(
                     status_code=500,
                     detail=f"Failed to select driver relationship: {str(e)}"
@@ -2176,14 +3169,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # STEP 20: Select "3 years or more" from driver years licensed range dropdown
             # -------------------------------------------------------------------------
             
-            print("Looking for driver years licensed range dropdown...")
+            logger.info("Looking for driver years licensed range dropdown...")
             
             try:
                 # Wait for dropdown to be present
                 extended_wait.until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlDriverYearsLicensedRange']"))
                 )
-                print("Found driver years licensed range dropdown")
+                logger.info("Found driver years licensed range dropdown")
                 
                 # Use JavaScript for all operations to avoid stale element references
                 three_years_value = "3"
@@ -2215,7 +3208,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 # Wait for JavaScript to execute and selection to register
                 time.sleep(2)
                 
-                print(f"Selected '3 years or more' option (value: {three_years_value})")
+                logger.info(f"Selected '3 years or more' option (value: {three_years_value})")
                 
                 # Verify selection using JavaScript to avoid stale element references
                 try:
@@ -2233,15 +3226,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                     selected_index = verification_result.get('selectedIndex')
                     selected_text = verification_result.get('selectedText', '')
                     
-                    print(f"Verified selected value: {selected_value}")
+                    logger.info(f"Verified selected value: {selected_value}")
                     if selected_index is not None:
-                        print(f"Verified selected index: {selected_index}")
+                        logger.info(f"Verified selected index: {selected_index}")
                     if selected_text:
-                        print(f"Verified selected text: {selected_text}")
+                        logger.info(f"Verified selected text: {selected_text}")
                     
                     # If selection didn't work, try again with direct value setting
                     if selected_value != three_years_value:
-                        print(f"⚠️ Selection mismatch - expected '{three_years_value}', got '{selected_value}' - retrying...")
+                        logger.warning(f"⚠️ Selection mismatch - expected '{three_years_value}', got '{selected_value}' - retrying...")
                         driver.execute_script("""
                             var select = document.querySelector("select[data-pgr-id='ddlDriverYearsLicensedRange']");
                             if (select) {
@@ -2253,23 +3246,22 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                             }
                         """, three_years_value)
                         time.sleep(1)
-                        print("Retried selection")
+                        logger.info("Retried selection")
                         
                 except Exception as e:
-                    print(f"⚠️ Could not verify selection: {e} - continuing anyway")
+                    logger.warning(f"⚠️ Could not verify selection: {e} - continuing anyway")
                     # Selection likely succeeded, continue anyway
                 
-                print(f"After years licensed selection - Title: {driver.title}")
-                print(f"After years licensed selection - URL: {driver.current_url}")
+                log_nav(driver, "After years licensed selection")
                 
             except TimeoutException:
-                print("Could not find driver years licensed range dropdown")
+                logger.warning("Could not find driver years licensed range dropdown")
                 raise HTTPException(
                     status_code=404,
                     detail="Driver years licensed range dropdown not found"
                 )
             except Exception as e:
-                print(f"Error selecting driver years licensed range: {str(e)}")
+                logger.error(f"Error selecting driver years licensed range: {str(e)}")
                 raise HTTPException(
                     status_code=500,
                     detail=f"Failed to select driver years licensed range: {str(e)}"
@@ -2279,14 +3271,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # STEP 21: Click "No" radio button for driver additional insured indicator
             # -------------------------------------------------------------------------
             
-            print("Looking for driver additional insured indicator 'No' radio button...")
+            logger.info("Looking for driver additional insured indicator 'No' radio button...")
             
             try:
                 # Find the "No" radio button by its data-pgr-id and value attributes
                 no_radio = extended_wait.until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "input[data-pgr-id='radDriverAdditionalInsuredIndicator150'][value='N']"))
                 )
-                print("Found 'No' radio button for additional insured indicator")
+                logger.info("Found 'No' radio button for additional insured indicator")
                 
                 # Scroll to the radio button
                 driver.execute_script("arguments[0].scrollIntoView(true);", no_radio)
@@ -2294,16 +3286,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the "No" radio button
                 driver.execute_script("arguments[0].click();", no_radio)
-                print("Clicked 'No' for driver additional insured indicator")
+                logger.info("Clicked 'No' for driver additional insured indicator")
                 
                 # Wait a moment for the selection to register
                 time.sleep(2)
                 
-                print(f"After additional insured indicator selection - Title: {driver.title}")
-                print(f"After additional insured indicator selection - URL: {driver.current_url}")
+                log_nav(driver, "After additional insured indicator selection")
                 
             except TimeoutException:
-                print("Could not find driver additional insured indicator 'No' radio button")
+                logger.warning("Could not find driver additional insured indicator 'No' radio button")
                 raise HTTPException(
                     status_code=404,
                     detail="Driver additional insured indicator 'No' radio button not found"
@@ -2313,14 +3304,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # STEP 22: Click the "Continue" button and wait for new page to load
             # -------------------------------------------------------------------------
             
-            print("Looking for 'Continue' button...")
+            logger.info("Looking for 'Continue' button...")
             
             try:
                 # Find the Continue button by its data-pgr-id attribute
                 continue_button = extended_wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-pgr-id='btnContinue']"))
+                    EC.element_to_be_clickable(CONTINUE_BUTTON_LOCATOR)
                 )
-                print("Found 'Continue' button")
+                logger.info("Found 'Continue' button")
                 
                 # Scroll to the button
                 driver.execute_script("arguments[0].scrollIntoView(true);", continue_button)
@@ -2328,16 +3319,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the Continue button
                 driver.execute_script("arguments[0].click();", continue_button)
-                print("Clicked 'Continue' button")
+                logger.info("Clicked 'Continue' button")
                 
                 # Wait for the new page to load
                 time.sleep(5)
                 
-                print(f"After Continue click - Title: {driver.title}")
-                print(f"After Continue click - URL: {driver.current_url}")
+                log_nav(driver, "After Continue click")
                 
             except TimeoutException:
-                print("Could not find 'Continue' button")
+                logger.warning("Could not find 'Continue' button")
                 raise HTTPException(
                     status_code=404,
                     detail="Continue button not found"
@@ -2347,20 +3337,20 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # STEP 23: Click "No" radio button for driver violations
             # -------------------------------------------------------------------------
             
-            print("Looking for driver violations 'No' radio button...")
+            logger.info("Looking for driver violations 'No' radio button...")
             
             try:
                 # Find the "No" label by its data-pgr-id, then find the associated input element
                 no_label = extended_wait.until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "pui-input-label[data-pgr-id='lblDriverHasViolationsUINo']"))
                 )
-                print("Found 'No' label for driver violations")
+                logger.info("Found 'No' label for driver violations")
                 
                 # Find the associated input element (radio button) in the ancestor label
                 no_input = extended_wait.until(
                     EC.element_to_be_clickable((By.XPATH, "//pui-input-label[@data-pgr-id='lblDriverHasViolationsUINo']/ancestor::label//input"))
                 )
-                print("Found 'No' input element for driver violations")
+                logger.info("Found 'No' input element for driver violations")
                 
                 # Scroll to the input element
                 driver.execute_script("arguments[0].scrollIntoView(true);", no_input)
@@ -2368,16 +3358,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the "No" input element
                 driver.execute_script("arguments[0].click();", no_input)
-                print("Clicked 'No' for driver violations")
+                logger.info("Clicked 'No' for driver violations")
                 
                 # Wait a moment for the selection to register
                 time.sleep(2)
                 
-                print(f"After driver violations selection - Title: {driver.title}")
-                print(f"After driver violations selection - URL: {driver.current_url}")
+                log_nav(driver, "After driver violations selection")
                 
             except TimeoutException:
-                print("Could not find driver violations 'No' radio button")
+                logger.warning("Could not find driver violations 'No' radio button")
                 raise HTTPException(
                     status_code=404,
                     detail="Driver violations 'No' radio button not found"
@@ -2387,7 +3376,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # STEP 24: Click checkbox to mark it
             # -------------------------------------------------------------------------
             
-            print("Looking for checkbox to mark...")
+            logger.info("Looking for checkbox to mark...")
             
             try:
                 # Find the checkbox wrapper div, then find the associated input element
@@ -2395,7 +3384,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 checkbox_wrapper = extended_wait.until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "div.checkbox.relative"))
                 )
-                print("Found checkbox wrapper")
+                logger.info("Found checkbox wrapper")
                 
                 # Find the associated input element (checkbox) - it might be in a parent label or nearby
                 # Try to find input[type='checkbox'] in the same label or nearby
@@ -2407,7 +3396,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                         EC.element_to_be_clickable((By.XPATH, "//div[@class='checkbox relative']/ancestor::label//input[@type='checkbox']"))
                     )
                 
-                print("Found checkbox input element")
+                logger.info("Found checkbox input element")
                 
                 # Scroll to the checkbox
                 driver.execute_script("arguments[0].scrollIntoView(true);", checkbox_input)
@@ -2415,26 +3404,25 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the checkbox to mark it
                 driver.execute_script("arguments[0].click();", checkbox_input)
-                print("Clicked checkbox to mark it")
+                logger.info("Clicked checkbox to mark it")
                 
                 # Wait a moment for the selection to register
                 time.sleep(2)
                 
-                print(f"After checkbox click - Title: {driver.title}")
-                print(f"After checkbox click - URL: {driver.current_url}")
+                log_nav(driver, "After checkbox click")
                 
             except (TimeoutException, NoSuchElementException) as e:
-                print(f"Could not find checkbox: {str(e)}")
+                logger.warning(f"Could not find checkbox: {str(e)}")
                 # Try alternative approach - find first checkbox on the page after violations
                 try:
-                    print("Trying alternative approach to find checkbox...")
+                    logger.info("Trying alternative approach to find checkbox...")
                     checkbox_input = extended_wait.until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='checkbox']"))
                     )
                     driver.execute_script("arguments[0].scrollIntoView(true);", checkbox_input)
                     time.sleep(1)
                     driver.execute_script("arguments[0].click();", checkbox_input)
-                    print("Clicked checkbox (alternative method)")
+                    logger.info("Clicked checkbox (alternative method)")
                     time.sleep(2)
                 except Exception as e2:
                     raise HTTPException(
@@ -2446,14 +3434,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # STEP 25: Click the "Continue" button and wait for next page to load
             # -------------------------------------------------------------------------
             
-            print("Looking for 'Continue' button...")
+            logger.info("Looking for 'Continue' button...")
             
             try:
                 # Find the Continue button by its data-pgr-id attribute
                 continue_button = extended_wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-pgr-id='btnContinue']"))
+                    EC.element_to_be_clickable(CONTINUE_BUTTON_LOCATOR)
                 )
-                print("Found 'Continue' button")
+                logger.info("Found 'Continue' button")
                 
                 # Scroll to the button
                 driver.execute_script("arguments[0].scrollIntoView(true);", continue_button)
@@ -2461,16 +3449,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the Continue button
                 driver.execute_script("arguments[0].click();", continue_button)
-                print("Clicked 'Continue' button")
+                logger.info("Clicked 'Continue' button")
                 
                 # Wait for the new page to load
                 time.sleep(5)
                 
-                print(f"After Continue click - Title: {driver.title}")
-                print(f"After Continue click - URL: {driver.current_url}")
+                log_nav(driver, "After Continue click")
                 
             except TimeoutException:
-                print("Could not find 'Continue' button")
+                logger.warning("Could not find 'Continue' button")
                 raise HTTPException(
                     status_code=404,
                     detail="Continue button not found"
@@ -2480,7 +3467,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # STEP 26: Scrape final page data (Add/Update driver, Premium details)
             # -------------------------------------------------------------------------
             
-            print("Scraping final page data for driver action...")
+            logger.info("Scraping final page data for driver action...")
             
             try:
                 # Wait for the final review page to fully load
@@ -2490,12 +3477,12 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 driver_action_text = ""
                 try:
                     driver_action_element = extended_wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "#transaction-messaging ps-markdown"))
+                        EC.presence_of_element_located(REVIEW_MESSAGE_LOCATOR)
                     )
                     driver_action_text = driver_action_element.text.strip()
-                    print(f"Driver action: {driver_action_text}")
+                    logger.info(f"Driver action: {driver_action_text}")
                 except TimeoutException:
-                    print("Could not find driver action field")
+                    logger.warning("Could not find driver action field")
                     driver_action_text = "Not found"
                 
                 # Scrape Total Premium Increase
@@ -2507,48 +3494,48 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                         if "Total premium increase:" in element.text:
                             # Extract just the amount (e.g., "$792.52")
                             total_premium_increase = element.text.replace("Total premium increase:", "").strip()
-                            print(f"Total premium increase: {total_premium_increase}")
+                            logger.info(f"Total premium increase: {total_premium_increase}")
                             break
                     if not total_premium_increase:
                         total_premium_increase = "Not found"
                 except Exception as e:
-                    print(f"Could not find total premium increase: {str(e)}")
+                    logger.warning(f"Could not find total premium increase: {str(e)}")
                     total_premium_increase = "Not found"
                 
                 # Scrape New Policy Premium
                 new_policy_premium = ""
                 try:
                     new_premium_element = extended_wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "li[data-pgr-id='txtNewPremium'] span.review-item-embed"))
+                        EC.presence_of_element_located(NEW_PREMIUM_LOCATOR)
                     )
                     new_policy_premium = new_premium_element.text.strip()
-                    print(f"New policy premium: {new_policy_premium}")
+                    logger.info(f"New policy premium: {new_policy_premium}")
                 except TimeoutException:
-                    print("Could not find new policy premium field")
+                    logger.warning("Could not find new policy premium field")
                     new_policy_premium = "Not found"
                 
                 # Scrape Policy Start Date
                 policy_start_date = ""
                 try:
                     start_date_element = extended_wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "li[data-pgr-id='txtStartsOn'] span"))
+                        EC.presence_of_element_located(START_DATE_LOCATOR)
                     )
                     policy_start_date = start_date_element.text.strip()
-                    print(f"Policy starts on: {policy_start_date}")
+                    logger.info(f"Policy starts on: {policy_start_date}")
                 except TimeoutException:
-                    print("Could not find policy start date field")
+                    logger.warning("Could not find policy start date field")
                     policy_start_date = "Not found"
                 
                 # Scrape New Premium Description
                 new_premium_description = ""
                 try:
                     premium_description_element = extended_wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "pui-p[data-pgr-id='msgInternalMessage0'] p"))
+                        EC.presence_of_element_located(PREMIUM_DESCRIPTION_LOCATOR)
                     )
                     new_premium_description = premium_description_element.text.strip()
-                    print(f"New premium description: {new_premium_description}")
+                    logger.info(f"New premium description: {new_premium_description}")
                 except TimeoutException:
-                    print("Could not find new premium description field")
+                    logger.warning("Could not find new premium description field")
                     new_premium_description = "Not found"
                 
                 # Scrape Transaction Name (Add driver, Update driver, etc.)
@@ -2558,9 +3545,9 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                         EC.presence_of_element_located((By.CSS_SELECTOR, "pui-h4[data-pgr-id='ttlTransactionName'] h4"))
                     )
                     transaction_name = transaction_name_element.text.strip()
-                    print(f"Transaction name: {transaction_name}")
+                    logger.info(f"Transaction name: {transaction_name}")
                 except TimeoutException:
-                    print("Could not find transaction name field")
+                    logger.warning("Could not find transaction name field")
                     transaction_name = "Not found"
                 
                 # Scrape Definition List fields (Effective date, Requester, Agent name, Policy period)
@@ -2574,7 +3561,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                     definition_list = extended_wait.until(
                         EC.presence_of_element_located((By.CSS_SELECTOR, "dl[pui-definition-list]"))
                     )
-                    print("Found definition list")
+                    logger.info("Found definition list")
                     
                     # Find all definition terms (dt) and definitions (dd)
                     terms = definition_list.find_elements(By.CSS_SELECTOR, "dt[pui-definition-term]")
@@ -2588,37 +3575,37 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                             
                             if "Effective date:" in term_text:
                                 effective_date = definition_text
-                                print(f"Effective date: {effective_date}")
+                                logger.info(f"Effective date: {effective_date}")
                             elif "Requester:" in term_text:
                                 requester = definition_text
-                                print(f"Requester: {requester}")
+                                logger.info(f"Requester: {requester}")
                             elif "Agent name:" in term_text:
                                 agent_name_scraped = definition_text
-                                print(f"Agent name: {agent_name_scraped}")
+                                logger.info(f"Agent name: {agent_name_scraped}")
                             elif "Policy period:" in term_text:
                                 policy_period = definition_text
-                                print(f"Policy period: {policy_period}")
+                                logger.info(f"Policy period: {policy_period}")
                                 
                 except TimeoutException:
-                    print("Could not find definition list")
+                    logger.warning("Could not find definition list")
                     effective_date = "Not found"
                     requester = "Not found"
                     agent_name_scraped = "Not found"
                     policy_period = "Not found"
                 except Exception as e:
-                    print(f"Error scraping definition list: {str(e)}")
+                    logger.error(f"Error scraping definition list: {str(e)}")
                     effective_date = "Not found"
                     requester = "Not found"
                     agent_name_scraped = "Not found"
                     policy_period = "Not found"
                 
-                print("=" * 60)
-                print("✅ Step 26 completed successfully!")
-                print(f"✅ Scraped all final page data for driver action")
-                print("=" * 60)
+                logger.debug("=" * 60)
+                logger.info("✅ Step 26 completed successfully!")
+                logger.info(f"✅ Scraped all final page data for driver action")
+                logger.debug("=" * 60)
                 
             except Exception as e:
-                print(f"Error scraping final page data: {str(e)}")
+                logger.error(f"Error scraping final page data: {str(e)}")
                 raise HTTPException(
                     status_code=500,
                     detail=f"Error scraping final page data: {str(e)}"
@@ -2632,14 +3619,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             payment_schedule = []
             installment_fee_note = "Not found"
             
-            print("Looking for 'View upcoming payments' link...")
+            logger.info("Looking for 'View upcoming payments' link...")
             
             try:
                 # Find and click the "View upcoming payments" link
                 view_payments_link = extended_wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//span[contains(text(), 'View upcoming payments')]"))
+                    lambda d: find_element_by_text(d, "span", VIEW_PAYMENTS_LINK_TEXT)
                 )
-                print("Found 'View upcoming payments' link")
+                logger.info("Found 'View upcoming payments' link")
                 
                 # Scroll to the link
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", view_payments_link)
@@ -2647,101 +3634,61 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the link using JavaScript
                 driver.execute_script("arguments[0].click();", view_payments_link)
-                print("Clicked 'View upcoming payments' link")
+                logger.info("Clicked 'View upcoming payments' link")
                 
                 # Wait for the popup/modal to appear
                 time.sleep(2)
                 
                 # Wait for the payment schedule table to be visible
-                payment_table = extended_wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "table[data-pgr-id='tblPaymentSchedule']"))
+                extended_wait.until(
+                    EC.presence_of_element_located(PAYMENT_SCHEDULE_TABLE_LOCATOR)
                 )
-                print("Payment schedule table loaded")
+                logger.info("Payment schedule table loaded")
                 
                 # Scrape the payment schedule table rows
-                payment_schedule = []
-                table_rows = driver.find_elements(By.CSS_SELECTOR, "table[data-pgr-id='tblPaymentSchedule'] tbody tr")
-                
-                print(f"Found {len(table_rows)} payment schedule rows")
-                
-                for index, row in enumerate(table_rows):
-                    try:
-                        # Extract all td elements from the row
-                        cells = row.find_elements(By.TAG_NAME, "td")
-                        
-                        if len(cells) >= 4:
-                            # Extract date (from the span inside first td)
-                            date_element = cells[0].find_element(By.TAG_NAME, "span")
-                            date = date_element.text.strip()
-                            
-                            # Extract current amount
-                            current_amount = cells[1].text.strip()
-                            
-                            # Extract new amount
-                            new_amount = cells[2].text.strip()
-                            
-                            # Extract difference
-                            difference = cells[3].text.strip()
-                            
-                            payment_schedule.append({
-                                "date": date,
-                                "current_amount": current_amount,
-                                "new_amount": new_amount,
-                                "difference": difference
-                            })
-                            
-                            print(f"Row {index + 1}: {date} | Current: {current_amount} | New: {new_amount} | Diff: {difference}")
-                            
-                    except Exception as e:
-                        print(f"Error parsing row {index + 1}: {str(e)}")
-                        continue
+                payment_schedule = scrape_payment_schedule_rows(driver)
                 
                 # Scrape the installment fee note
                 installment_fee_note = ""
                 try:
-                    fee_note_element = driver.find_element(By.CSS_SELECTOR, "pui-p[data-pgr-id='ttlServiceChargeDescription'] p")
+                    fee_note_element = driver.find_element(*INSTALLMENT_FEE_NOTE_LOCATOR)
                     installment_fee_note = fee_note_element.text.strip()
-                    print(f"Installment fee note: {installment_fee_note}")
+                    logger.info(f"Installment fee note: {installment_fee_note}")
                 except Exception as e:
-                    print(f"Could not find installment fee note: {str(e)}")
+                    logger.warning(f"Could not find installment fee note: {str(e)}")
                     installment_fee_note = "Not found"
                 
-                # Close the payment schedule popup
+                # Close the payment schedule popup (click and wait for it to disappear in one call)
                 try:
-                    close_button = driver.find_element(By.CSS_SELECTOR, "button[aria-label='Close Modal']")
-                    print("Found close button for payment schedule popup")
-                    
-                    # Click the close button using JavaScript
-                    driver.execute_script("arguments[0].click();", close_button)
-                    print("Clicked close button - popup closed")
-                    
-                    # Wait for popup to close
-                    time.sleep(1)
+                    if close_modal(driver, PAYMENT_SCHEDULE_TABLE_SELECTOR):
+                        logger.info("Clicked close button - popup closed")
+                    else:
+                        logger.warning("⚠️ Clicked close button but popup is still visible")
                     
                 except Exception as e:
-                    print(f"Could not find or click close button: {str(e)}")
+                    logger.warning(f"Could not find or click close button: {str(e)}")
                 
-                print("=" * 60)
-                print("✅ Step 27 completed successfully!")
-                print(f"✅ Scraped {len(payment_schedule)} payment schedule entries")
-                print("=" * 60)
+                logger.debug("=" * 60)
+                logger.info("✅ Step 27 completed successfully!")
+                logger.info(f"✅ Scraped {len(payment_schedule)} payment schedule entries")
+                logger.debug("=" * 60)
                 
             except TimeoutException:
-                print("⚠️ Could not find 'View upcoming payments' link or payment schedule table - skipping this step")
+                logger.warning("⚠️ Could not find 'View upcoming payments' link or payment schedule table - skipping this step")
                 # Set empty payment schedule and continue
                 payment_schedule = []
                 installment_fee_note = "Not found"
-                print("=" * 60)
-                print("⚠️ Step 27 skipped - payment schedule not available")
-                print("=" * 60)
+                logger.debug("=" * 60)
+                logger.warning("⚠️ Step 27 skipped - payment schedule not available")
+                logger.debug("=" * 60)
             except Exception as e:
-                print(f"⚠️ Error scraping payment schedule: {str(e)} - skipping this step")
+                logger.warning(f"⚠️ Error scraping payment schedule: {str(e)} - skipping this step")
                 # Set empty payment schedule and continue
                 payment_schedule = []
                 installment_fee_note = "Not found"
-                print("=" * 60)
-                print("⚠️ Step 27 skipped - payment schedule not available")
-                print("=" * 60)
+                logger.debug("=" * 60)
+                logger.warning("⚠️ Step 27 skipped - payment schedule not available")
+                logger.debug("=" * 60)
             
             # -------------------------------------------------------------------------
             # STEP 28: Click "effect on rate for the entire policy period" link and scrape coverage comparison data
@@ -2754,14 +3701,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 "vehicle_details": []
             }
             
-            print("Looking for 'effect on rate for the entire policy period' link...")
+            logger.info("Looking for 'effect on rate for the entire policy period' link...")
             
             try:
                 # Find and click the effect on rate link
                 effect_on_rate_link = extended_wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//span[contains(text(), 'effect on rate for the entire policy period')]"))
+                    lambda d: find_element_by_text(d, "span", EFFECT_ON_RATE_LINK_TEXT)
                 )
-                print("Found 'effect on rate for the entire policy period' link")
+                logger.info("Found 'effect on rate for the entire policy period' link")
                 
                 # Scroll to the link
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", effect_on_rate_link)
@@ -2769,16 +3716,16 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the link using JavaScript
                 driver.execute_script("arguments[0].click();", effect_on_rate_link)
-                print("Clicked 'effect on rate for the entire policy period' link")
+                logger.info("Clicked 'effect on rate for the entire policy period' link")
                 
                 # Wait for the modal to appear
                 time.sleep(2)
                 
                 # Wait for the modal content to be visible
                 extended_wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "pui-modal-body"))
+                    EC.presence_of_element_located(MODAL_BODY_LOCATOR)
                 )
-                print("Effect on rate modal loaded")
+                logger.info("Effect on rate modal loaded")
                 
                 # Initialize data structure for storing all scraped data
                 effect_on_rate_data = {
@@ -2787,193 +3734,57 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                     "vehicle_details": []
                 }
                 
-                # Scrape Vehicle Summary section (top section with vehicle totals)
-                print("Scraping vehicle summary section...")
+                # Scrape vehicle summary, total policy rate and detailed vehicle breakdowns in one call
+                logger.info("Scraping effect on rate data...")
                 try:
-                    vehicle_summary_elements = driver.find_elements(By.XPATH, "//pui-h3[contains(text(), 'Vehicle')]/following-sibling::div//pui-p[@fw='7']")
-                    
-                    for vehicle_elem in vehicle_summary_elements:
-                        vehicle_name = vehicle_elem.text.strip()
-                        
-                        # Find the corresponding table for this vehicle
-                        parent_div = vehicle_elem.find_element(By.XPATH, "./ancestor::div[contains(@class, 'ng-star-inserted')]")
-                        table_rows = parent_div.find_elements(By.CSS_SELECTOR, "table tbody tr")
-                        
-                        if len(table_rows) > 0:
-                            cells = table_rows[0].find_elements(By.TAG_NAME, "td")
-                            if len(cells) >= 2:
-                                current_value = cells[0].text.strip()
-                                new_value = cells[1].text.strip()
-                                
-                                effect_on_rate_data["vehicle_summary"].append({
-                                    "vehicle_name": vehicle_name,
-                                    "current_rate": current_value,
-                                    "new_rate": new_value
-                                })
-                                print(f"Vehicle: {vehicle_name} | Current: {current_value} | New: {new_value}")
-                                
+                    effect_on_rate_data = scrape_effect_on_rate(driver)
                 except Exception as e:
-                    print(f"Error scraping vehicle summary: {str(e)}")
+                    logger.error(f"Error scraping effect on rate data: {str(e)}")
                 
-                # Scrape Total Policy Rate section
-                print("Scraping total policy rate...")
+                # Close the effect on rate modal (click and wait for it to disappear in one call)
                 try:
-                    total_policy_elements = driver.find_elements(By.XPATH, "//pui-p[contains(text(), 'Total Policy Rate')]")
-                    
-                    if total_policy_elements:
-                        parent_div = total_policy_elements[0].find_element(By.XPATH, "./ancestor::div[contains(@class, 'ng-star-inserted')]")
-                        table_rows = parent_div.find_elements(By.CSS_SELECTOR, "table tbody tr")
-                        
-                        if len(table_rows) > 0:
-                            cells = table_rows[0].find_elements(By.TAG_NAME, "td")
-                            if len(cells) >= 2:
-                                current_value = cells[0].text.strip()
-                                new_value = cells[1].text.strip()
-                                
-                                effect_on_rate_data["total_policy_rate"] = {
-                                    "current_rate": current_value,
-                                    "new_rate": new_value
-                                }
-                                print(f"Total Policy Rate | Current: {current_value} | New: {new_value}")
-                                
-                except Exception as e:
-                    print(f"Error scraping total policy rate: {str(e)}")
-                
-                # Scrape detailed vehicle breakdowns (after the hr separator)
-                print("Scraping detailed vehicle breakdowns...")
-                try:
-                    # Find all vehicle headers (h4 elements with vehicle names)
-                    vehicle_headers = driver.find_elements(By.XPATH, "//pui-hr/following-sibling::pui-h4[@class='db f4 fw6 lh-title mv2 outline-0 pgr-dark-blue ng-star-inserted']")
-                    
-                    for vehicle_header in vehicle_headers:
-                        vehicle_name = vehicle_header.text.strip()
-                        print(f"Processing detailed breakdown for: {vehicle_name}")
-                        
-                        vehicle_data = {
-                            "vehicle_name": vehicle_name,
-                            "coverages": []
-                        }
-                        
-                        # Find all coverage sections for this vehicle
-                        # Look for pui-p elements with fw="7" that follow this h4
-                        current_element = vehicle_header
-                        
-                        while True:
-                            try:
-                                # Find the next sibling div
-                                next_sibling = current_element.find_element(By.XPATH, "./following-sibling::div[1]")
-                                
-                                # Check if this is another vehicle header (stop if so)
-                                try:
-                                    next_header = next_sibling.find_element(By.XPATH, "./preceding-sibling::pui-h4[1]")
-                                    if next_header != vehicle_header:
-                                        break
-                                except:
-                                    pass
-                                
-                                # Try to find coverage name in this div
-                                try:
-                                    coverage_name_elem = next_sibling.find_element(By.CSS_SELECTOR, "pui-p[fw='7'] p span")
-                                    coverage_name = coverage_name_elem.text.strip()
-                                    
-                                    # Find the table in this div
-                                    table = next_sibling.find_element(By.CSS_SELECTOR, "table")
-                                    table_rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
-                                    
-                                    # Extract current and new values
-                                    current_coverage = ""
-                                    current_value = ""
-                                    new_coverage = ""
-                                    new_value = ""
-                                    
-                                    for row_index, row in enumerate(table_rows):
-                                        cells = row.find_elements(By.TAG_NAME, "td")
-                                        
-                                        if row_index == 0 and len(cells) >= 2:
-                                            # First row contains coverage details
-                                            current_coverage = cells[0].text.strip()
-                                            new_coverage = cells[1].text.strip()
-                                        elif row_index == 1 and len(cells) >= 2:
-                                            # Second row contains values
-                                            current_value = cells[0].text.strip()
-                                            new_value = cells[1].text.strip()
-                                    
-                                    vehicle_data["coverages"].append({
-                                        "coverage_name": coverage_name,
-                                        "current_coverage": current_coverage,
-                                        "current_value": current_value,
-                                        "new_coverage": new_coverage,
-                                        "new_value": new_value
-                                    })
-                                    
-                                    print(f"  - {coverage_name}: Current ${current_value} -> New ${new_value}")
-                                    
-                                except:
-                                    pass
-                                
-                                current_element = next_sibling
-                                
-                            except:
-                                break
-                        
-                        effect_on_rate_data["vehicle_details"].append(vehicle_data)
-                        
-                except Exception as e:
-                    print(f"Error scraping vehicle details: {str(e)}")
-                
-                # Close the effect on rate modal
-                try:
-                    close_button = driver.find_element(By.CSS_SELECTOR, "button[aria-label='Close Modal']")
-                    print("Found close button for effect on rate modal")
-                    
-                    # Scroll to button
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", close_button)
-                    time.sleep(1)
-                    
-                    # Click the close button using JavaScript
-                    driver.execute_script("arguments[0].click();", close_button)
-                    print("Clicked close button - effect on rate modal closed")
-                    
-                    # Wait for modal to close
-                    time.sleep(1)
+                    if close_modal(driver, MODAL_BODY_SELECTOR):
+                        logger.info("Clicked close button - effect on rate modal closed")
+                    else:
+                        logger.warning("⚠️ Clicked close button but effect on rate modal is still visible")
                     
                 except Exception as e:
-                    print(f"Could not find or click close button: {str(e)}")
+                    logger.warning(f"Could not find or click close button: {str(e)}")
                 
-                print("=" * 60)
-                print("✅ Step 28 completed successfully!")
-                print(f"✅ Scraped effect on rate data for {len(effect_on_rate_data['vehicle_details'])} vehicles")
-                print("=" * 60)
+                logger.debug("=" * 60)
+                logger.info("✅ Step 28 completed successfully!")
+                logger.info(f"✅ Scraped effect on rate data for {len(effect_on_rate_data['vehicle_details'])} vehicles")
+                logger.debug("=" * 60)
                 
             except TimeoutException:
-                print("⚠️ Could not find 'effect on rate for the entire policy period' link or modal - skipping this step")
-                print("=" * 60)
-                print("⚠️ Step 28 skipped - effect on rate data not available")
-                print("=" * 60)
+                logger.warning("⚠️ Could not find 'effect on rate for the entire policy period' link or modal - skipping this step")
+                logger.debug("=" * 60)
+                logger.warning("⚠️ Step 28 skipped - effect on rate data not available")
+                logger.debug("=" * 60)
             except Exception as e:
-                print(f"⚠️ Error scraping effect on rate data: {str(e)} - skipping this step")
-                print("=" * 60)
-                print("⚠️ Step 28 skipped - effect on rate data not available")
-                print("=" * 60)
+                logger.warning(f"⚠️ Error scraping effect on rate data: {str(e)} - skipping this step")
+                logger.debug("=" * 60)
+                logger.warning("⚠️ Step 28 skipped - effect on rate data not available")
+                logger.debug("=" * 60)
             
             # -------------------------------------------------------------------------
             # STEP 29: Click "Save this update for later" checkbox
             # -------------------------------------------------------------------------
             
-            print("Looking for 'Save this update for later' checkbox...")
+            logger.info("Looking for 'Save this update for later' checkbox...")
             
             try:
                 # Find the label by its data-pgr-id, then find the associated input element
                 save_label = extended_wait.until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "pui-input-label[data-pgr-id='lblQuoteBeforeContinueOptionSave this update for later']"))
                 )
-                print("Found 'Save this update for later' label")
+                logger.info("Found 'Save this update for later' label")
                 
                 # Find the associated input element (checkbox) in the ancestor label
                 save_checkbox = extended_wait.until(
                     EC.element_to_be_clickable((By.XPATH, "//pui-input-label[@data-pgr-id='lblQuoteBeforeContinueOptionSave this update for later']/ancestor::label//input"))
                 )
-                print("Found 'Save this update for later' checkbox")
+                logger.info("Found 'Save this update for later' checkbox")
                 
                 # Scroll to the checkbox
                 driver.execute_script("arguments[0].scrollIntoView(true);", save_checkbox)
@@ -2981,16 +3792,15 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the checkbox to mark it
                 driver.execute_script("arguments[0].click();", save_checkbox)
-                print("Clicked 'Save this update for later' checkbox")
+                logger.info("Clicked 'Save this update for later' checkbox")
                 
                 # Wait a moment for the selection to register
                 time.sleep(2)
                 
-                print(f"After checkbox click - Title: {driver.title}")
-                print(f"After checkbox click - URL: {driver.current_url}")
+                log_nav(driver, "After checkbox click")
                 
             except TimeoutException:
-                print("Could not find 'Save this update for later' checkbox")
+                logger.warning("Could not find 'Save this update for later' checkbox")
                 raise HTTPException(
                     status_code=404,
                     detail="Save this update for later checkbox not found"
@@ -3000,14 +3810,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # STEP 30: Click the final "Continue" button and wait for next page to load, then end bot
             # -------------------------------------------------------------------------
             
-            print("Looking for final 'Continue' button...")
+            logger.info("Looking for final 'Continue' button...")
             
             try:
                 # Find the Continue button by its data-pgr-id attribute
                 continue_button = extended_wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-pgr-id='btnContinue']"))
+                    EC.element_to_be_clickable(CONTINUE_BUTTON_LOCATOR)
                 )
-                print("Found final 'Continue' button")
+                logger.info("Found final 'Continue' button")
                 
                 # Scroll to the button
                 driver.execute_script("arguments[0].scrollIntoView(true);", continue_button)
@@ -3015,15 +3825,14 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the Continue button
                 driver.execute_script("arguments[0].click();", continue_button)
-                print("Clicked final 'Continue' button")
+                logger.info("Clicked final 'Continue' button")
                 
                 # Wait for the new page to load
                 time.sleep(5)
                 
-                print(f"After final Continue click - Title: {driver.title}")
-                print(f"After final Continue click - URL: {driver.current_url}")
+                log_nav(driver, "After final Continue click")
                 
-                print("=" * 60)
+                logger.debug("=" * 60)
                 log_thread(thread_id, "✅ Step 30 completed successfully!")
                 log_thread(thread_id, "✅ Final page loaded - Bot process completed")
                 log_thread(thread_id, "=" * 60)
@@ -3066,21 +3875,12 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             
             log_thread(thread_id, "📦 Preparing to send response to client...")
             
-            # Save session data to base profile before closing browser
-            if driver:
-                try:
-                    wait_for_session_save(driver)
-                except Exception as e:
-                    log_thread(thread_id, f"⚠️  Warning: Error saving session: {str(e)}")
-            
-            # Close browser before returning response to avoid hanging
+            # Return browser to the pool before returning response (closed after DRIVER_MAX_USES runs)
             if driver:
                 try:
-                    log_thread(thread_id, "🔧 Closing browser...")
-                    driver.quit()
-                    log_thread(thread_id, "✅ Browser closed successfully")
+                    release_driver(driver, thread_id)
                 except Exception as e:
-                    log_thread(thread_id, f"⚠️  Warning: Error closing browser: {str(e)}")
+                    log_thread(thread_id, f"⚠️  Warning: Error releasing browser: {str(e)}")
             
             log_thread(thread_id, "=" * 60)
             log_thread(thread_id, "✅ Sending response to client")
@@ -3093,24 +3893,21 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             return response_data
         elif "replace" in action_type_lower:
             # Only perform vehicle selection for "replace vehical" action
-            print("Looking for vehicle list...")
-            print(f"Vehicle name to match: {request.vehicle_name_to_replace}")
+            logger.info("Looking for vehicle list...")
+            logger.info(f"Vehicle name to match: {request.vehicle_name_to_replace}")
             
             try:
-                # Wait for vehicle radio buttons to be present
-                time.sleep(3)
-                
-                # Find all radio buttons for vehicles
-                vehicle_radios = driver.find_elements(By.CSS_SELECTOR, "input[data-pgr-id='radTranVehicleIndex0']")
-                print(f"Found {len(vehicle_radios)} vehicle options")
-                
-                if not vehicle_radios:
-                    raise Exception("No vehicle options found")
+                # Wait for the vehicle radio buttons to render (the list used to rely on the implicit wait)
+                with no_implicit_wait(driver):
+                    vehicle_radios = extended_wait.until(
+                        lambda d: d.find_elements(By.CSS_SELECTOR, "input[data-pgr-id='radTranVehicleIndex0']"),
+                        message="No vehicle options found"
+                    )
+                logger.info(f"Found {len(vehicle_radios)} vehicle options")
                 
                 # Search for the matching vehicle
                 best_match = None
                 best_match_score = 0
-                vehicle_name_upper = request.vehicle_name_to_replace.upper()
                 
                 for radio in vehicle_radios:
                     try:
@@ -3121,7 +3918,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                         vehicle_name_element = parent_label.find_element(By.CSS_SELECTOR, "pui-input-label.ng-star-inserted ps-markdown")
                         vehicle_name = vehicle_name_element.text.strip().upper()
                         
-                        print(f"Checking vehicle: {vehicle_name}")
+                        logger.info(f"Checking vehicle: {vehicle_name}")
                         
                         # Calculate match score (count matching words/characters)
                         # Check if the payload vehicle name is contained in the full vehicle name
@@ -3134,7 +3931,7 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                             payload_words = vehicle_name_upper.split()
                             match_score = sum(1 for word in payload_words if word in vehicle_name)
                         
-                        print(f"  Match score: {match_score}")
+                        logger.info(f"  Match score: {match_score}")
                         
                         if match_score > best_match_score:
                             best_match_score = match_score
@@ -3144,13 +3941,13 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                             }
                             
                     except Exception as e:
-                        print(f"  Error processing vehicle option: {e}")
+                        logger.error(f"  Error processing vehicle option: {e}")
                         continue
                 
                 if not best_match or best_match_score == 0:
                     raise Exception(f"No matching vehicle found for: {request.vehicle_name_to_replace}")
                 
-                print(f"Best match found: {best_match['name']} (score: {best_match_score})")
+                logger.info(f"Best match found: {best_match['name']} (score: {best_match_score})")
                 
                 # Scroll to the radio button
                 driver.execute_script("arguments[0].scrollIntoView(true);", best_match['radio'])
@@ -3158,52 +3955,49 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 
                 # Click the radio button
                 driver.execute_script("arguments[0].click();", best_match['radio'])
-                print(f"Selected vehicle: {best_match['name']}")
+                logger.info(f"Selected vehicle: {best_match['name']}")
                 
                 # Wait for selection to register
                 time.sleep(2)
                 
-                print(f"After vehicle selection - Title: {driver.title}")
-                print(f"After vehicle selection - URL: {driver.current_url}")
+                log_nav(driver, "After vehicle selection")
                 
             except Exception as e:
-                print(f"Error finding/selecting vehicle: {str(e)}")
+                logger.error(f"Error finding/selecting vehicle: {str(e)}")
                 raise HTTPException(
                     status_code=404,
                     detail=f"Could not find matching vehicle for: {request.vehicle_name_to_replace}"
                 )
         else:
-            print("Skipping vehicle selection (add vehicle action - no existing vehicle to select)")
+            logger.info("Skipping vehicle selection (add vehicle action - no existing vehicle to select)")
         
         # -------------------------------------------------------------------------
         # STEP 15: Click the "Continue" button after vehicle selection
         # -------------------------------------------------------------------------
         
-        print("Looking for 'Continue' button after vehicle selection...")
+        logger.info("Looking for 'Continue' button after vehicle selection...")
         
         try:
             # Find the Continue button by its data-pgr-id attribute
             continue_button = extended_wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-pgr-id='btnContinue']"))
+                EC.element_to_be_clickable(CONTINUE_BUTTON_LOCATOR)
             )
-            print("Found 'Continue' button")
+            logger.info("Found 'Continue' button")
             
             # Scroll to the button
-            driver.execute_script("arguments[0].scrollIntoView(true);", continue_button)
-            time.sleep(1)
+            scroll_into_view_if_needed(driver, continue_button)
             
             # Click the Continue button
             driver.execute_script("arguments[0].click();", continue_button)
-            print("Clicked 'Continue' button")
+            logger.info("Clicked 'Continue' button")
             
-            # Wait for the new page to load
-            time.sleep(5)
+            # Wait for the new page to load and the next step's field to appear
+            wait_until_ready(driver, VEHICLE_YEAR_DROPDOWN_LOCATOR)
             
-            print(f"After Continue click - Title: {driver.title}")
-            print(f"After Continue click - URL: {driver.current_url}")
+            log_nav(driver, "After Continue click")
             
         except TimeoutException:
-            print("Could not find 'Continue' button after vehicle selection")
+            logger.warning("Could not find 'Continue' button after vehicle selection")
             raise HTTPException(
                 status_code=404,
                 detail="Continue button not found after vehicle selection"
@@ -3213,19 +4007,18 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 16: Select the vehicle year from dropdown
         # -------------------------------------------------------------------------
         
-        print("Looking for vehicle year dropdown...")
-        print(f"Year to select: {request.vehical_year}")
+        logger.info("Looking for vehicle year dropdown...")
+        logger.info(f"Year to select: {request.vehical_year}")
         
         try:
             # Find the year dropdown by its data-pgr-id attribute
             year_dropdown = extended_wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlVehicleModelYearTemp']"))
+                EC.presence_of_element_located(VEHICLE_YEAR_DROPDOWN_LOCATOR)
             )
-            print("Found vehicle year dropdown")
+            logger.info("Found vehicle year dropdown")
             
             # Scroll to the dropdown with extra offset to avoid sticky headers
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", year_dropdown)
-            time.sleep(1)
+            scroll_into_view_if_needed(driver, year_dropdown)
             
             # Use JavaScript click to avoid interception by sticky headers
             driver.execute_script("arguments[0].focus();", year_dropdown)
@@ -3233,185 +4026,99 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             time.sleep(1)
             
             # Use JavaScript to set the value and trigger change events
-            driver.execute_script("""
-                var select = arguments[0];
-                select.value = arguments[1];
-                select.dispatchEvent(new Event('change', { bubbles: true }));
-                select.dispatchEvent(new Event('input', { bubbles: true }));
-                select.dispatchEvent(new Event('blur', { bubbles: true }));
-            """, year_dropdown, request.vehical_year)
+            selected_value = set_select_value(driver, year_dropdown, request.vehical_year)
             
-            print(f"Selected year: {request.vehical_year}")
+            logger.info(f"Selected year: {request.vehical_year}")
             
-            # Verify selection
-            selected_value = year_dropdown.get_attribute('value')
-            print(f"Verified selected value: {selected_value}")
+            # Verify selection (value read back by the same script call)
+            logger.info(f"Verified selected value: {selected_value}")
             
             # Wait a moment for the selection to register
             time.sleep(2)
             
-            print(f"After year selection - Title: {driver.title}")
-            print(f"After year selection - URL: {driver.current_url}")
+            log_nav(driver, "After year selection")
             
         except TimeoutException:
-            print("Could not find vehicle year dropdown")
+            logger.warning("Could not find vehicle year dropdown")
             raise HTTPException(
                 status_code=404,
                 detail="Vehicle year dropdown not found"
             )
         
         # -------------------------------------------------------------------------
-        # STEP 17: Select Yes/No for conversion van/pickup/SUV question
-        # -------------------------------------------------------------------------
-        
-        print("Looking for conversion van/pickup/SUV radio buttons...")
-        
-        # Normalize the input value (accept yes/Yes/Y or no/No/N)
-        answer_upper = request.vehical_is_suv_van_pickup.upper().strip()
-        if answer_upper in ['YES', 'Y']:
-            selected_value = 'Y'
-            selected_text = 'Yes'
-        elif answer_upper in ['NO', 'N']:
-            selected_value = 'N'
-            selected_text = 'No'
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid value for vehical_is_suv_van_pickup: {request.vehical_is_suv_van_pickup}. Must be 'yes' or 'no'"
-            )
-        
-        print(f"Selecting: {selected_text} (value: {selected_value})")
-        
-        try:
-            # Find the radio button by value attribute
-            radio_button = extended_wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, f"input[name='VehicleIsConversionVan10'][value='{selected_value}']"))
-            )
-            print(f"Found {selected_text} radio button")
-            
-            # Scroll to the radio button
-            driver.execute_script("arguments[0].scrollIntoView(true);", radio_button)
-            time.sleep(1)
-            
-            # Click the radio button
-            driver.execute_script("arguments[0].click();", radio_button)
-            print(f"Selected: {selected_text}")
-            
-            # Wait for selection to register
-            time.sleep(2)
-            
-            print(f"After conversion van selection - Title: {driver.title}")
-            print(f"After conversion van selection - URL: {driver.current_url}")
-            
-        except TimeoutException:
-            print(f"Could not find {selected_text} radio button")
-            raise HTTPException(
-                status_code=404,
-                detail=f"Conversion van/pickup/SUV radio button ({selected_text}) not found"
-            )
-        
-        # -------------------------------------------------------------------------
-        # STEP 18: Select Yes/No for kit car/buggy/classic question
+        # STEPS 17-19: Answer the conversion van, kit car and VIN radio questions
         # -------------------------------------------------------------------------
+        # The three questions sit on the same page and do not re-render each other,
+        # so they are answered together in one script call instead of three step blocks
         
-        print("Looking for kit car/buggy/classic radio buttons...")
+        logger.info("Looking for conversion van / kit car / VIN knowledge radio buttons...")
         
-        # Normalize the input value (accept yes/Yes/Y or no/No/N)
-        answer_upper2 = request.vehical_is_kitcar_buggy_classic.upper().strip()
-        if answer_upper2 in ['YES', 'Y']:
-            selected_value2 = 'Y'
-            selected_text2 = 'Yes'
-        elif answer_upper2 in ['NO', 'N']:
-            selected_value2 = 'N'
-            selected_text2 = 'No'
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid value for vehical_is_kitcar_buggy_classic: {request.vehical_is_kitcar_buggy_classic}. Must be 'yes' or 'no'"
-            )
+        selected_value, selected_text = YES_NO_MAP[answer_upper]
+        selected_value2, selected_text2 = YES_NO_MAP[answer_upper2]
         
-        print(f"Selecting: {selected_text2} (value: {selected_value2})")
+        logger.info(f"Selecting: conversion van={selected_text}, kit car={selected_text2}, VIN known=No (always)")
         
-        try:
-            # Find the radio button by value attribute
-            radio_button2 = extended_wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, f"input[name='VehicleIsSpecialType20'][value='{selected_value2}']"))
-            )
-            print(f"Found {selected_text2} radio button")
-            
-            # Scroll to the radio button
-            driver.execute_script("arguments[0].scrollIntoView(true);", radio_button2)
-            time.sleep(1)
-            
-            # Click the radio button
-            driver.execute_script("arguments[0].click();", radio_button2)
-            print(f"Selected: {selected_text2}")
-            
-            # Wait for selection to register
-            time.sleep(2)
-            
-            print(f"After kit car/buggy/classic selection - Title: {driver.title}")
-            print(f"After kit car/buggy/classic selection - URL: {driver.current_url}")
-            
-        except TimeoutException:
-            print(f"Could not find {selected_text2} radio button")
-            raise HTTPException(
-                status_code=404,
-                detail=f"Kit car/buggy/classic radio button ({selected_text2}) not found"
-            )
-        
-        # -------------------------------------------------------------------------
-        # STEP 19: Select "No" for VIN knowledge question (always No)
-        # -------------------------------------------------------------------------
-        
-        print("Looking for VIN knowledge radio buttons...")
-        print("Selecting: No (always)")
+        vehicle_radio_answers = [
+            ("VehicleIsConversionVan10", selected_value, f"Conversion van/pickup/SUV radio button ({selected_text})"),
+            ("VehicleIsSpecialType20", selected_value2, f"Kit car/buggy/classic radio button ({selected_text2})"),
+            ("CurrentVehicleVinKnownInd30", "N", "VIN knowledge radio button (No)"),
+        ]
         
         try:
-            # Find the "No" radio button by value attribute (always select No)
-            radio_button3 = extended_wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input[name='CurrentVehicleVinKnownInd30'][value='N']"))
-            )
-            print("Found No radio button for VIN knowledge")
+            # Click each radio that is present and not yet checked; done once all three are checked.
+            # Polling lets a question that only appears after answering another still get answered.
+            extended_wait.until(lambda d: d.execute_script("""
+                var allChecked = true;
+                arguments[0].forEach(function(answer) {
+                    var radio = document.querySelector("input[name='" + answer[0] + "'][value='" + answer[1] + "']");
+                    if (!radio) {
+                        allChecked = false;
+                        return;
+                    }
+                    if (!radio.checked) {
+                        radio.click();
+                    }
+                    allChecked = allChecked && radio.checked;
+                });
+                return allChecked;
+            """, [[name, value] for name, value, _ in vehicle_radio_answers]))
+            logger.info(f"Selected: {selected_text} (conversion van), {selected_text2} (kit car), No (VIN knowledge)")
             
-            # Scroll to the radio button
-            driver.execute_script("arguments[0].scrollIntoView(true);", radio_button3)
+            # Wait for the selections to register
             time.sleep(1)
             
-            # Click the radio button
-            driver.execute_script("arguments[0].click();", radio_button3)
-            print("Selected: No (VIN knowledge)")
-            
-            # Wait for selection to register
-            time.sleep(2)
-            
-            print(f"After VIN knowledge selection - Title: {driver.title}")
-            print(f"After VIN knowledge selection - URL: {driver.current_url}")
+            log_nav(driver, "After vehicle radio selections")
             
         except TimeoutException:
-            print("Could not find No radio button for VIN knowledge")
+            # Report the first question whose radio button never became checked
+            missing = "Vehicle radio buttons"
+            for name, value, label in vehicle_radio_answers:
+                radios = driver.find_elements(By.CSS_SELECTOR, f"input[name='{name}'][value='{value}']")
+                if not radios or not radios[0].is_selected():
+                    missing = label
+                    break
+            logger.warning(f"Could not select {missing}")
             raise HTTPException(
                 status_code=404,
-                detail="VIN knowledge radio button (No) not found"
+                detail=f"{missing} not found"
             )
         
         # -------------------------------------------------------------------------
         # STEP 20: Select vehicle make from dropdown
         # -------------------------------------------------------------------------
         
-        print("Looking for vehicle make dropdown...")
-        print(f"Make to select: {request.make}")
+        logger.info("Looking for vehicle make dropdown...")
+        logger.info(f"Make to select: {request.make}")
         
         try:
             # Find the make dropdown by its data-pgr-id attribute
             make_dropdown = extended_wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlVehicleMake']"))
             )
-            print("Found vehicle make dropdown")
+            logger.info("Found vehicle make dropdown")
             
             # Scroll to the dropdown with extra offset to avoid sticky headers
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", make_dropdown)
-            time.sleep(1)
+            scroll_into_view_if_needed(driver, make_dropdown)
             
             # Use JavaScript click to avoid interception by sticky headers
             driver.execute_script("arguments[0].focus();", make_dropdown)
@@ -3419,29 +4126,20 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             time.sleep(1)
             
             # Use JavaScript to set the value and trigger change events
-            make_value = request.make.upper()  # Convert to uppercase to match options
-            driver.execute_script("""
-                var select = arguments[0];
-                select.value = arguments[1];
-                select.dispatchEvent(new Event('change', { bubbles: true }));
-                select.dispatchEvent(new Event('input', { bubbles: true }));
-                select.dispatchEvent(new Event('blur', { bubbles: true }));
-            """, make_dropdown, make_value)
+            selected_value = set_select_value(driver, make_dropdown, make_value)
             
-            print(f"Selected make: {make_value}")
+            logger.info(f"Selected make: {make_value}")
             
-            # Verify selection
-            selected_value = make_dropdown.get_attribute('value')
-            print(f"Verified selected value: {selected_value}")
+            # Verify selection (value read back by the same script call)
+            logger.info(f"Verified selected value: {selected_value}")
             
             # Wait a moment for the selection to register
             time.sleep(2)
             
-            print(f"After make selection - Title: {driver.title}")
-            print(f"After make selection - URL: {driver.current_url}")
+            log_nav(driver, "After make selection")
             
         except TimeoutException:
-            print("Could not find vehicle make dropdown")
+            logger.warning("Could not find vehicle make dropdown")
             raise HTTPException(
                 status_code=404,
                 detail="Vehicle make dropdown not found"
@@ -3451,19 +4149,18 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 21: Select vehicle model from dropdown
         # -------------------------------------------------------------------------
         
-        print("Looking for vehicle model dropdown...")
-        print(f"Model to select: {request.model}")
+        logger.info("Looking for vehicle model dropdown...")
+        logger.info(f"Model to select: {request.model}")
         
         try:
             # Find the model dropdown by its data-pgr-id attribute
             model_dropdown = extended_wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlVehicleModel']"))
             )
-            print("Found vehicle model dropdown")
+            logger.info("Found vehicle model dropdown")
             
             # Scroll to the dropdown with extra offset to avoid sticky headers
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", model_dropdown)
-            time.sleep(1)
+            scroll_into_view_if_needed(driver, model_dropdown)
             
             # Use JavaScript click to avoid interception by sticky headers
             driver.execute_script("arguments[0].focus();", model_dropdown)
@@ -3471,29 +4168,20 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             time.sleep(1)
             
             # Use JavaScript to set the value and trigger change events
-            model_value = request.model.upper()  # Convert to uppercase to match options
-            driver.execute_script("""
-                var select = arguments[0];
-                select.value = arguments[1];
-                select.dispatchEvent(new Event('change', { bubbles: true }));
-                select.dispatchEvent(new Event('input', { bubbles: true }));
-                select.dispatchEvent(new Event('blur', { bubbles: true }));
-            """, model_dropdown, model_value)
+            selected_value = set_select_value(driver, model_dropdown, model_value)
             
-            print(f"Selected model: {model_value}")
+            logger.info(f"Selected model: {model_value}")
             
-            # Verify selection
-            selected_value = model_dropdown.get_attribute('value')
-            print(f"Verified selected value: {selected_value}")
+            # Verify selection (value read back by the same script call)
+            logger.info(f"Verified selected value: {selected_value}")
             
             # Wait a moment for the selection to register
             time.sleep(2)
             
-            print(f"After model selection - Title: {driver.title}")
-            print(f"After model selection - URL: {driver.current_url}")
+            log_nav(driver, "After model selection")
             
         except TimeoutException:
-            print("Could not find vehicle model dropdown")
+            logger.warning("Could not find vehicle model dropdown")
             raise HTTPException(
                 status_code=404,
                 detail="Vehicle model dropdown not found"
@@ -3504,21 +4192,21 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # Handles 3 cases: auto-selected, radio buttons, or dropdown
         # -------------------------------------------------------------------------
         
-        print("Looking for body style field...")
+        logger.info("Looking for body style field...")
         
         body_style_selected = None
         
         # Case 1: Try to find body style as a dropdown
         try:
-            print("Checking for body style dropdown...")
-            body_style_dropdown = WebDriverWait(driver, 3).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlVeh_Sym_Sel']"))
-            )
-            print("Found body style dropdown")
+            logger.info("Checking for body style dropdown...")
+            with no_implicit_wait(driver):
+                body_style_dropdown = WebDriverWait(driver, 3).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlVeh_Sym_Sel']"))
+                )
+            logger.info("Found body style dropdown")
             
             # Scroll to the dropdown with extra offset to avoid sticky headers
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", body_style_dropdown)
-            time.sleep(1)
+            scroll_into_view_if_needed(driver, body_style_dropdown)
             
             # Use JavaScript click to avoid interception by sticky headers
             driver.execute_script("arguments[0].focus();", body_style_dropdown)
@@ -3532,25 +4220,25 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             # Get the selected option text
             selected_option = select.first_selected_option
             body_style_selected = selected_option.text.strip()
-            print(f"Selected first body style from dropdown: {body_style_selected}")
+            logger.info(f"Selected first body style from dropdown: {body_style_selected}")
             
             # Wait for selection to register
             time.sleep(2)
             
-            print(f"After body style dropdown selection - Title: {driver.title}")
-            print(f"After body style dropdown selection - URL: {driver.current_url}")
+            log_nav(driver, "After body style dropdown selection")
             
         except TimeoutException:
-            print("Body style dropdown not found, checking for radio buttons...")
+            logger.info("Body style dropdown not found, checking for radio buttons...")
             
             # Case 2: Try to find body style as radio buttons
             try:
-                body_style_radios = WebDriverWait(driver, 3).until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "input[data-pgr-id='radVeh_Sym_Sel60']"))
-                )
+                with no_implicit_wait(driver):
+                    body_style_radios = WebDriverWait(driver, 3).until(
+                        EC.presence_of_all_elements_located((By.CSS_SELECTOR, "input[data-pgr-id='radVeh_Sym_Sel60']"))
+                    )
                 
                 if body_style_radios and len(body_style_radios) > 0:
-                    print(f"Found {len(body_style_radios)} body style radio button options")
+                    logger.info(f"Found {len(body_style_radios)} body style radio button options")
                     
                     # Select the first radio button
                     first_radio = body_style_radios[0]
@@ -3560,73 +4248,69 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                         parent_label = first_radio.find_element(By.XPATH, "./ancestor::label")
                         label_element = parent_label.find_element(By.CSS_SELECTOR, "pui-input-label ps-markdown")
                         body_style_text = label_element.text.strip()
-                        print(f"Selecting first body style radio option: {body_style_text}")
+                        logger.info(f"Selecting first body style radio option: {body_style_text}")
                     except:
                         body_style_text = first_radio.get_attribute('value')
-                        print(f"Selecting first body style radio option with value: {body_style_text}")
+                        logger.info(f"Selecting first body style radio option with value: {body_style_text}")
                     
                     # Scroll to the radio button
-                    driver.execute_script("arguments[0].scrollIntoView(true);", first_radio)
-                    time.sleep(1)
+                    scroll_into_view_if_needed(driver, first_radio)
                     
                     # Click the radio button
                     driver.execute_script("arguments[0].click();", first_radio)
-                    print(f"Selected body style: {body_style_text}")
+                    logger.info(f"Selected body style: {body_style_text}")
                     
                     body_style_selected = body_style_text
                     
                     # Wait for selection to register
                     time.sleep(2)
                     
-                    print(f"After body style radio selection - Title: {driver.title}")
-                    print(f"After body style radio selection - URL: {driver.current_url}")
+                    log_nav(driver, "After body style radio selection")
                 else:
-                    print("No body style radio options found (field may be pre-filled)")
+                    logger.info("No body style radio options found (field may be pre-filled)")
                     body_style_selected = "Pre-filled or not applicable"
                     
             except TimeoutException:
                 # Case 3: Field not found - it's pre-filled or not required
-                print("⚠️ Body style field not found (radio or dropdown) - field may be pre-filled or not required")
-                print("✅ Continuing without body style selection...")
+                logger.warning("⚠️ Body style field not found (radio or dropdown) - field may be pre-filled or not required")
+                logger.info("✅ Continuing without body style selection...")
                 body_style_selected = "Pre-filled or not applicable"
             except Exception as e:
-                print(f"⚠️ Error finding body style field: {e}")
-                print("✅ Continuing without body style selection...")
+                logger.warning(f"⚠️ Error finding body style field: {e}")
+                logger.info("✅ Continuing without body style selection...")
                 body_style_selected = "Pre-filled or not applicable"
         except Exception as e:
-            print(f"⚠️ Error with body style dropdown: {e}")
-            print("✅ Continuing without body style selection...")
+            logger.warning(f"⚠️ Error with body style dropdown: {e}")
+            logger.info("✅ Continuing without body style selection...")
             body_style_selected = "Pre-filled or not applicable"
         
         # -------------------------------------------------------------------------
         # STEP 23: Click the "Continue" button after body style selection
         # -------------------------------------------------------------------------
         
-        print("Looking for 'Continue' button after body style...")
+        logger.info("Looking for 'Continue' button after body style...")
         
         try:
             # Find the Continue button by its data-pgr-id attribute
             continue_button = extended_wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-pgr-id='btnContinue']"))
+                EC.element_to_be_clickable(CONTINUE_BUTTON_LOCATOR)
             )
-            print("Found 'Continue' button")
+            logger.info("Found 'Continue' button")
             
             # Scroll to the button
-            driver.execute_script("arguments[0].scrollIntoView(true);", continue_button)
-            time.sleep(1)
+            scroll_into_view_if_needed(driver, continue_button)
             
             # Click the Continue button
             driver.execute_script("arguments[0].click();", continue_button)
-            print("Clicked 'Continue' button")
+            logger.info("Clicked 'Continue' button")
             
-            # Wait for the new page to load
-            time.sleep(5)
+            # Wait for the new page to load and the next step's field to appear
+            wait_until_ready(driver, (By.CSS_SELECTOR, "pui-input-label[data-pgr-id='lblVehicleAntitheftDeviceCodeNo']"))
             
-            print(f"After Continue click - Title: {driver.title}")
-            print(f"After Continue click - URL: {driver.current_url}")
+            log_nav(driver, "After Continue click")
             
         except TimeoutException:
-            print("Could not find 'Continue' button after body style")
+            logger.warning("Could not find 'Continue' button after body style")
             raise HTTPException(
                 status_code=404,
                 detail="Continue button not found after body style selection"
@@ -3636,34 +4320,32 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 24: Select "No" for anti-theft device question (always No)
         # -------------------------------------------------------------------------
         
-        print("Looking for anti-theft device radio button...")
+        logger.info("Looking for anti-theft device radio button...")
         
         try:
             # Find the "No" radio button for anti-theft device
-            # Using XPath to find the label with data-pgr-id containing "lblVehicleAntitheftDeviceCodeNo"
-            antitheft_radio = extended_wait.until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//pui-input-label[@data-pgr-id='lblVehicleAntitheftDeviceCodeNo']/ancestor::label/input[@type='radio']")
-                )
-            )
-            print("Found 'No' radio button for anti-theft device")
+            # Look up the "lblVehicleAntitheftDeviceCodeNo" label by CSS and return its radio input in one JS call
+            antitheft_radio = extended_wait.until(lambda d: d.execute_script("""
+                var label = document.querySelector("pui-input-label[data-pgr-id='lblVehicleAntitheftDeviceCodeNo']");
+                var parent = label && label.closest('label');
+                return parent ? parent.querySelector(":scope > input[type='radio']") : null;
+            """))
+            logger.info("Found 'No' radio button for anti-theft device")
             
             # Scroll to the radio button
-            driver.execute_script("arguments[0].scrollIntoView(true);", antitheft_radio)
-            time.sleep(1)
+            scroll_into_view_if_needed(driver, antitheft_radio)
             
             # Click the radio button
             driver.execute_script("arguments[0].click();", antitheft_radio)
-            print("Selected: No (anti-theft device)")
+            logger.info("Selected: No (anti-theft device)")
             
             # Wait for selection to register
             time.sleep(2)
             
-            print(f"After anti-theft selection - Title: {driver.title}")
-            print(f"After anti-theft selection - URL: {driver.current_url}")
+            log_nav(driver, "After anti-theft selection")
             
         except TimeoutException:
-            print("Could not find anti-theft device radio button")
+            logger.warning("Could not find anti-theft device radio button")
             raise HTTPException(
                 status_code=404,
                 detail="Anti-theft device radio button not found"
@@ -3673,31 +4355,29 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 25: Click the "Continue" button after anti-theft selection
         # -------------------------------------------------------------------------
         
-        print("Looking for 'Continue' button after anti-theft selection...")
+        logger.info("Looking for 'Continue' button after anti-theft selection...")
         
         try:
             # Find the Continue button by its data-pgr-id attribute
             continue_button = extended_wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-pgr-id='btnContinue']"))
+                EC.element_to_be_clickable(CONTINUE_BUTTON_LOCATOR)
             )
-            print("Found 'Continue' button")
+            logger.info("Found 'Continue' button")
             
             # Scroll to the button
-            driver.execute_script("arguments[0].scrollIntoView(true);", continue_button)
-            time.sleep(1)
+            scroll_into_view_if_needed(driver, continue_button)
             
             # Click the Continue button
             driver.execute_script("arguments[0].click();", continue_button)
-            print("Clicked 'Continue' button")
+            logger.info("Clicked 'Continue' button")
             
-            # Wait for the new page to load
-            time.sleep(5)
+            # Wait for the new page to load and the next step's field to appear
+            wait_until_ready(driver, VEHICLE_USE_DROPDOWN_LOCATOR)
             
-            print(f"After Continue click - Title: {driver.title}")
-            print(f"After Continue click - URL: {driver.current_url}")
+            log_nav(driver, "After Continue click")
             
         except TimeoutException:
-            print("Could not find 'Continue' button after anti-theft selection")
+            logger.warning("Could not find 'Continue' button after anti-theft selection")
             raise HTTPException(
                 status_code=404,
                 detail="Continue button not found after anti-theft selection"
@@ -3707,38 +4387,20 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 26: Select vehicle use from dropdown
         # -------------------------------------------------------------------------
         
-        print("Looking for vehicle use dropdown...")
-        print(f"Vehicle use to select: {request.vehicle_use}")
-        
-        # Map vehicle use text to dropdown values
-        vehicle_use_map = {
-            "COMMUTE": "4",
-            "PLEASURE/PERSONAL": "1",
-            "PLEASURE": "1",
-            "PERSONAL": "1",
-            "BUSINESS": "2",
-            "FARM": "3"
-        }
-        
-        vehicle_use_upper = request.vehicle_use.upper().strip()
-        vehicle_use_value = vehicle_use_map.get(vehicle_use_upper)
+        logger.info("Looking for vehicle use dropdown...")
+        logger.info(f"Vehicle use to select: {request.vehicle_use}")
         
-        if not vehicle_use_value:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid vehicle_use: {request.vehicle_use}. Must be one of: Commute, Pleasure/Personal, Business, Farm"
-            )
+        vehicle_use_value = VEHICLE_USE_MAP.get(vehicle_use_upper)
         
         try:
             # Find the vehicle use dropdown by its data-pgr-id attribute
             vehicle_use_dropdown = extended_wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlVehicleUse']"))
+                EC.presence_of_element_located(VEHICLE_USE_DROPDOWN_LOCATOR)
             )
-            print("Found vehicle use dropdown")
+            logger.info("Found vehicle use dropdown")
             
             # Scroll to the dropdown with extra offset to avoid sticky headers
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", vehicle_use_dropdown)
-            time.sleep(1)
+            scroll_into_view_if_needed(driver, vehicle_use_dropdown)
             
             # Use JavaScript click to avoid interception by sticky headers
             driver.execute_script("arguments[0].focus();", vehicle_use_dropdown)
@@ -3746,28 +4408,20 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             time.sleep(1)
             
             # Use JavaScript to set the value and trigger change events
-            driver.execute_script("""
-                var select = arguments[0];
-                select.value = arguments[1];
-                select.dispatchEvent(new Event('change', { bubbles: true }));
-                select.dispatchEvent(new Event('input', { bubbles: true }));
-                select.dispatchEvent(new Event('blur', { bubbles: true }));
-            """, vehicle_use_dropdown, vehicle_use_value)
+            selected_value = set_select_value(driver, vehicle_use_dropdown, vehicle_use_value)
             
-            print(f"Selected vehicle use: {request.vehicle_use} (value: {vehicle_use_value})")
+            logger.info(f"Selected vehicle use: {request.vehicle_use} (value: {vehicle_use_value})")
             
-            # Verify selection
-            selected_value = vehicle_use_dropdown.get_attribute('value')
-            print(f"Verified selected value: {selected_value}")
+            # Verify selection (value read back by the same script call)
+            logger.info(f"Verified selected value: {selected_value}")
             
             # Wait a moment for the selection to register
             time.sleep(2)
             
-            print(f"After vehicle use selection - Title: {driver.title}")
-            print(f"After vehicle use selection - URL: {driver.current_url}")
+            log_nav(driver, "After vehicle use selection")
             
         except TimeoutException:
-            print("Could not find vehicle use dropdown")
+            logger.warning("Could not find vehicle use dropdown")
             raise HTTPException(
                 status_code=404,
                 detail="Vehicle use dropdown not found"
@@ -3777,47 +4431,33 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 27: Select Yes/No for ridesharing question
         # -------------------------------------------------------------------------
         
-        print("Looking for ridesharing radio buttons...")
+        logger.info("Looking for ridesharing radio buttons...")
         
-        # Normalize the input value (accept yes/Yes/Y or no/No/N)
-        ridesharing_upper = request.vehicle_use_ridesharing.upper().strip()
-        if ridesharing_upper in ['YES', 'Y']:
-            ridesharing_value = 'Y'
-            ridesharing_text = 'Yes'
-        elif ridesharing_upper in ['NO', 'N']:
-            ridesharing_value = 'N'
-            ridesharing_text = 'No'
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid value for vehicle_use_ridesharing: {request.vehicle_use_ridesharing}. Must be 'yes' or 'no'"
-            )
+        ridesharing_value, ridesharing_text = YES_NO_MAP[ridesharing_upper]
         
-        print(f"Selecting: {ridesharing_text} (value: {ridesharing_value})")
+        logger.info(f"Selecting: {ridesharing_text} (value: {ridesharing_value})")
         
         try:
             # Find the radio button by value attribute
             ridesharing_radio = extended_wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, f"input[name='VehicleTransportationNetworkCompanyCode10'][value='{ridesharing_value}']"))
             )
-            print(f"Found {ridesharing_text} radio button for ridesharing")
+            logger.info(f"Found {ridesharing_text} radio button for ridesharing")
             
             # Scroll to the radio button
-            driver.execute_script("arguments[0].scrollIntoView(true);", ridesharing_radio)
-            time.sleep(1)
+            scroll_into_view_if_needed(driver, ridesharing_radio)
             
             # Click the radio button
             driver.execute_script("arguments[0].click();", ridesharing_radio)
-            print(f"Selected: {ridesharing_text} for ridesharing")
+            logger.info(f"Selected: {ridesharing_text} for ridesharing")
             
             # Wait for selection to register
             time.sleep(2)
             
-            print(f"After ridesharing selection - Title: {driver.title}")
-            print(f"After ridesharing selection - URL: {driver.current_url}")
+            log_nav(driver, "After ridesharing selection")
             
         except TimeoutException:
-            print(f"Could not find {ridesharing_text} radio button for ridesharing")
+            logger.warning(f"Could not find {ridesharing_text} radio button for ridesharing")
             raise HTTPException(
                 status_code=404,
                 detail=f"Ridesharing radio button ({ridesharing_text}) not found"
@@ -3827,40 +4467,38 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 28: Enter one-way commute miles
         # -------------------------------------------------------------------------
         
-        print("Looking for one-way commute miles input field...")
-        print(f"Miles to enter: {request.one_way_commute_miles}")
+        logger.info("Looking for one-way commute miles input field...")
+        logger.info(f"Miles to enter: {request.one_way_commute_miles}")
         
         try:
             # Find the commute miles input field by its data-pgr-id attribute
             commute_miles_field = extended_wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "input[data-pgr-id='txtVehicleOneWayCommuteMiles']"))
             )
-            print("Found one-way commute miles input field")
+            logger.info("Found one-way commute miles input field")
             
             # Scroll to the input field
-            driver.execute_script("arguments[0].scrollIntoView(true);", commute_miles_field)
-            time.sleep(1)
-            
-            # Clear the field first
-            commute_miles_field.clear()
-            time.sleep(0.5)
-            
-            # Enter the commute miles
-            commute_miles_field.send_keys(request.one_way_commute_miles)
-            print(f"Entered one-way commute miles: {request.one_way_commute_miles}")
+            scroll_into_view_if_needed(driver, commute_miles_field)
             
-            # Trigger change events to ensure the field registers the input
-            driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", commute_miles_field)
-            driver.execute_script("arguments[0].dispatchEvent(new Event('change', { bubbles: true }));", commute_miles_field)
+            # Clear, set the commute miles and trigger change events in a single call
+            # (send_keys types one key per WebDriver round-trip)
+            driver.execute_script("""
+                var input = arguments[0];
+                input.value = '';
+                input.value = arguments[1];
+                ['input', 'change', 'blur'].forEach(function(eventType) {
+                    input.dispatchEvent(new Event(eventType, { bubbles: true }));
+                });
+            """, commute_miles_field, str(request.one_way_commute_miles))
+            logger.info(f"Entered one-way commute miles: {request.one_way_commute_miles}")
             
             # Wait a moment for the field to register
             time.sleep(2)
             
-            print(f"After commute miles entry - Title: {driver.title}")
-            print(f"After commute miles entry - URL: {driver.current_url}")
+            log_nav(driver, "After commute miles entry")
             
         except TimeoutException:
-            print("Could not find one-way commute miles input field")
+            logger.warning("Could not find one-way commute miles input field")
             raise HTTPException(
                 status_code=404,
                 detail="One-way commute miles input field not found"
@@ -3870,34 +4508,28 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 29: Select "Mailing Address" for primary location (always)
         # -------------------------------------------------------------------------
         
-        print("Looking for primary location (Mailing Address) radio button...")
+        logger.info("Looking for primary location (Mailing Address) radio button...")
         
         try:
             # Find the "Mailing Address" radio button
-            # Using XPath to find the ps-markdown with "Mailing Address" text, then get the associated input
-            mailing_address_radio = extended_wait.until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//ps-markdown[contains(text(), 'Mailing Address')]/ancestor::label/input[@type='radio']")
-                )
-            )
-            print("Found 'Mailing Address' radio button")
+            # Scan ps-markdown text in JS (faster than an XPath text() search), then get the associated input
+            mailing_address_radio = extended_wait.until(lambda d: find_radio_by_label_text(d, "Mailing Address"))
+            logger.info("Found 'Mailing Address' radio button")
             
             # Scroll to the radio button
-            driver.execute_script("arguments[0].scrollIntoView(true);", mailing_address_radio)
-            time.sleep(1)
+            scroll_into_view_if_needed(driver, mailing_address_radio)
             
             # Click the radio button
             driver.execute_script("arguments[0].click();", mailing_address_radio)
-            print("Selected: Mailing Address as primary location")
+            logger.info("Selected: Mailing Address as primary location")
             
             # Wait for selection to register
             time.sleep(2)
             
-            print(f"After primary location selection - Title: {driver.title}")
-            print(f"After primary location selection - URL: {driver.current_url}")
+            log_nav(driver, "After primary location selection")
             
         except TimeoutException:
-            print("Could not find Mailing Address radio button")
+            logger.warning("Could not find Mailing Address radio button")
             raise HTTPException(
                 status_code=404,
                 detail="Mailing Address radio button not found"
@@ -3907,95 +4539,54 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 30: Select vehicle ownership from dropdown
         # -------------------------------------------------------------------------
         
-        print("Looking for vehicle ownership dropdown...")
-        print(f"Vehicle ownership to select: {request.vehicle_ownership}")
-        
-        # Map vehicle ownership text to dropdown values
-        ownership_map = {
-            "LEASE": "1",
-            "OWN AND MAKE PAYMENTS": "2",
-            "OWN": "2",  # Shorthand for "Own and make payments"
-            "OWN AND DO NOT MAKE PAYMENTS": "3",
-            "OWN NO PAYMENTS": "3"  # Shorthand
-        }
-        
-        ownership_upper = request.vehicle_ownership.upper().strip()
-        ownership_value = ownership_map.get(ownership_upper)
+        logger.info("Looking for vehicle ownership dropdown...")
+        logger.info(f"Vehicle ownership to select: {request.vehicle_ownership}")
         
-        if not ownership_value:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid vehicle_ownership: {request.vehicle_ownership}. Must be one of: Lease, Own and make payments, Own and do not make payments"
-            )
+        ownership_value = OWNERSHIP_MAP.get(ownership_upper)
         
         try:
-            # Retry logic for stale element references
-            max_retries = 3
-            retry_count = 0
-            
-            while retry_count < max_retries:
-                try:
-                    # Find the ownership dropdown by its data-pgr-id attribute
-                    ownership_dropdown = extended_wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlVehicleFinancialOwnership']"))
+            # Retry on stale element references with exponential backoff (no delay on the first attempt)
+            @retry_stale(max_attempts=3)
+            def select_ownership():
+                # Find the ownership dropdown by its data-pgr-id attribute
+                with no_implicit_wait(driver):
+                    extended_wait.until(
+                        EC.presence_of_element_located(OWNERSHIP_DROPDOWN_LOCATOR)
                     )
-                    print("Found vehicle ownership dropdown")
-                    
-                    # Scroll to the dropdown with extra offset to avoid sticky headers
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", ownership_dropdown)
-                    time.sleep(1)
-                    
-                    # Use JavaScript click to avoid interception by sticky headers
-                    driver.execute_script("arguments[0].focus();", ownership_dropdown)
-                    driver.execute_script("arguments[0].click();", ownership_dropdown)
-                    time.sleep(1)
-                    
-                    # Re-find element before setting value to avoid stale reference
-                    ownership_dropdown = driver.find_element(By.CSS_SELECTOR, "select[data-pgr-id='ddlVehicleFinancialOwnership']")
-                    
-                    # Use JavaScript to set the value and trigger change events
-                    driver.execute_script("""
-                        var select = arguments[0];
-                        select.value = arguments[1];
-                        select.dispatchEvent(new Event('change', { bubbles: true }));
-                        select.dispatchEvent(new Event('input', { bubbles: true }));
-                        select.dispatchEvent(new Event('blur', { bubbles: true }));
-                    """, ownership_dropdown, ownership_value)
-                    
-                    print(f"Selected vehicle ownership: {request.vehicle_ownership} (value: {ownership_value})")
-                    
-                    # Re-find element before verification to avoid stale reference
-                    ownership_dropdown = driver.find_element(By.CSS_SELECTOR, "select[data-pgr-id='ddlVehicleFinancialOwnership']")
-                    
-                    # Verify selection
-                    selected_value = ownership_dropdown.get_attribute('value')
-                    print(f"Verified selected value: {selected_value}")
-                    
-                    # Wait a moment for the selection to register
-                    time.sleep(2)
-                    
-                    print(f"After ownership selection - Title: {driver.title}")
-                    print(f"After ownership selection - URL: {driver.current_url}")
-                    
-                    # Success - break out of retry loop
-                    break
-                    
-                except StaleElementReferenceException as e:
-                    retry_count += 1
-                    print(f"Stale element reference (attempt {retry_count}/{max_retries}). Retrying...")
-                    if retry_count >= max_retries:
-                        print("Max retries reached for vehicle ownership dropdown")
-                        raise
-                    time.sleep(1)
+                logger.info("Found vehicle ownership dropdown")
+                
+                # Look up, scroll, set and read back the dropdown in one script call so there is
+                # no element reference to go stale between the find, the set and the verification
+                selected_value = set_dropdown_by_pgr_id(driver, "ddlVehicleFinancialOwnership", ownership_value)
+                if selected_value is None:
+                    # Dropdown was re-rendered away between the wait and the script call
+                    raise StaleElementReferenceException("Vehicle ownership dropdown was re-rendered")
+                
+                logger.info(f"Selected vehicle ownership: {request.vehicle_ownership} (value: {ownership_value})")
+                
+                # Verify selection (value read back by the same script call)
+                logger.info(f"Verified selected value: {selected_value}")
+                if selected_value != ownership_value:
+                    logger.warning(f"⚠️ Ownership dropdown reports {selected_value}, expected {ownership_value}")
+                
+                # Wait for Angular to commit the selection instead of a fixed delay
+                def ownership_committed(d):
+                    return selects_committed(d, [["ddlVehicleFinancialOwnership", ownership_value]])
+                
+                wait_until_ready(driver, ownership_committed, timeout=SELECTION_SETTLE_SECONDS)
+                
+                log_nav(driver, "After ownership selection")
+            
+            select_ownership()
             
         except TimeoutException:
-            print("Could not find vehicle ownership dropdown")
+            logger.warning("Could not find vehicle ownership dropdown")
             raise HTTPException(
                 status_code=404,
                 detail="Vehicle ownership dropdown not found"
             )
         except StaleElementReferenceException:
-            print("Vehicle ownership dropdown element became stale after max retries")
+            logger.info("Vehicle ownership dropdown element became stale after max retries")
             raise HTTPException(
                 status_code=500,
                 detail="Vehicle ownership dropdown element became stale. Please try again."
@@ -4005,34 +4596,30 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 31: Select "Yes" for driver acknowledgment (always Yes)
         # -------------------------------------------------------------------------
         
-        print("Looking for driver acknowledgment radio button...")
+        logger.info("Looking for driver acknowledgment radio button...")
         
         try:
             # Find the "I've included everybody" radio button
-            # Using XPath to find the ps-markdown with the acknowledgment text, then get the associated input
-            driver_ack_radio = extended_wait.until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//ps-markdown[contains(text(), \"I've included everybody that must be listed on this policy.\")]/ancestor::label/input[@type='radio']")
-                )
-            )
-            print("Found driver acknowledgment radio button")
+            # The radio has no data-pgr-id, so scan ps-markdown text in JS and get the associated input
+            with no_implicit_wait(driver):
+                driver_ack_radio = extended_wait.until(lambda d: find_radio_by_label_text(d, DRIVER_ACK_LABEL_TEXT))
+            logger.info("Found driver acknowledgment radio button")
             
-            # Scroll to the radio button
-            driver.execute_script("arguments[0].scrollIntoView(true);", driver_ack_radio)
-            time.sleep(1)
+            # Scroll to, focus and click it in one call (JavaScript click avoids interception by sticky headers)
+            scroll_and_click(driver, driver_ack_radio)
+            logger.info("Selected: Yes - I've included everybody that must be listed on this policy")
             
-            # Click the radio button
-            driver.execute_script("arguments[0].click();", driver_ack_radio)
-            print("Selected: Yes - I've included everybody that must be listed on this policy")
+            # Wait for the radio to report checked instead of a fixed delay
+            def driver_ack_checked(d):
+                radio = find_radio_by_label_text(d, DRIVER_ACK_LABEL_TEXT)
+                return radio is not None and radio.is_selected()
             
-            # Wait for selection to register
-            time.sleep(2)
+            wait_until_ready(driver, driver_ack_checked, timeout=SELECTION_SETTLE_SECONDS)
             
-            print(f"After driver acknowledgment - Title: {driver.title}")
-            print(f"After driver acknowledgment - URL: {driver.current_url}")
+            log_nav(driver, "After driver acknowledgment")
             
         except TimeoutException:
-            print("Could not find driver acknowledgment radio button")
+            logger.warning("Could not find driver acknowledgment radio button")
             raise HTTPException(
                 status_code=404,
                 detail="Driver acknowledgment radio button not found"
@@ -4042,520 +4629,183 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 32: Click the "Continue" button after driver acknowledgment
         # -------------------------------------------------------------------------
         
-        print("Looking for 'Continue' button after driver acknowledgment...")
+        logger.info("Looking for 'Continue' button after driver acknowledgment...")
         
         try:
             # Find the Continue button by its data-pgr-id attribute
-            continue_button = extended_wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-pgr-id='btnContinue']"))
-            )
-            print("Found 'Continue' button")
-            
-            # Scroll to the button
-            driver.execute_script("arguments[0].scrollIntoView(true);", continue_button)
-            time.sleep(1)
-            
-            # Click the Continue button
-            driver.execute_script("arguments[0].click();", continue_button)
-            print("Clicked 'Continue' button")
-            
-            # Wait for the new page to load
-            time.sleep(5)
-            
-            print(f"After Continue click - Title: {driver.title}")
-            print(f"After Continue click - URL: {driver.current_url}")
-            
-        except TimeoutException:
-            print("Could not find 'Continue' button after driver acknowledgment")
-            raise HTTPException(
-                status_code=404,
-                detail="Continue button not found after driver acknowledgment"
-            )
-        
-        # -------------------------------------------------------------------------
-        # STEP 33: Select comprehensive deductible from dropdown
-        # -------------------------------------------------------------------------
-        
-        print("Looking for comprehensive deductible dropdown...")
-        print(f"Comprehensive deductible to select: {request.comprehensive_deductible}")
-        
-        # Map comprehensive deductible text to dropdown values
-        comp_deductible_map = {
-            "NO COVERAGE": "210100",
-            "$100 DEDUCTIBLE": "210104",
-            "$250 DEDUCTIBLE": "210106",
-            "$500 DEDUCTIBLE": "210108",
-            "$750 DEDUCTIBLE": "210109",
-            "$1,000 DEDUCTIBLE": "210110",
-            "$1000 DEDUCTIBLE": "210110",
-            "$1,500 DEDUCTIBLE": "210130",
-            "$1500 DEDUCTIBLE": "210130",
-            "$2,000 DEDUCTIBLE": "210144",
-            "$2000 DEDUCTIBLE": "210144",
-            "$100 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210121",
-            "$250 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210123",
-            "$500 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210124",
-            "$750 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210127",
-            "$1,000 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210125",
-            "$1000 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210125",
-            "$1,500 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210188",
-            "$1500 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210188",
-            "$2,000 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210178",
-            "$2000 DEDUCTIBLE WITH $0 GLASS DEDUCTIBLE": "210178"
-        }
-        
-        comp_deductible_upper = request.comprehensive_deductible.upper().strip()
-        comp_deductible_value = comp_deductible_map.get(comp_deductible_upper)
-        
-        if not comp_deductible_value:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid comprehensive_deductible: {request.comprehensive_deductible}. Must be one of the valid deductible options"
-            )
-        
-        try:
-            # Find the comprehensive deductible dropdown by its data-pgr-id attribute
-            comp_deductible_dropdown = extended_wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlCOMPLineCoverageLimit']"))
-            )
-            print("Found comprehensive deductible dropdown")
-            
-            # Scroll to the dropdown with extra offset to avoid sticky headers
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", comp_deductible_dropdown)
-            time.sleep(1)
-            
-            # Use JavaScript click to avoid interception by sticky headers
-            driver.execute_script("arguments[0].focus();", comp_deductible_dropdown)
-            driver.execute_script("arguments[0].click();", comp_deductible_dropdown)
-            time.sleep(1)
-            
-            # Use JavaScript to set the value and trigger change events
-            driver.execute_script("""
-                var select = arguments[0];
-                select.value = arguments[1];
-                select.dispatchEvent(new Event('change', { bubbles: true }));
-                select.dispatchEvent(new Event('input', { bubbles: true }));
-                select.dispatchEvent(new Event('blur', { bubbles: true }));
-            """, comp_deductible_dropdown, comp_deductible_value)
-            
-            print(f"Selected comprehensive deductible: {request.comprehensive_deductible} (value: {comp_deductible_value})")
-            
-            # Verify selection
-            selected_value = comp_deductible_dropdown.get_attribute('value')
-            print(f"Verified selected value: {selected_value}")
-            
-            # Wait a moment for the selection to register
-            time.sleep(2)
-            
-            print(f"After comprehensive deductible selection - Title: {driver.title}")
-            print(f"After comprehensive deductible selection - URL: {driver.current_url}")
-            
-        except TimeoutException:
-            print("Could not find comprehensive deductible dropdown")
-            raise HTTPException(
-                status_code=404,
-                detail="Comprehensive deductible dropdown not found"
-            )
-        
-        # -------------------------------------------------------------------------
-        # STEP 34: Select medical payment coverage from dropdown
-        # -------------------------------------------------------------------------
-        
-        print("Looking for medical payment coverage dropdown...")
-        print(f"Medical payment coverage to select: {request.medical_payment_coverage}")
-        
-        # Map medical payment coverage text to dropdown values
-        medpay_map = {
-            "NO COVERAGE": "280100",
-            "$500 EACH PERSON": "280191",
-            "$1,000 EACH PERSON": "280192",
-            "$1000 EACH PERSON": "280192",
-            "$2,000 EACH PERSON": "280193",
-            "$2000 EACH PERSON": "280193",
-            "$5,000 EACH PERSON": "280194",
-            "$5000 EACH PERSON": "280194",
-            "$10,000 EACH PERSON": "280195",
-            "$10000 EACH PERSON": "280195"
-        }
-        
-        medpay_upper = request.medical_payment_coverage.upper().strip()
-        medpay_value = medpay_map.get(medpay_upper)
-        
-        if not medpay_value:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid medical_payment_coverage: {request.medical_payment_coverage}. Must be one of: No Coverage, $500 each person, $1,000 each person, $2,000 each person, $5,000 each person, $10,000 each person"
-            )
-        
-        try:
-            # Find the medical payment coverage dropdown by its data-pgr-id attribute
-            medpay_dropdown = extended_wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlMEDPAYLineCoverageLimit']"))
-            )
-            print("Found medical payment coverage dropdown")
-            
-            # Scroll to the dropdown with extra offset to avoid sticky headers
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", medpay_dropdown)
-            time.sleep(1)
-            
-            # Use JavaScript click to avoid interception by sticky headers
-            driver.execute_script("arguments[0].focus();", medpay_dropdown)
-            driver.execute_script("arguments[0].click();", medpay_dropdown)
-            time.sleep(1)
-            
-            # Use JavaScript to set the value and trigger change events
-            driver.execute_script("""
-                var select = arguments[0];
-                select.value = arguments[1];
-                select.dispatchEvent(new Event('change', { bubbles: true }));
-                select.dispatchEvent(new Event('input', { bubbles: true }));
-                select.dispatchEvent(new Event('blur', { bubbles: true }));
-            """, medpay_dropdown, medpay_value)
-            
-            print(f"Selected medical payment coverage: {request.medical_payment_coverage} (value: {medpay_value})")
-            
-            # Verify selection
-            selected_value = medpay_dropdown.get_attribute('value')
-            print(f"Verified selected value: {selected_value}")
-            
-            # Wait a moment for the selection to register
-            time.sleep(2)
-            
-            print(f"After medical payment coverage selection - Title: {driver.title}")
-            print(f"After medical payment coverage selection - URL: {driver.current_url}")
-            
-        except TimeoutException:
-            print("Could not find medical payment coverage dropdown")
-            raise HTTPException(
-                status_code=404,
-                detail="Medical payment coverage dropdown not found"
-            )
-        
-        # -------------------------------------------------------------------------
-        # STEP 35: Select collision deductible from dropdown
-        # -------------------------------------------------------------------------
-        
-        print("Looking for collision deductible dropdown...")
-        print(f"Collision deductible to select: {request.collision_deductible}")
-        
-        # Map collision deductible text to dropdown values
-        collision_map = {
-            "NO COVERAGE": "210300",
-            "$100 DEDUCTIBLE": "210303",
-            "$250 DEDUCTIBLE": "210304",
-            "$500 DEDUCTIBLE": "210307",
-            "$750 DEDUCTIBLE": "210310",
-            "$1,000 DEDUCTIBLE": "210308",
-            "$1000 DEDUCTIBLE": "210308",
-            "$1,500 DEDUCTIBLE": "210323",
-            "$1500 DEDUCTIBLE": "210323",
-            "$2,000 DEDUCTIBLE": "210324",
-            "$2000 DEDUCTIBLE": "210324"
-        }
-        
-        collision_upper = request.collision_deductible.upper().strip()
-        collision_value = collision_map.get(collision_upper)
-        
-        if not collision_value:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid collision_deductible: {request.collision_deductible}. Must be one of: No Coverage, $100 deductible, $250 deductible, $500 deductible, $750 deductible, $1,000 deductible, $1,500 deductible, $2,000 deductible"
-            )
-        
-        try:
-            # Find the collision deductible dropdown by its data-pgr-id attribute
-            collision_dropdown = extended_wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlCOLLLineCoverageLimit']"))
-            )
-            print("Found collision deductible dropdown")
-            
-            # Scroll to the dropdown with extra offset to avoid sticky headers
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", collision_dropdown)
-            time.sleep(1)
-            
-            # Use JavaScript click to avoid interception by sticky headers
-            driver.execute_script("arguments[0].focus();", collision_dropdown)
-            driver.execute_script("arguments[0].click();", collision_dropdown)
-            time.sleep(1)
-            
-            # Use JavaScript to set the value and trigger change events
-            driver.execute_script("""
-                var select = arguments[0];
-                select.value = arguments[1];
-                select.dispatchEvent(new Event('change', { bubbles: true }));
-                select.dispatchEvent(new Event('input', { bubbles: true }));
-                select.dispatchEvent(new Event('blur', { bubbles: true }));
-            """, collision_dropdown, collision_value)
-            
-            print(f"Selected collision deductible: {request.collision_deductible} (value: {collision_value})")
-            
-            # Verify selection
-            selected_value = collision_dropdown.get_attribute('value')
-            print(f"Verified selected value: {selected_value}")
-            
-            # Wait a moment for the selection to register
-            time.sleep(2)
-            
-            print(f"After collision deductible selection - Title: {driver.title}")
-            print(f"After collision deductible selection - URL: {driver.current_url}")
-            
-        except TimeoutException:
-            print("Could not find collision deductible dropdown")
-            raise HTTPException(
-                status_code=404,
-                detail="Collision deductible dropdown not found"
-            )
-        
-        # -------------------------------------------------------------------------
-        # STEP 36: Select bodily injury and property damage liability from dropdown
-        # -------------------------------------------------------------------------
-        
-        print("Looking for bodily injury and property damage liability dropdown...")
-        print(f"Bodily injury and property damage to select: {request.bodily_injury_property_damage}")
-        
-        # Map bodily injury and property damage text to dropdown values
-        bipd_map = {
-            "$15,000 EACH PERSON/$30,000 EACH ACCIDENT/$25,000 EACH ACCIDENT": "191003-200103",
-            "$15000 EACH PERSON/$30000 EACH ACCIDENT/$25000 EACH ACCIDENT": "191003-200103",
-            "$15,000 EACH PERSON/$30,000 EACH ACCIDENT/$50,000 EACH ACCIDENT": "191003-200105",
-            "$15000 EACH PERSON/$30000 EACH ACCIDENT/$50000 EACH ACCIDENT": "191003-200105",
-            "$25,000 EACH PERSON/$50,000 EACH ACCIDENT/$25,000 EACH ACCIDENT": "191005-200103",
-            "$25000 EACH PERSON/$50000 EACH ACCIDENT/$25000 EACH ACCIDENT": "191005-200103",
-            "$25,000 EACH PERSON/$50,000 EACH ACCIDENT/$50,000 EACH ACCIDENT": "191005-200105",
-            "$25000 EACH PERSON/$50000 EACH ACCIDENT/$50000 EACH ACCIDENT": "191005-200105",
-            "$50,000 EACH PERSON/$100,000 EACH ACCIDENT/$25,000 EACH ACCIDENT": "191006-200103",
-            "$50000 EACH PERSON/$100000 EACH ACCIDENT/$25000 EACH ACCIDENT": "191006-200103",
-            "$50,000 EACH PERSON/$100,000 EACH ACCIDENT/$50,000 EACH ACCIDENT": "191006-200105",
-            "$50000 EACH PERSON/$100000 EACH ACCIDENT/$50000 EACH ACCIDENT": "191006-200105",
-            "$100,000 EACH PERSON/$300,000 EACH ACCIDENT/$50,000 EACH ACCIDENT": "191008-200105",
-            "$100000 EACH PERSON/$300000 EACH ACCIDENT/$50000 EACH ACCIDENT": "191008-200105",
-            "$100,000 EACH PERSON/$300,000 EACH ACCIDENT/$100,000 EACH ACCIDENT": "191008-200106",
-            "$100000 EACH PERSON/$300000 EACH ACCIDENT/$100000 EACH ACCIDENT": "191008-200106",
-            "$250,000 EACH PERSON/$500,000 EACH ACCIDENT/$100,000 EACH ACCIDENT": "191015-200106",
-            "$250000 EACH PERSON/$500000 EACH ACCIDENT/$100000 EACH ACCIDENT": "191015-200106",
-            "$100,000 COMBINED SINGLE LIMIT": "191052-200152",
-            "$100000 COMBINED SINGLE LIMIT": "191052-200152",
-            "$300,000 COMBINED SINGLE LIMIT": "191053-200153",
-            "$300000 COMBINED SINGLE LIMIT": "191053-200153",
-            "$500,000 COMBINED SINGLE LIMIT": "191054-200154",
-            "$500000 COMBINED SINGLE LIMIT": "191054-200154"
-        }
-        
-        bipd_upper = request.bodily_injury_property_damage.upper().strip()
-        bipd_value = bipd_map.get(bipd_upper)
-        
-        if not bipd_value:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid bodily_injury_property_damage: {request.bodily_injury_property_damage}. Must be a valid coverage option (e.g., '$100,000 each person/$300,000 each accident/$100,000 each accident' or '$300,000 combined single limit')"
-            )
-        
-        try:
-            # Find the bodily injury and property damage dropdown by its data-pgr-id attribute
-            bipd_dropdown = extended_wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlBIPDLineCoverageLimit']"))
-            )
-            print("Found bodily injury and property damage liability dropdown")
-            
-            # Scroll to the dropdown with extra offset to avoid sticky headers
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", bipd_dropdown)
-            time.sleep(1)
-            
-            # Use JavaScript click to avoid interception by sticky headers
-            driver.execute_script("arguments[0].focus();", bipd_dropdown)
-            driver.execute_script("arguments[0].click();", bipd_dropdown)
-            time.sleep(1)
-            
-            # Use JavaScript to set the value and trigger change events
-            driver.execute_script("""
-                var select = arguments[0];
-                select.value = arguments[1];
-                select.dispatchEvent(new Event('change', { bubbles: true }));
-                select.dispatchEvent(new Event('input', { bubbles: true }));
-                select.dispatchEvent(new Event('blur', { bubbles: true }));
-            """, bipd_dropdown, bipd_value)
-            
-            print(f"Selected bodily injury and property damage: {request.bodily_injury_property_damage} (value: {bipd_value})")
-            
-            # Verify selection
-            selected_value = bipd_dropdown.get_attribute('value')
-            print(f"Verified selected value: {selected_value}")
-            
-            # Wait a moment for the selection to register
-            time.sleep(2)
-            
-            print(f"After bodily injury and property damage selection - Title: {driver.title}")
-            print(f"After bodily injury and property damage selection - URL: {driver.current_url}")
-            
-        except TimeoutException:
-            print("Could not find bodily injury and property damage liability dropdown")
-            raise HTTPException(
-                status_code=404,
-                detail="Bodily injury and property damage liability dropdown not found"
-            )
-        
-        # -------------------------------------------------------------------------
-        # STEP 37: Select second option (No Coverage) from uninsured/underinsured motorist dropdown
-        # -------------------------------------------------------------------------
-        
-        print("Looking for uninsured/underinsured motorist coverage dropdown...")
-        print("Selecting second option: No Coverage")
-        
-        try:
-            # Find the UM/UIM dropdown by its data-pgr-id attribute
-            umuim_dropdown = extended_wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "select[data-pgr-id='ddlUMUIMLineCoverageLimit']"))
-            )
-            print("Found uninsured/underinsured motorist coverage dropdown")
-            
-            # Scroll to the dropdown with extra offset to avoid sticky headers
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", umuim_dropdown)
-            time.sleep(1)
-            
-            # Use JavaScript click to avoid interception by sticky headers
-            driver.execute_script("arguments[0].focus();", umuim_dropdown)
-            driver.execute_script("arguments[0].click();", umuim_dropdown)
-            time.sleep(1)
-            
-            # Select the second option by index (No Coverage - index 1)
-            umuim_select = Select(umuim_dropdown)
-            umuim_select.select_by_index(1)
-            
-            print("Selected second option: No Coverage")
-            
-            # Verify selection
-            selected_value = umuim_dropdown.get_attribute('value')
-            print(f"Verified selected value: {selected_value}")
-            
-            # Wait a moment for the selection to register
-            time.sleep(2)
+            with no_implicit_wait(driver):
+                continue_button = extended_wait.until(
+                    EC.element_to_be_clickable(CONTINUE_BUTTON_LOCATOR)
+                )
+            logger.info("Found 'Continue' button")
             
-            print(f"After UM/UIM selection - Title: {driver.title}")
-            print(f"After UM/UIM selection - URL: {driver.current_url}")
+            # Scroll to, focus and click it in one call (JavaScript click avoids interception by sticky headers)
+            scroll_and_click(driver, continue_button)
+            logger.info("Clicked 'Continue' button")
             
         except TimeoutException:
-            print("Could not find uninsured/underinsured motorist coverage dropdown")
+            logger.warning("Could not find 'Continue' button after driver acknowledgment")
+            raise HTTPException(
+                status_code=404,
+                detail="Continue button not found after driver acknowledgment"
+            )
+        
+        # Wait for the coverage page to load with all five coverage dropdowns in one poll
+        # (instead of one wait per dropdown in STEPs 33-37); a page that never loads fails the run as a timeout
+        def coverage_dropdowns_rendered(d):
+            return d.execute_script(
+                "return document.querySelectorAll(arguments[0]).length;", COVERAGE_DROPDOWNS_SELECTOR
+            ) == len(COVERAGE_DROPDOWN_PGR_IDS)
+        
+        wait_until_ready(driver, coverage_dropdowns_rendered, timeout=30, raise_on_timeout=True)
+        
+        log_nav(driver, "After Continue click")
+        
+        # -------------------------------------------------------------------------
+        # STEPS 33-37: Set all coverage dropdowns in a single script call
+        # (comprehensive, medical payments, collision, BI/PD, and UM/UIM -> second option "No Coverage")
+        # -------------------------------------------------------------------------
+        
+        logger.info("Setting coverage dropdowns...")
+        logger.info(f"Comprehensive deductible to select: {request.comprehensive_deductible}")
+        logger.info(f"Medical payment coverage to select: {request.medical_payment_coverage}")
+        logger.info(f"Collision deductible to select: {request.collision_deductible}")
+        logger.info(f"Bodily injury and property damage to select: {request.bodily_injury_property_damage}")
+        logger.info("UM/UIM: selecting second option (No Coverage)")
+        
+        comp_deductible_value = COMP_DEDUCTIBLE_MAP.get(comp_deductible_upper)
+        medpay_value = MEDPAY_MAP.get(medpay_upper)
+        collision_value = COLLISION_MAP.get(collision_upper)
+        bipd_value = BIPD_MAP.get(bipd_upper)
+        
+        # None selects the second option by index instead of by value
+        coverage_selections = [
+            ["ddlCOMPLineCoverageLimit", comp_deductible_value],
+            ["ddlMEDPAYLineCoverageLimit", medpay_value],
+            ["ddlCOLLLineCoverageLimit", collision_value],
+            ["ddlBIPDLineCoverageLimit", bipd_value],
+            ["ddlUMUIMLineCoverageLimit", None]
+        ]
+        
+        # Dropdowns were already waited for together after STEP 32; check all are present before
+        # changing any, then set each value, dispatch change events and read the values back
+        coverage_result = driver.execute_script("""
+            var selects = {};
+            for (var i = 0; i < arguments[0].length; i++) {
+                var pgrId = arguments[0][i][0];
+                var select = document.querySelector("select[data-pgr-id='" + pgrId + "']");
+                if (!select) {
+                    return {missing: pgrId};
+                }
+                selects[pgrId] = select;
+            }
+            var values = {};
+            arguments[0].forEach(function(selection) {
+                var select = selects[selection[0]];
+                if (selection[1] === null) {
+                    select.selectedIndex = 1;
+                } else {
+                    select.value = selection[1];
+                }
+                ['change', 'input', 'blur'].forEach(function(eventType) {
+                    select.dispatchEvent(new Event(eventType, { bubbles: true }));
+                });
+                values[selection[0]] = select.value;
+            });
+            return {values: values};
+        """, coverage_selections)
+        
+        if coverage_result.get("missing"):
+            dropdown_name = COVERAGE_DROPDOWN_PGR_IDS[coverage_result["missing"]]
+            logger.warning(f"Could not find {dropdown_name.lower()} dropdown")
             raise HTTPException(
                 status_code=404,
-                detail="Uninsured/underinsured motorist coverage dropdown not found"
+                detail=f"{dropdown_name} dropdown not found"
             )
         
+        # Verify selections (values read back by the same script call)
+        for pgr_id, expected_value in coverage_selections:
+            selected_value = coverage_result["values"].get(pgr_id)
+            logger.info(f"{COVERAGE_DROPDOWN_PGR_IDS[pgr_id]}: selected value {selected_value}")
+            if expected_value is not None and selected_value != expected_value:
+                logger.warning(f"⚠️ {COVERAGE_DROPDOWN_PGR_IDS[pgr_id]} reports {selected_value}, expected {expected_value}")
+        
+        # Wait for Angular to commit all five selections instead of a fixed delay
+        def coverage_committed(d):
+            return selects_committed(d, coverage_selections)
+        
+        wait_until_ready(driver, coverage_committed, timeout=SELECTION_SETTLE_SECONDS)
+        
+        log_nav(driver, "After coverage selections")
+        
         # -------------------------------------------------------------------------
         # STEP 38: Click "Continue" button after coverage selections
         # -------------------------------------------------------------------------
         
-        print("Looking for Continue button after coverage selections...")
+        logger.info("Looking for Continue button after coverage selections...")
         
         try:
             # Find the Continue button by its data-pgr-id attribute
-            continue_button = extended_wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-pgr-id='btnContinue']"))
-            )
-            print("Found Continue button")
-            
-            # Scroll to the button with extra offset to avoid sticky headers
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", continue_button)
-            time.sleep(1)
-            
-            # Click the Continue button using JavaScript to avoid interception
-            driver.execute_script("arguments[0].click();", continue_button)
-            print("Clicked Continue button")
-            
-            # Wait for page to load after clicking Continue
-            time.sleep(3)
+            with no_implicit_wait(driver):
+                continue_button = extended_wait.until(
+                    EC.element_to_be_clickable(CONTINUE_BUTTON_LOCATOR)
+                )
+            logger.info("Found Continue button")
             
-            print(f"After Continue click - Title: {driver.title}")
-            print(f"After Continue click - URL: {driver.current_url}")
+            # Scroll to, focus and click it in one call (JavaScript click avoids interception by sticky headers)
+            scroll_and_click(driver, continue_button)
+            logger.info("Clicked Continue button")
             
         except TimeoutException:
-            print("Could not find Continue button after coverage selections")
+            logger.warning("Could not find Continue button after coverage selections")
             raise HTTPException(
                 status_code=404,
                 detail="Continue button not found after coverage selections"
             )
         
+        # Wait for the review page; a Continue that never navigates fails the run as a timeout
+        # instead of turning into "Not found" scrapes
+        wait_until_ready(driver, REVIEW_MESSAGE_LOCATOR, raise_on_timeout=True)
+        
+        log_nav(driver, "After Continue click")
+        
         # -------------------------------------------------------------------------
         # STEP 39: Scrape final page data (Replace vehicle, Premium details)
         # -------------------------------------------------------------------------
         
-        print("Scraping final page data...")
+        logger.info("Scraping final page data...")
         
         try:
-            # Wait for the final review page to fully load
-            time.sleep(3)
-            
-            # Scrape Replace Vehicle field
-            replace_vehicle_text = ""
+            # Wait once for the premium summary to render; the remaining fields arrive with it
             try:
-                replace_vehicle_element = extended_wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "#transaction-messaging ps-markdown"))
-                )
-                replace_vehicle_text = replace_vehicle_element.text.strip()
-                print(f"Replace vehicle: {replace_vehicle_text}")
+                with no_implicit_wait(driver):
+                    extended_wait.until(EC.presence_of_element_located(NEW_PREMIUM_LOCATOR))
             except TimeoutException:
-                print("Could not find replace vehicle field")
-                replace_vehicle_text = "Not found"
+                logger.warning("Premium summary did not render - missing fields will be reported as not found")
             
-            # Scrape Total Premium Increase
-            total_premium_increase = ""
-            try:
-                # Find h4 element containing "Total premium increase:"
-                premium_increase_elements = driver.find_elements(By.CSS_SELECTOR, "h4.f5-e.fwi.ma0")
-                for element in premium_increase_elements:
-                    if "Total premium increase:" in element.text:
-                        # Extract just the amount (e.g., "$792.52")
-                        total_premium_increase = element.text.replace("Total premium increase:", "").strip()
-                        print(f"Total premium increase: {total_premium_increase}")
-                        break
-                if not total_premium_increase:
-                    total_premium_increase = "Not found"
-            except Exception as e:
-                print(f"Could not find total premium increase: {str(e)}")
-                total_premium_increase = "Not found"
-            
-            # Scrape New Policy Premium
-            new_policy_premium = ""
-            try:
-                new_premium_element = extended_wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "li[data-pgr-id='txtNewPremium'] span.review-item-embed"))
-                )
-                new_policy_premium = new_premium_element.text.strip()
-                print(f"New policy premium: {new_policy_premium}")
-            except TimeoutException:
-                print("Could not find new policy premium field")
-                new_policy_premium = "Not found"
+            # Scrape every review field in one round-trip
+            # (STEP 38 already waited for the review message to render)
+            review_fields = cdp_eval(driver, REVIEW_FIELDS_SCRIPT) or {}
             
-            # Scrape Policy Start Date
-            policy_start_date = ""
-            try:
-                start_date_element = extended_wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "li[data-pgr-id='txtStartsOn'] span"))
-                )
-                policy_start_date = start_date_element.text.strip()
-                print(f"Policy starts on: {policy_start_date}")
-            except TimeoutException:
-                print("Could not find policy start date field")
-                policy_start_date = "Not found"
+            replace_vehicle_text = review_fields.get("replace_vehicle") or "Not found"
+            total_premium_increase = review_fields.get("premium_increase") or "Not found"
+            new_policy_premium = review_fields.get("new_premium") or "Not found"
+            policy_start_date = review_fields.get("start_date") or "Not found"
+            new_premium_description = review_fields.get("description") or "Not found"
             
-            # Scrape New Premium Description
-            new_premium_description = ""
-            try:
-                premium_description_element = extended_wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "pui-p[data-pgr-id='msgInternalMessage0'] p"))
-                )
-                new_premium_description = premium_description_element.text.strip()
-                print(f"New premium description: {new_premium_description}")
-            except TimeoutException:
-                print("Could not find new premium description field")
-                new_premium_description = "Not found"
+            logger.info(f"Replace vehicle: {replace_vehicle_text}")
+            logger.info(f"Total premium increase: {total_premium_increase}")
+            logger.info(f"New policy premium: {new_policy_premium}")
+            logger.info(f"Policy starts on: {policy_start_date}")
+            logger.info(f"New premium description: {new_premium_description}")
             
-            print("=" * 60)
-            print("✅ Step 39 completed successfully!")
-            print(f"✅ Scraped all final page data")
-            print("=" * 60)
+            logger.debug("=" * 60)
+            logger.info("✅ Step 39 completed successfully!")
+            logger.info(f"✅ Scraped all final page data")
+            logger.debug("=" * 60)
             
         except Exception as e:
-            print(f"Error scraping final page data: {str(e)}")
+            logger.error(f"Error scraping final page data: {str(e)}")
             raise HTTPException(
                 status_code=500,
                 detail=f"Error scraping final page data: {str(e)}"
@@ -4569,116 +4819,69 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         payment_schedule = []
         installment_fee_note = "Not found"
         
-        print("Looking for 'View upcoming payments' link...")
+        logger.info("Looking for 'View upcoming payments' link...")
         
         try:
             # Find and click the "View upcoming payments" link
             view_payments_link = extended_wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//span[contains(text(), 'View upcoming payments')]"))
+                lambda d: find_element_by_text(d, "span", VIEW_PAYMENTS_LINK_TEXT)
             )
-            print("Found 'View upcoming payments' link")
-            
-            # Scroll to the link
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", view_payments_link)
-            time.sleep(1)
-            
-            # Click the link using JavaScript
-            driver.execute_script("arguments[0].click();", view_payments_link)
-            print("Clicked 'View upcoming payments' link")
+            logger.info("Found 'View upcoming payments' link")
             
-            # Wait for the popup/modal to appear
-            time.sleep(2)
+            # Scroll to and click the link in one call
+            scroll_and_click(driver, view_payments_link)
+            logger.info("Clicked 'View upcoming payments' link")
             
             # Wait for the payment schedule table to be visible
-            payment_table = extended_wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "table[data-pgr-id='tblPaymentSchedule']"))
+            extended_wait.until(
+                EC.presence_of_element_located(PAYMENT_SCHEDULE_TABLE_LOCATOR)
             )
-            print("Payment schedule table loaded")
+            logger.info("Payment schedule table loaded")
             
             # Scrape the payment schedule table rows
-            payment_schedule = []
-            table_rows = driver.find_elements(By.CSS_SELECTOR, "table[data-pgr-id='tblPaymentSchedule'] tbody tr")
-            
-            print(f"Found {len(table_rows)} payment schedule rows")
-            
-            for index, row in enumerate(table_rows):
-                try:
-                    # Extract all td elements from the row
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    
-                    if len(cells) >= 4:
-                        # Extract date (from the span inside first td)
-                        date_element = cells[0].find_element(By.TAG_NAME, "span")
-                        date = date_element.text.strip()
-                        
-                        # Extract current amount
-                        current_amount = cells[1].text.strip()
-                        
-                        # Extract new amount
-                        new_amount = cells[2].text.strip()
-                        
-                        # Extract difference
-                        difference = cells[3].text.strip()
-                        
-                        payment_schedule.append({
-                            "date": date,
-                            "current_amount": current_amount,
-                            "new_amount": new_amount,
-                            "difference": difference
-                        })
-                        
-                        print(f"Row {index + 1}: {date} | Current: {current_amount} | New: {new_amount} | Diff: {difference}")
-                        
-                except Exception as e:
-                    print(f"Error parsing row {index + 1}: {str(e)}")
-                    continue
+            payment_schedule = scrape_payment_schedule_rows(driver)
             
             # Scrape the installment fee note
             installment_fee_note = ""
             try:
-                fee_note_element = driver.find_element(By.CSS_SELECTOR, "pui-p[data-pgr-id='ttlServiceChargeDescription'] p")
+                fee_note_element = driver.find_element(*INSTALLMENT_FEE_NOTE_LOCATOR)
                 installment_fee_note = fee_note_element.text.strip()
-                print(f"Installment fee note: {installment_fee_note}")
+                logger.info(f"Installment fee note: {installment_fee_note}")
             except Exception as e:
-                print(f"Could not find installment fee note: {str(e)}")
+                logger.warning(f"Could not find installment fee note: {str(e)}")
                 installment_fee_note = "Not found"
             
-            # Close the payment schedule popup
+            # Close the payment schedule popup (click and wait for it to disappear in one call)
             try:
-                close_button = driver.find_element(By.CSS_SELECTOR, "button[aria-label='Close Modal']")
-                print("Found close button for payment schedule popup")
-                
-                # Click the close button using JavaScript
-                driver.execute_script("arguments[0].click();", close_button)
-                print("Clicked close button - popup closed")
-                
-                # Wait for popup to close
-                time.sleep(1)
+                if close_modal(driver, PAYMENT_SCHEDULE_TABLE_SELECTOR):
+                    logger.info("Clicked close button - popup closed")
+                else:
+                    logger.warning("⚠️ Clicked close button but popup is still visible")
                 
             except Exception as e:
-                print(f"Could not find or click close button: {str(e)}")
+                logger.warning(f"Could not find or click close button: {str(e)}")
             
-            print("=" * 60)
-            print("✅ Step 40 completed successfully!")
-            print(f"✅ Scraped {len(payment_schedule)} payment schedule entries")
-            print("=" * 60)
+            logger.debug("=" * 60)
+            logger.info("✅ Step 40 completed successfully!")
+            logger.info(f"✅ Scraped {len(payment_schedule)} payment schedule entries")
+            logger.debug("=" * 60)
             
         except TimeoutException:
-            print("⚠️ Could not find 'View upcoming payments' link or payment schedule table - skipping this step")
+            logger.warning("⚠️ Could not find 'View upcoming payments' link or payment schedule table - skipping this step")
             # Set empty payment schedule and continue
             payment_schedule = []
             installment_fee_note = "Not found"
-            print("=" * 60)
-            print("⚠️ Step 40 skipped - payment schedule not available")
-            print("=" * 60)
+            logger.debug("=" * 60)
+            logger.warning("⚠️ Step 40 skipped - payment schedule not available")
+            logger.debug("=" * 60)
         except Exception as e:
-            print(f"⚠️ Error scraping payment schedule: {str(e)} - skipping this step")
+            logger.warning(f"⚠️ Error scraping payment schedule: {str(e)} - skipping this step")
             # Set empty payment schedule and continue
             payment_schedule = []
             installment_fee_note = "Not found"
-            print("=" * 60)
-            print("⚠️ Step 40 skipped - payment schedule not available")
-            print("=" * 60)
+            logger.debug("=" * 60)
+            logger.warning("⚠️ Step 40 skipped - payment schedule not available")
+            logger.debug("=" * 60)
         
         # -------------------------------------------------------------------------
         # STEP 41: Click "effect on rate for the entire policy period" link and scrape coverage comparison data
@@ -4691,31 +4894,24 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
             "vehicle_details": []
         }
         
-        print("Looking for 'effect on rate for the entire policy period' link...")
+        logger.info("Looking for 'effect on rate for the entire policy period' link...")
         
         try:
             # Find and click the effect on rate link
             effect_on_rate_link = extended_wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//span[contains(text(), 'effect on rate for the entire policy period')]"))
+                lambda d: find_element_by_text(d, "span", EFFECT_ON_RATE_LINK_TEXT)
             )
-            print("Found 'effect on rate for the entire policy period' link")
-            
-            # Scroll to the link
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", effect_on_rate_link)
-            time.sleep(1)
+            logger.info("Found 'effect on rate for the entire policy period' link")
             
-            # Click the link using JavaScript
-            driver.execute_script("arguments[0].click();", effect_on_rate_link)
-            print("Clicked 'effect on rate for the entire policy period' link")
-            
-            # Wait for the modal to appear
-            time.sleep(2)
+            # Scroll to and click the link in one call
+            scroll_and_click(driver, effect_on_rate_link)
+            logger.info("Clicked 'effect on rate for the entire policy period' link")
             
             # Wait for the modal content to be visible
             extended_wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "pui-modal-body"))
+                EC.presence_of_element_located(MODAL_BODY_LOCATOR)
             )
-            print("Effect on rate modal loaded")
+            logger.info("Effect on rate modal loaded")
             
             # Initialize data structure for storing all scraped data
             effect_on_rate_data = {
@@ -4724,204 +4920,72 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
                 "vehicle_details": []
             }
             
-            # Scrape Vehicle Summary section (top section with vehicle totals)
-            print("Scraping vehicle summary section...")
-            try:
-                vehicle_summary_elements = driver.find_elements(By.XPATH, "//pui-h3[contains(text(), 'Vehicle')]/following-sibling::div//pui-p[@fw='7']")
-                
-                for vehicle_elem in vehicle_summary_elements:
-                    vehicle_name = vehicle_elem.text.strip()
-                    
-                    # Find the corresponding table for this vehicle
-                    parent_div = vehicle_elem.find_element(By.XPATH, "./ancestor::div[contains(@class, 'ng-star-inserted')]")
-                    table_rows = parent_div.find_elements(By.CSS_SELECTOR, "table tbody tr")
-                    
-                    if len(table_rows) > 0:
-                        cells = table_rows[0].find_elements(By.TAG_NAME, "td")
-                        if len(cells) >= 2:
-                            current_value = cells[0].text.strip()
-                            new_value = cells[1].text.strip()
-                            
-                            effect_on_rate_data["vehicle_summary"].append({
-                                "vehicle_name": vehicle_name,
-                                "current_rate": current_value,
-                                "new_rate": new_value
-                            })
-                            print(f"Vehicle: {vehicle_name} | Current: {current_value} | New: {new_value}")
-                            
-            except Exception as e:
-                print(f"Error scraping vehicle summary: {str(e)}")
-            
-            # Scrape Total Policy Rate section
-            print("Scraping total policy rate...")
-            try:
-                total_policy_elements = driver.find_elements(By.XPATH, "//pui-p[contains(text(), 'Total Policy Rate')]")
-                
-                if total_policy_elements:
-                    parent_div = total_policy_elements[0].find_element(By.XPATH, "./ancestor::div[contains(@class, 'ng-star-inserted')]")
-                    table_rows = parent_div.find_elements(By.CSS_SELECTOR, "table tbody tr")
-                    
-                    if len(table_rows) > 0:
-                        cells = table_rows[0].find_elements(By.TAG_NAME, "td")
-                        if len(cells) >= 2:
-                            current_value = cells[0].text.strip()
-                            new_value = cells[1].text.strip()
-                            
-                            effect_on_rate_data["total_policy_rate"] = {
-                                "current_rate": current_value,
-                                "new_rate": new_value
-                            }
-                            print(f"Total Policy Rate | Current: {current_value} | New: {new_value}")
-                            
-            except Exception as e:
-                print(f"Error scraping total policy rate: {str(e)}")
-            
-            # Scrape detailed vehicle breakdowns (after the hr separator)
-            print("Scraping detailed vehicle breakdowns...")
+            # Scrape vehicle summary, total policy rate and detailed vehicle breakdowns in one call
+            logger.info("Scraping effect on rate data...")
             try:
-                # Find all vehicle headers (h4 elements with vehicle names)
-                vehicle_headers = driver.find_elements(By.XPATH, "//pui-hr/following-sibling::pui-h4[@class='db f4 fw6 lh-title mv2 outline-0 pgr-dark-blue ng-star-inserted']")
-                
-                for vehicle_header in vehicle_headers:
-                    vehicle_name = vehicle_header.text.strip()
-                    print(f"Processing detailed breakdown for: {vehicle_name}")
-                    
-                    vehicle_data = {
-                        "vehicle_name": vehicle_name,
-                        "coverages": []
-                    }
-                    
-                    # Find all coverage sections for this vehicle
-                    # Look for pui-p elements with fw="7" that follow this h4
-                    current_element = vehicle_header
-                    
-                    while True:
-                        try:
-                            # Find the next sibling div
-                            next_sibling = current_element.find_element(By.XPATH, "./following-sibling::div[1]")
-                            
-                            # Check if this is another vehicle header (stop if so)
-                            try:
-                                next_header = next_sibling.find_element(By.XPATH, "./preceding-sibling::pui-h4[1]")
-                                if next_header != vehicle_header:
-                                    break
-                            except:
-                                pass
-                            
-                            # Try to find coverage name in this div
-                            try:
-                                coverage_name_elem = next_sibling.find_element(By.CSS_SELECTOR, "pui-p[fw='7'] p span")
-                                coverage_name = coverage_name_elem.text.strip()
-                                
-                                # Find the table in this div
-                                table = next_sibling.find_element(By.CSS_SELECTOR, "table")
-                                table_rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
-                                
-                                # Extract current and new values
-                                current_coverage = ""
-                                current_value = ""
-                                new_coverage = ""
-                                new_value = ""
-                                
-                                for row_index, row in enumerate(table_rows):
-                                    cells = row.find_elements(By.TAG_NAME, "td")
-                                    
-                                    if row_index == 0 and len(cells) >= 2:
-                                        # First row contains coverage details
-                                        current_coverage = cells[0].text.strip()
-                                        new_coverage = cells[1].text.strip()
-                                    elif row_index == 1 and len(cells) >= 2:
-                                        # Second row contains values
-                                        current_value = cells[0].text.strip()
-                                        new_value = cells[1].text.strip()
-                                
-                                vehicle_data["coverages"].append({
-                                    "coverage_name": coverage_name,
-                                    "current_coverage": current_coverage,
-                                    "current_value": current_value,
-                                    "new_coverage": new_coverage,
-                                    "new_value": new_value
-                                })
-                                
-                                print(f"  - {coverage_name}: Current ${current_value} -> New ${new_value}")
-                                
-                            except:
-                                pass
-                            
-                            current_element = next_sibling
-                            
-                        except:
-                            break
-                    
-                    effect_on_rate_data["vehicle_details"].append(vehicle_data)
-                    
+                effect_on_rate_data = scrape_effect_on_rate(driver)
             except Exception as e:
-                print(f"Error scraping vehicle details: {str(e)}")
+                logger.error(f"Error scraping effect on rate data: {str(e)}")
             
-            # Close the effect on rate modal
+            # Close the effect on rate modal (click and wait for it to disappear in one call)
             try:
-                close_button = driver.find_element(By.CSS_SELECTOR, "button[aria-label='Close Modal']")
-                print("Found close button for effect on rate modal")
-                
-                # Scroll to button
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", close_button)
-                time.sleep(1)
-                
-                # Click the close button using JavaScript
-                driver.execute_script("arguments[0].click();", close_button)
-                print("Clicked close button - effect on rate modal closed")
-                
-                # Wait for modal to close
-                time.sleep(1)
+                if close_modal(driver, MODAL_BODY_SELECTOR):
+                    logger.info("Clicked close button - effect on rate modal closed")
+                else:
+                    logger.warning("⚠️ Clicked close button but effect on rate modal is still visible")
                 
             except Exception as e:
-                print(f"Could not find or click close button: {str(e)}")
+                logger.warning(f"Could not find or click close button: {str(e)}")
             
-            print("=" * 60)
-            print("✅ Step 41 completed successfully!")
-            print(f"✅ Scraped effect on rate data for {len(effect_on_rate_data['vehicle_details'])} vehicles")
-            print("=" * 60)
+            logger.debug("=" * 60)
+            logger.info("✅ Step 41 completed successfully!")
+            logger.info(f"✅ Scraped effect on rate data for {len(effect_on_rate_data['vehicle_details'])} vehicles")
+            logger.debug("=" * 60)
             
         except TimeoutException:
-            print("⚠️ Could not find 'effect on rate for the entire policy period' link or modal - skipping this step")
-            print("=" * 60)
-            print("⚠️ Step 41 skipped - effect on rate data not available")
-            print("=" * 60)
+            logger.warning("⚠️ Could not find 'effect on rate for the entire policy period' link or modal - skipping this step")
+            logger.debug("=" * 60)
+            logger.warning("⚠️ Step 41 skipped - effect on rate data not available")
+            logger.debug("=" * 60)
         except Exception as e:
-            print(f"⚠️ Error scraping effect on rate data: {str(e)} - skipping this step")
-            print("=" * 60)
-            print("⚠️ Step 41 skipped - effect on rate data not available")
-            print("=" * 60)
+            logger.warning(f"⚠️ Error scraping effect on rate data: {str(e)} - skipping this step")
+            logger.debug("=" * 60)
+            logger.warning("⚠️ Step 41 skipped - effect on rate data not available")
+            logger.debug("=" * 60)
         
         # -------------------------------------------------------------------------
         # STEP 42: Click "Save this update for later" checkbox
         # -------------------------------------------------------------------------
         
-        print("Looking for 'Save this update for later' checkbox...")
+        logger.info("Looking for 'Save this update for later' checkbox...")
         
         try:
             # Find the checkbox/radio option for "Save this update for later"
             save_for_later_option = extended_wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//ps-markdown[@data-pgr-id='lblSavethisupdateforlater' or contains(text(), 'Save this update for later')]"))
+                EC.element_to_be_clickable(SAVE_FOR_LATER_OPTION_LOCATOR)
             )
-            print("Found 'Save this update for later' option")
+            logger.info("Found 'Save this update for later' option")
             
-            # Scroll to the option
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", save_for_later_option)
-            time.sleep(1)
+            # Scroll to and click the option in one call
+            scroll_and_click(driver, save_for_later_option)
+            logger.info("Clicked 'Save this update for later' option")
             
-            # Click the option using JavaScript
-            driver.execute_script("arguments[0].click();", save_for_later_option)
-            print("Clicked 'Save this update for later' option")
+            # Wait for the option's input to report checked before STEP 43 clicks Continue
+            # (the locator is the ps-markdown label, so read the input inside its <label>)
+            def save_for_later_checked(d):
+                return d.execute_script("""
+                    var markdown = document.querySelector(arguments[0]);
+                    var label = markdown && markdown.closest('label');
+                    var input = label && (label.querySelector('input') || (label.htmlFor && document.getElementById(label.htmlFor)));
+                    return !!input && input.checked;
+                """, SAVE_FOR_LATER_OPTION_LOCATOR[1])
             
-            # Wait for selection to register
-            time.sleep(2)
+            wait_until_ready(driver, save_for_later_checked, timeout=SELECTION_SETTLE_SECONDS)
             
-            print(f"After save for later selection - Title: {driver.title}")
-            print(f"After save for later selection - URL: {driver.current_url}")
+            log_nav(driver, "After save for later selection")
             
         except TimeoutException:
-            print("Could not find 'Save this update for later' option")
+            logger.warning("Could not find 'Save this update for later' option")
             raise HTTPException(
                 status_code=404,
                 detail="Save this update for later option not found"
@@ -4931,32 +4995,32 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         # STEP 43: Click final "Continue" button and wait for new page to load
         # -------------------------------------------------------------------------
         
-        print("Looking for final Continue button...")
+        logger.info("Looking for final Continue button...")
         
         try:
             # Find the Continue button by its data-pgr-id attribute
             continue_button = extended_wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-pgr-id='btnContinue']"))
+                EC.element_to_be_clickable(CONTINUE_BUTTON_LOCATOR)
             )
-            print("Found final Continue button")
+            logger.info("Found final Continue button")
             
-            # Scroll to the button with extra offset to avoid sticky headers
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", continue_button)
-            time.sleep(1)
+            # Scroll to and click the Continue button in one call (URL captured first to detect the page change)
+            pre_click_url = driver.current_url
+            scroll_and_click(driver, continue_button)
+            logger.info("Clicked final Continue button")
             
-            # Click the Continue button using JavaScript to avoid interception
-            driver.execute_script("arguments[0].click();", continue_button)
-            print("Clicked final Continue button")
+            # Wait for the new page to load (URL changes once the update is saved)
+            logger.info("Waiting for new page to load...")
             
-            # Wait 5 seconds for the new page to load
-            print("Waiting 5 seconds for new page to load...")
-            time.sleep(5)
+            def left_review_page(d):
+                return d.current_url != pre_click_url
+            
+            wait_until_ready(driver, left_review_page)
             
-            print(f"After final Continue click - Title: {driver.title}")
-            print(f"After final Continue click - URL: {driver.current_url}")
+            log_nav(driver, "After final Continue click")
             
         except TimeoutException:
-            print("Could not find final Continue button")
+            logger.warning("Could not find final Continue button")
             raise HTTPException(
                 status_code=404,
                 detail="Final Continue button not found"
@@ -4994,19 +5058,12 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         
         log_thread(thread_id, "📦 Preparing to send response to client...")
         
-        # Wait for Chrome to finish saving session data
-        # Chrome automatically saves to the thread's profile directory
-        if driver:
-            wait_for_session_save(driver)
-        
-        # Close browser before returning response to avoid hanging
+        # Return browser to the pool before returning response (closed after DRIVER_MAX_USES runs)
         if driver:
             try:
-                log_thread(thread_id, "🔧 Closing browser...")
-                driver.quit()
-                log_thread(thread_id, "✅ Browser closed successfully")
+                release_driver(driver, thread_id)
             except Exception as e:
-                log_thread(thread_id, f"⚠️  Warning: Error closing browser: {str(e)}")
+                log_thread(thread_id, f"⚠️  Warning: Error releasing browser: {str(e)}")
         
         log_thread(thread_id, "=" * 60)
         log_thread(thread_id, "✅ Sending response to client")
@@ -5017,73 +5074,6 @@ def run_automation_sync(request: PolicyRequest, thread_id: int):
         
         # Return scraped data
         return response_data
-        
-    except TimeoutException as e:
-        log_thread(thread_id, f"❌ TimeoutException: {str(e)}")
-        # Update thread status
-        with browser_threads_lock:
-            if thread_id in browser_threads:
-                browser_threads[thread_id]["status"] = "timeout_error"
-        if driver:
-            try:
-                save_session_to_base_profile(driver)
-            except:
-                pass
-            try:
-                driver.quit()
-            except:
-                pass
-        # Release thread ID for reuse
-        release_thread_id(thread_id)
-        raise HTTPException(
-            status_code=408,
-            detail=f"Timeout waiting for page elements: {str(e)}"
-        )
-        
-    except NoSuchElementException as e:
-        log_thread(thread_id, f"❌ NoSuchElementException: {str(e)}")
-        # Update thread status
-        with browser_threads_lock:
-            if thread_id in browser_threads:
-                browser_threads[thread_id]["status"] = "element_not_found_error"
-        if driver:
-            try:
-                save_session_to_base_profile(driver)
-            except:
-                pass
-            try:
-                driver.quit()
-            except:
-                pass
-        # Release thread ID for reuse
-        release_thread_id(thread_id)
-        raise HTTPException(
-            status_code=404,
-            detail=f"Required element not found: {str(e)}"
-        )
-        
-    except Exception as e:
-        log_thread(thread_id, f"❌ Exception occurred: {str(e)}")
-        # Update thread status
-        with browser_threads_lock:
-            if thread_id in browser_threads:
-                browser_threads[thread_id]["status"] = "error"
-                browser_threads[thread_id]["error"] = str(e)
-        if driver:
-            try:
-                save_session_to_base_profile(driver)
-            except:
-                pass
-            try:
-                driver.quit()
-            except:
-                pass
-        # Release thread ID for reuse
-        release_thread_id(thread_id)
-        raise HTTPException(
-            status_code=500,
-            detail=f"An error occurred: {str(e)}"
-        )
 
 
 @app.post("/start")
@@ -5098,6 +5088,9 @@ async def retrieve_policy(request: PolicyRequest):
     Returns:
         dict: Success response with automation results
     """
+    # Reject invalid payloads before reserving a thread ID or touching a browser
+    validate_request(request)
+    
     # Get unique thread ID for this browser instance
     thread_id = get_next_thread_id()
     
@@ -5144,166 +5137,236 @@ async def retrieve_policy(request: PolicyRequest):
         )
 
 
-@app.post("/otp")
-async def send_otp(request: dict):
+async def update_legacy_otp_storage(otp_code: str):
+    """
+    Store the latest OTP in the legacy global storage (read by GET /otp and /otp/status).
+    Async so BackgroundTasks runs it on the event loop instead of dispatching it to the threadpool.
+    
+    Args:
+        otp_code: The OTP code that was queued
+    """
+    otp_storage["otp"] = otp_code
+    otp_storage["timestamp"] = time.time()
+    # Expiry is precomputed so /otp/status is a single monotonic subtraction
+    otp_storage["expires_at"] = time.monotonic() + OTP_TTL_SECONDS
+
+
+async def log_otp_ignored(otp_code: str):
+    """
+    Log an OTP that arrived while no session was active (run after the /otp response is sent).
+    
+    Args:
+        otp_code: The OTP code that was ignored
+    """
+    logger.info("✅ OTP received via API: %s", otp_code)
+    logger.warning("⚠️  OTP IGNORED - No active sessions running (no process threads or Chrome sessions)")
+    logger.warning("   OTP will only be accepted when a session is actively running or waiting")
+
+
+async def log_otp_queued(otp_code: str, queue_size: int, waiting_threads: list):
+    """
+    Log an OTP that was added to the queue (run after the /otp response is sent).
+    
+    Args:
+        otp_code: The OTP code that was queued
+        queue_size: Number of OTPs in the queue right after this one was added
+        waiting_threads: Thread IDs that were waiting for an OTP, in FIFO order
+    """
+    logger.info("✅ OTP received via API: %s", otp_code)
+    logger.info("📬 OTP added to queue (queue size: %d)", queue_size)
+    # The waiting-thread list is only formatted when debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("📬 Waiting threads: %s", waiting_threads)
+        if waiting_threads:
+            logger.debug("📋 Next OTP will go to Thread-%s (FIFO order)", waiting_threads[0])
+
+
+@app.post("/otp", response_model=OtpResponse, response_model_exclude_none=True)
+async def send_otp(request: dict, background_tasks: BackgroundTasks):
     """
     API endpoint to receive OTP from external source (Twilio webhook or manual input)
     
     Args:
         request: Dictionary containing 'otp' field
+        background_tasks: Runs the legacy storage update and outcome logging after the response is sent
         
     Returns:
-        dict: Success response with OTP confirmation
+        OtpResponse: Success response with OTP confirmation
     """
-    print(f"📨 OTP endpoint hit at {time.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"📦 Request data: {request}")
+    logger.info(f"📨 OTP endpoint hit at {current_timestamp()}")
+    logger.info(f"📦 Request data: {request}")
     
-    try:
-        # Handle both JSON and form-encoded data
-        if isinstance(request, dict):
-            # JSON format (for manual testing)
-            otp_code = request.get('otp')
-        else:
-            # Form-encoded format (Twilio webhook)
-            form_data = request
-            sms_body = form_data.get('Body', '')
-            
-            print(f"📱 Received SMS body: {sms_body}")
-            
-            # Extract OTP from SMS body using regex
-            otp_match = re.search(r'(\d{6})', sms_body)  # Look for 6-digit code
-            if otp_match:
-                otp_code = otp_match.group(1)
-                print(f"🔍 Extracted OTP from SMS: {otp_code}")
-            else:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Could not extract OTP from SMS body"
-                )
+    # Handle both JSON and form-encoded data
+    if isinstance(request, dict):
+        # JSON format (for manual testing)
+        otp_code = request.get('otp')
+    else:
+        # Form-encoded format (Twilio webhook)
+        form_data = request
+        sms_body = form_data.get('Body', '')
         
-        if not otp_code:
+        logger.info(f"📱 Received SMS body: {sms_body}")
+        
+        # Extract OTP from SMS body using regex
+        otp_match = OTP_RE.search(sms_body)  # Look for 6-digit code
+        if otp_match:
+            otp_code = otp_match.group(1)
+            logger.info(f"🔍 Extracted OTP from SMS: {otp_code}")
+        else:
             raise HTTPException(
                 status_code=400,
-                detail="OTP code is required"
+                detail="Could not extract OTP from SMS body"
             )
-        
-        # Check if there are any active sessions (threads running or waiting)
-        # Active statuses indicate a session is running or will need OTP
-        active_statuses = ["initializing", "starting", "browser_initialized", "waiting_for_otp"]
-        active_threads = []
-        waiting_threads = []
-        
-        with browser_threads_lock:
-            for tid, info in browser_threads.items():
-                status = info.get("status", "")
-                if status in active_statuses:
-                    active_threads.append(tid)
-                    if status in ["waiting_for_otp", "browser_initialized"]:
-                        waiting_threads.append(tid)
-        
-        # Only add OTP to queue if there are active sessions
-        # Ignore OTPs that arrive when no session is running to prevent wrong OTPs being used later
-        if not active_threads:
-            print(f"✅ OTP received via API: {otp_code}")
-            print(f"⚠️  OTP IGNORED - No active sessions running (no process threads or Chrome sessions)")
-            print(f"   OTP will only be accepted when a session is actively running or waiting")
-            print(f"⏱️  OTP endpoint processing complete")
-            
-            # Return success response but don't add to queue
-            return {
-                "success": True,
-                "message": "OTP received but ignored - no active sessions",
-                "otp": otp_code,
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "ignored": True,
-                "reason": "No active browser sessions running"
-            }
-        
-        # Add OTP to queue for FIFO distribution to browsers
-        with otp_queue_lock:
-            otp_queue.put(str(otp_code))
-            queue_size = otp_queue.qsize()
-        
-        # Also store in legacy global storage for backward compatibility
-        otp_storage["otp"] = str(otp_code)
-        otp_storage["timestamp"] = time.time()
-        
-        # Return response immediately - don't wait for anything
-        response_data = {
-            "success": True,
-            "message": "OTP received successfully",
-            "otp": otp_code,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
-        
-        # Log after preparing response to minimize blocking
-        print(f"✅ OTP received via API: {otp_code}")
-        print(f"📬 OTP added to queue (queue size: {queue_size}, waiting threads: {waiting_threads})")
-        if waiting_threads:
-            print(f"📋 Next OTP will go to Thread-{waiting_threads[0]} (FIFO order)")
-        print(f"⏱️  OTP endpoint processing complete")
-        
-        # Return immediately - this endpoint should be fast
-        return response_data
-        
-    except Exception as e:
-        print(f"❌ Error in OTP endpoint: {e}")
+    
+    if not otp_code:
         raise HTTPException(
-            status_code=500,
-            detail=f"Error processing OTP: {str(e)}"
+            status_code=400,
+            detail="OTP code is required"
+        )
+    
+    # Check if there are any active sessions (threads running or waiting)
+    # Active statuses indicate a session is running or will need OTP
+    active_statuses = ["initializing", "starting", "browser_initialized", "waiting_for_otp"]
+    active_threads = []
+    waiting_threads = []
+    
+    with browser_threads_lock:
+        for tid, info in browser_threads.items():
+            status = info.get("status", "")
+            if status in active_statuses:
+                active_threads.append(tid)
+                if status in ["waiting_for_otp", "browser_initialized"]:
+                    waiting_threads.append(tid)
+    
+    # Only add OTP to queue if there are active sessions
+    # Ignore OTPs that arrive when no session is running to prevent wrong OTPs being used later
+    if not active_threads:
+        background_tasks.add_task(log_otp_ignored, str(otp_code))
+        
+        # Return success response but don't add to queue
+        return OtpResponse(
+            message="OTP received but ignored - no active sessions",
+            otp=str(otp_code),
+            timestamp=current_timestamp(),
+            ignored=True,
+            reason="No active browser sessions running"
         )
+    
+    # Add OTP to queue for FIFO distribution to browsers and wake the waiting threads
+    with otp_condition:
+        otp_deque.append(str(otp_code))
+        queue_size = len(otp_deque)
+        otp_condition.notify_all()
+    
+    # Also store in legacy global storage for backward compatibility (after the response is sent)
+    background_tasks.add_task(update_legacy_otp_storage, str(otp_code))
+    
+    # Return response immediately - don't wait for anything
+    response_data = OtpResponse(
+        message="OTP received successfully",
+        otp=str(otp_code),
+        timestamp=current_timestamp()
+    )
+    
+    # Log after the response is sent
+    background_tasks.add_task(log_otp_queued, str(otp_code), queue_size, waiting_threads)
+    
+    # Return immediately - this endpoint should be fast
+    return response_data
 
 
 @app.get("/otp/status")
-async def otp_status():
+async def otp_status(request: Request, response: Response):
     """
     Check if OTP is waiting
     
+    Args:
+        request: Incoming request (read for If-None-Match)
+        response: Outgoing response (receives the ETag header)
+    
     Returns:
-        dict: OTP status information
+        dict: OTP status information, or an empty 304 if the client's ETag still matches
+        
+    Note:
+        The body only depends on whether an OTP is stored, its age and its whole seconds left,
+        so the ETag is built from those and repeated polls within a second get a 304.
     """
-    try:
-        if otp_storage["otp"] is not None:
-            age = time.time() - otp_storage["timestamp"]
-            return {
-                "waiting": True,
-                "age_seconds": int(age),
-                "expires_in": int(300 - age) if age < 300 else 0
-            }
-        else:
-            return {"waiting": False}
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error checking OTP status: {str(e)}"
-        )
+    if otp_storage["otp"] is not None:
+        age_seconds = int(time.time() - otp_storage["timestamp"])
+        remaining = max(0, int(otp_storage["expires_at"] - time.monotonic()))
+        etag = f'W/"{age_seconds}-{remaining}"'
+    else:
+        remaining = None
+        etag = 'W/"none"'
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    response.headers["ETag"] = etag
+    if remaining is not None:
+        return {
+            "waiting": True,
+            "age_seconds": age_seconds,
+            "expires_in": remaining
+        }
+    else:
+        return {"waiting": False}
 
 
 if __name__ == "__main__":
     import uvicorn
     import sys
     
+    # Make every event loop created from here on libuv-backed, not just the one uvicorn starts.
+    # uvloop ships with uvicorn[standard]; a missing install should fail here, not degrade silently
+    import uvloop
+    uvloop.install()
+    
     # Railway automatically sets PORT env variable (typically 8080)
     # Default to 8080 for Railway compatibility, but allow override
     port = int(os.environ.get('PORT', 8080))
     
-    print("=" * 60)
-    print("🚀 Progressive Driver Add/Update Bot - Starting Up")
-    print("=" * 60)
-    print(f"📡 Port: {port}")
-    print(f"🌐 Host: 0.0.0.0")
-    print(f"🐍 Python: {sys.version}")
-    print(f"📁 Working Directory: {os.getcwd()}")
-    print(f"💡 Local URL: http://localhost:{port}")
-    print(f"💡 Health Check: http://localhost:{port}/health")
-    print(f"💡 API Endpoint: http://localhost:{port}/start")
-    print("=" * 60)
+    # OTP queue, legacy otp_storage, driver pool and thread registry all live in this process,
+    # so more than one worker splits them apart - only raise WEB_CONCURRENCY once they are shared
+    workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+    
+    python_version = sys.version
+    working_dir = os.getcwd()
+    
+    # Build the whole banner and write it once instead of one print (lock + flush) per line
+    banner = [
+        BANNER_SEPARATOR,
+        "🚀 Progressive Driver Add/Update Bot - Starting Up",
+        BANNER_SEPARATOR,
+        f"📡 Port: {port}",
+        "🌐 Host: 0.0.0.0",
+        f"👷 Workers: {workers}",
+    ]
+    if workers > 1:
+        banner.append("⚠️  WEB_CONCURRENCY > 1: OTP state is per-process, an OTP may reach a worker with no waiting session")
+    banner += [
+        f"🐍 Python: {python_version}",
+        f"📁 Working Directory: {working_dir}",
+        f"💡 Local URL: http://localhost:{port}",
+        f"💡 Health Check: http://localhost:{port}/health",
+        f"💡 API Endpoint: http://localhost:{port}/start",
+        BANNER_SEPARATOR,
+    ]
+    sys.stdout.write("\n".join(banner) + "\n")
+    sys.stdout.flush()
     
     try:
         uvicorn.run(
-            app, 
+            # Workers need an import string; a single process reuses this module so it is not imported twice
+            "main:app" if workers > 1 else app,
             host="0.0.0.0", 
             port=port,
+            workers=workers,
+            loop="uvloop",  # libuv event loop (shipped with uvicorn[standard])
+            http="httptools",  # C HTTP parser instead of pure-Python h11
+            timeout_keep_alive=30,  # Let /otp/status pollers reuse their connection between polls
+            limit_concurrency=1000,  # Answer 503 past this instead of queueing onto a starved threadpool
+            backlog=2048,
             log_level="info",
             access_log=False  # Disabled - we use custom middleware logging instead
         )